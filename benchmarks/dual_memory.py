@@ -0,0 +1,77 @@
+# benchmarks/dual_memory.py
+"""
+Measures the memory used by each Dual instance, the memory of a list of Dual instances
+compared with an array of the DUAL_DTYPE structured dtype, and the throughput of chains of
+multiplications ``x*y``, the allocation-bound inner loop of forward-mode code.
+
+Run from the root of the repository with:
+    python benchmarks/dual_memory.py
+"""
+
+#Importing dependencies
+import argparse
+import timeit
+import tracemalloc
+
+from dual_autodiff import Dual, DUAL_DTYPE
+
+def bytes_per_instance(n):
+    """
+    Returns the number of bytes allocated per Dual instance when n instances are alive.
+    """
+    tracemalloc.start()
+    start,_=tracemalloc.get_traced_memory()
+    duals=[Dual(float(i),1.0) for i in range(n)]
+    end,_=tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    #the list and the floats are not part of the instances
+    floats=[float(i) for i in range(n)]
+    tracemalloc.start()
+    start_floats,_=tracemalloc.get_traced_memory()
+    copies=[float(i)+0.5 for i in floats]
+    end_floats,_=tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del duals,copies
+    return ((end-start)-(end_floats-start_floats))/n
+
+def bytes_per_list_element(n):
+    """
+    Returns the number of bytes allocated per element of a list of n Dual instances, including their parts and the list.
+    """
+    tracemalloc.start()
+    start,_=tracemalloc.get_traced_memory()
+    duals=[Dual(float(i)+0.5,float(i)+0.25) for i in range(n)]
+    end,_=tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del duals
+    return (end-start)/n
+
+def multiplication_chain(length):
+    """
+    Multiplies a dual number by another one `length` times.
+    """
+    x=Dual(1.0000001,1.0)
+    y=Dual(0.9999999,0.5)
+    for _ in range(length):
+        x=x*y
+    return x
+
+def main():
+    parser=argparse.ArgumentParser(description=__doc__,formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--instances",type=int,default=100000)
+    parser.add_argument("--length",type=int,default=10000)
+    parser.add_argument("--repeat",type=int,default=5)
+    args=parser.parse_args()
+
+    print("Bytes per Dual instance: %.1f" % bytes_per_instance(args.instances))
+    print("Bytes per element of a list of Dual: %.1f, of a DUAL_DTYPE array: %d" % (
+        bytes_per_list_element(args.instances),DUAL_DTYPE.itemsize))
+    timer=timeit.Timer(lambda: multiplication_chain(args.length))
+    best=min(timer.repeat(repeat=args.repeat,number=10))/10
+    print("x*y chain of %d multiplications: %.3e s (%.1f ns per multiplication)" % (args.length,best,1e9*best/args.length))
+    timer=timeit.Timer(lambda: Dual(1.5,2.5))
+    best=min(timer.repeat(repeat=args.repeat,number=100000))/100000
+    print("Dual(real, dual) construction: %.1f ns" % (1e9*best))
+
+if __name__=="__main__":
+    main()
@@ -0,0 +1,68 @@
+# benchmarks/error_path.py
+"""
+Measures the cost of an operation of the Dual class outside of its domain (a division
+by a dual number with a zero real part) under each error policy, compared with the same
+operation inside its domain.
+
+The "raise" policy is measured with the warning handled by a logging handler writing
+to memory (the cost of formatting and handler dispatch), and with the warnings of the
+package filtered out by the level of its logger.
+
+Run from the root of the repository with:
+    python benchmarks/error_path.py
+"""
+
+#Importing dependencies
+import argparse
+import io
+import logging
+import timeit
+
+import dual_autodiff
+from dual_autodiff import Dual, error_policy
+
+x=Dual(2.0,1.0)
+zero=Dual(0.0,1.0)
+one=Dual(1.0,1.0)
+
+def divide_and_catch(y):
+    """
+    Divides x by y, catching the ZeroDivisionError of the "raise" policy as a batch job would.
+    """
+    try:
+        return x/y
+    except ZeroDivisionError:
+        return None
+
+def best(function,repeat,number):
+    """
+    Returns the best time of one call of the function in nanoseconds.
+    """
+    return 1e9*min(timeit.Timer(function).repeat(repeat=repeat,number=number))/number
+
+def main():
+    parser=argparse.ArgumentParser(description=__doc__,formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number",type=int,default=100000)
+    parser.add_argument("--repeat",type=int,default=5)
+    args=parser.parse_args()
+
+    logger=logging.getLogger("dual_autodiff")
+    handler=logging.StreamHandler(io.StringIO())
+    handler.setFormatter(logging.Formatter("%(asctime)s %(name)s %(levelname)s: %(message)s"))
+    logger.addHandler(handler)
+    logger.propagate=False
+
+    print("Backend: %s" % dual_autodiff.BACKEND)
+    print("x/y inside the domain:                  %8.1f ns" % best(lambda: divide_and_catch(one),args.repeat,args.number))
+    with error_policy("raise"):
+        print("x/0 'raise', warning handled:           %8.1f ns" % best(lambda: divide_and_catch(zero),args.repeat,args.number))
+        logger.setLevel(logging.ERROR)
+        print("x/0 'raise', warning filtered out:      %8.1f ns" % best(lambda: divide_and_catch(zero),args.repeat,args.number))
+        logger.setLevel(logging.NOTSET)
+    with error_policy("nan"):
+        print("x/0 'nan':                              %8.1f ns" % best(lambda: divide_and_catch(zero),args.repeat,args.number))
+    with error_policy("count"):
+        print("x/0 'count':                            %8.1f ns" % best(lambda: divide_and_catch(zero),args.repeat,args.number))
+
+if __name__=="__main__":
+    main()
@@ -0,0 +1,71 @@
+# benchmarks/inplace_memory.py
+"""
+Measures the peak memory and the time of an accumulation loop over large arrays of dual numbers,
+written with new arrays at each step and with the in-place operators and the out= parameters.
+
+Run from the root of the repository with:
+    python benchmarks/inplace_memory.py --points 1000000 --steps 20
+"""
+
+#Importing dependencies
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+
+from dual_autodiff import DualArray
+
+def allocating(x,steps):
+    """
+    Accumulates sin(x*k)*x+exp(-x) over the steps, allocating new arrays for every result.
+    """
+    acc=DualArray(np.zeros(x.shape),0.0)
+    for k in range(1,steps+1):
+        acc=acc+(x*(k/steps)).sin()*x+(-x).exp()
+    return acc
+
+def in_place(x,steps):
+    """
+    Accumulates the same sum into preallocated buffers, with the in-place operators and the out= parameters.
+    """
+    acc=DualArray(np.zeros(x.shape),0.0)
+    buffer=DualArray(np.empty(x.shape),0.0)
+    for k in range(1,steps+1):
+        buffer[...]=x
+        buffer*=k/steps
+        buffer.sin(out=buffer)
+        buffer*=x
+        acc+=buffer
+        buffer[...]=x
+        buffer*=-1
+        buffer.exp(out=buffer)
+        acc+=buffer
+    return acc
+
+def _measure(run):
+    tracemalloc.start()
+    start=time.perf_counter()
+    result=run()
+    elapsed=time.perf_counter()-start
+    _,peak=tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed,peak,result
+
+def main():
+    parser=argparse.ArgumentParser(description=__doc__,formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--points",type=int,default=1000000)
+    parser.add_argument("--steps",type=int,default=20)
+    args=parser.parse_args()
+
+    x=DualArray(np.linspace(0.5,5.0,args.points),1.0)
+    print("input: %.1f MB" % ((x.real.nbytes+x.dual.nbytes)/1e6))
+    results=[]
+    for name,run in (("new arrays",allocating),("in place",in_place)):
+        elapsed,peak,result=_measure(lambda: run(x,args.steps))
+        results.append(result)
+        print("%-10s %8.3f s  peak memory %8.1f MB" % (name,elapsed,peak/1e6))
+    assert np.allclose(results[0].real,results[1].real) and np.allclose(results[0].dual,results[1].dual)
+
+if __name__=="__main__":
+    main()
@@ -0,0 +1,60 @@
+# benchmarks/parallel_scaling.py
+"""
+Measures the scaling of parallel_derivative with the number of worker processes,
+on an expensive function of one dual number evaluated at many independent points,
+and the size of a pickled Dual compared with the default pickling of a slots class.
+
+Run from the root of the repository with:
+    python benchmarks/parallel_scaling.py --points 100000 --workers 4
+"""
+
+#Importing dependencies
+import argparse
+import os
+import pickle
+import time
+
+import numpy as np
+
+from dual_autodiff import Dual, parallel_derivative
+
+def expensive(x):
+    """
+    A function of one dual number costing about fifty elementary operations.
+    """
+    y=x
+    for i in range(10):
+        y=(y.sin()+x).cos()*x+(x.square()+1.0).log()
+    return y
+
+class _SlotsDual:
+    """
+    A slots class with the two parts of a dual number and the default pickling, for comparison.
+    """
+    __slots__=("real","dual")
+
+    def __init__(self,real,dual):
+        self.real=real
+        self.dual=dual
+
+def main():
+    parser=argparse.ArgumentParser(description=__doc__,formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--points",type=int,default=100000)
+    parser.add_argument("--workers",type=int,default=os.cpu_count() or 1,help="largest number of worker processes")
+    args=parser.parse_args()
+
+    print("pickled Dual: %d bytes, default pickling of a slots class: %d bytes" % (
+        len(pickle.dumps(Dual(1.5,2.0))),len(pickle.dumps(_SlotsDual(1.5,2.0)))))
+    print("CPU count: %s" % os.cpu_count())
+    points=np.linspace(0.5,5.0,args.points)
+    reference=None
+    for workers in range(1,args.workers+1):
+        start=time.perf_counter()
+        values,derivatives=parallel_derivative(expensive,points,workers=workers)
+        elapsed=time.perf_counter()-start
+        if reference is None:
+            reference=elapsed
+        print("%2d worker(s): %8.3f s  speedup x%.2f  %.0f points/s" % (workers,elapsed,reference/elapsed,args.points/elapsed))
+
+if __name__=="__main__":
+    main()
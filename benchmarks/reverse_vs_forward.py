@@ -0,0 +1,77 @@
+# benchmarks/reverse_vs_forward.py
+"""
+Compares the cost of the gradient of a scalar function of n inputs computed with
+forward-mode Dual (n passes), MultiDual (one pass) and the reverse-mode Tape (one
+forward and one backward sweep), and reports the input dimension from which the
+reverse mode is faster than forward-mode Dual.
+
+Run from the root of the repository with:
+    python benchmarks/reverse_vs_forward.py
+"""
+
+#Importing dependencies
+import argparse
+import timeit
+
+from dual_autodiff import Dual, MultiDual
+from dual_autodiff.reverse import gradient
+
+def loss(*x):
+    """
+    A scalar loss function of n inputs using the primitives known to Dual and to the tape.
+    """
+    total=x[0].square()
+    for a,b in zip(x[:-1],x[1:]):
+        total=total+(a*b).sin()+(b.exp()/(a.square()+1.0)).log()
+    return total
+
+def forward_dual(x):
+    """
+    Gradient with n forward passes of the Dual class.
+    """
+    n=len(x)
+    return [loss(*[Dual(v,1.0 if i==j else 0.0) for j,v in enumerate(x)]).dual for i in range(n)]
+
+def forward_multi(x):
+    """
+    Gradient with one forward pass of the MultiDual class.
+    """
+    return loss(*MultiDual.variables(x)).dual
+
+def reverse(x):
+    """
+    Gradient with one forward and one backward sweep of the tape.
+    """
+    return gradient(loss,x)[1]
+
+def best_time(func,x,repeat):
+    """
+    Returns the best time of a few runs of func(x), in seconds.
+    """
+    timer=timeit.Timer(lambda: func(x))
+    number,_=timer.autorange()
+    return min(timer.repeat(repeat=repeat,number=number))/number
+
+def main():
+    parser=argparse.ArgumentParser(description=__doc__,formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes",type=int,nargs="+",default=[1,2,4,8,16,32,64,128,256])
+    parser.add_argument("--repeat",type=int,default=3)
+    args=parser.parse_args()
+
+    print("%6s %14s %14s %14s" % ("n","Dual (s)","MultiDual (s)","Tape (s)"))
+    crossover=None
+    for n in args.sizes:
+        x=[0.1+0.01*i for i in range(n)]
+        t_dual=best_time(forward_dual,x,args.repeat)
+        t_multi=best_time(forward_multi,x,args.repeat)
+        t_tape=best_time(reverse,x,args.repeat)
+        print("%6d %14.3e %14.3e %14.3e" % (n,t_dual,t_multi,t_tape))
+        if crossover is None and t_tape<t_dual:
+            crossover=n
+    if crossover is None:
+        print("The tape was not faster than forward-mode Dual for the sizes tested.")
+    else:
+        print("The tape is faster than forward-mode Dual from n =",crossover)
+
+if __name__=="__main__":
+    main()
@@ -0,0 +1,59 @@
+# benchmarks/service_throughput.py
+"""
+Measures the throughput and the mean answer time of DerivativeService for many concurrent single-point requests,
+for several batch sizes, compared with one Dual evaluation per request.
+
+Run from the root of the repository with:
+    python benchmarks/service_throughput.py --requests 20000
+"""
+
+#Importing dependencies
+import argparse
+import asyncio
+import time
+
+import numpy as np
+
+from dual_autodiff import Dual, DerivativeService
+
+def f(x):
+    """
+    A model costing about fifty elementary operations per point.
+    """
+    y=x
+    for i in range(10):
+        y=(y.sin()+x).cos()*x+(x*x+1.0).log()
+    return y
+
+async def _per_request(x):
+    y=f(Dual(x,1.0))
+    return y.real,y.dual
+
+async def _run(request,points):
+    """
+    Sends one request per point at once, and returns the total time and the mean time for a request to be answered.
+    """
+    latencies=[]
+    async def timed(x):
+        await request(x)
+        latencies.append(time.perf_counter()-start)
+    start=time.perf_counter()
+    await asyncio.gather(*(timed(x) for x in points))
+    return time.perf_counter()-start,float(np.mean(latencies))
+
+def main():
+    parser=argparse.ArgumentParser(description=__doc__,formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests",type=int,default=20000)
+    parser.add_argument("--delay",type=float,default=0.001,help="max_delay of the service in seconds")
+    args=parser.parse_args()
+
+    points=np.linspace(0.5,5.0,args.requests).tolist()
+    elapsed,latency=asyncio.run(_run(_per_request,points))
+    print("%-18s %8.3f s  %9.0f requests/s  mean answer time %8.2f ms" % ("Dual per request",elapsed,args.requests/elapsed,1e3*latency))
+    for max_batch in (16,256,4096):
+        service=DerivativeService(f,max_batch=max_batch,max_delay=args.delay)
+        elapsed,latency=asyncio.run(_run(service.derivative,points))
+        print("%-18s %8.3f s  %9.0f requests/s  mean answer time %8.2f ms" % ("batch of %d" % max_batch,elapsed,args.requests/elapsed,1e3*latency))
+
+if __name__=="__main__":
+    main()
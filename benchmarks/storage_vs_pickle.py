@@ -0,0 +1,61 @@
+# benchmarks/storage_vs_pickle.py
+"""
+Compares the time and the file size of saving and loading a dataset of dual numbers with save_duals
+and load_duals (plain, compressed and memory-mapped) against pickling a list of Dual instances.
+
+Run from the root of the repository with:
+    python benchmarks/storage_vs_pickle.py --values 10000000
+"""
+
+#Importing dependencies
+import argparse
+import os
+import pickle
+import tempfile
+import time
+
+import numpy as np
+
+from dual_autodiff import Dual, DualArray, save_duals, load_duals
+
+def _time(run):
+    start=time.perf_counter()
+    result=run()
+    return time.perf_counter()-start,result
+
+def _report(name,path,save,load):
+    save_time,_=_time(save)
+    load_time,_=_time(load)
+    print("%-22s save %8.3f s  load %8.3f s  %10.1f MB" % (name,save_time,load_time,os.path.getsize(path)/1e6))
+
+def _pickle_save(path,x):
+    with open(path,"wb") as file:
+        pickle.dump(x,file,protocol=pickle.HIGHEST_PROTOCOL)
+
+def _pickle_load(path):
+    with open(path,"rb") as file:
+        return pickle.load(file)
+
+def main():
+    parser=argparse.ArgumentParser(description=__doc__,formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--values",type=int,default=10000000,help="number of dual numbers")
+    parser.add_argument("--chunk",type=int,default=1000000,help="chunk size of the chunked files")
+    args=parser.parse_args()
+
+    #Smooth data compresses a little, as the results of a sweep would
+    x=DualArray(np.linspace(0.0,1.0,args.values),np.cos(np.linspace(0.0,10.0,args.values)))
+    duals=x.to_duals()
+    with tempfile.TemporaryDirectory() as directory:
+        path=os.path.join(directory,"data")
+        _report("pickle list of Dual",path,lambda: _pickle_save(path,duals),lambda: _pickle_load(path))
+        _report("pickle DualArray",path,lambda: _pickle_save(path,x),lambda: _pickle_load(path))
+        _report("save_duals",path,lambda: save_duals(path,x),lambda: load_duals(path))
+        _report("save_duals chunked",path,lambda: save_duals(path,x,chunk_size=args.chunk),lambda: load_duals(path))
+        _report("save_duals zlib",path,lambda: save_duals(path,x,chunk_size=args.chunk,compress=True,level=1),lambda: load_duals(path))
+        save_duals(path,x)
+        load_time,y=_time(lambda: load_duals(path,mmap_mode="r"))
+        sum_time,_=_time(lambda: float(y.dual.sum()))
+        print("%-22s open %8.3f s  first full pass %8.3f s" % ("load_duals memory-map",load_time,sum_time))
+
+if __name__=="__main__":
+    main()
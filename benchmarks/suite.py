@@ -0,0 +1,237 @@
+# benchmarks/suite.py
+"""
+Benchmark suite of the package, replacing the %timeit cells of docs/dual_autodiff.ipynb.
+
+It times every operator and elementary function of the Dual class, the composite
+expressions of the notebook (the 10,000-iteration y*x loop and the 1000-iteration
+f(x,y) function), the scalar and batched evaluation of a function over a grid of
+points, and measures the memory used per dual number. The results are written as
+JSON, and two result files can be compared to flag the benchmarks that became
+slower than a threshold.
+
+Run from the root of the repository with:
+    python benchmarks/suite.py run --output results.json
+    python benchmarks/suite.py compare baseline.json results.json --threshold 0.1
+"""
+
+#Importing dependencies
+import argparse
+import json
+import operator
+import platform
+import re
+import sys
+import time
+import timeit
+import tracemalloc
+
+import numpy as np
+
+import dual_autodiff
+from dual_autodiff import Dual, DualArray
+from dual_memory import bytes_per_instance
+
+#The dual numbers of the notebook, with float parts
+x=Dual(1.0,0.0)
+y=Dual(3.1,100.0)
+#A dual number inside of the domain of every elementary function, as arcsin and arccos need a real part in (-1, 1)
+u=Dual(0.3,1.0)
+#Neutral operands for the in-place operators, which modify their left operand at each call
+one=Dual(1.0,0.0)
+zero=Dual(0.0,0.0)
+
+def f(x,y):
+    """
+    The function of the notebook, computing 1000 times sin(cos(x))+log(exp(y)).
+    """
+    list=[]
+    for i in range(1000):
+        list.append((x.cos()).sin()+(y.exp()).log())
+    return x
+
+def f1(x):
+    """
+    The function of the tutorial notebook.
+    """
+    return (x.cos()).sin()+x.log()
+
+def operator_cases():
+    """
+    Returns the benchmarks of the operators of the Dual class, as a dict of names and functions without arguments.
+    """
+    acc=Dual(2.0,1.0)
+    return {
+        "operator.add": lambda: x+y,
+        "operator.radd": lambda: 5+x,
+        "operator.sub": lambda: x-y,
+        "operator.rsub": lambda: 5-x,
+        "operator.mul": lambda: x*y,
+        "operator.rmul": lambda: 5*x,
+        "operator.truediv": lambda: x/y,
+        "operator.rtruediv": lambda: 5/y,
+        "operator.floordiv": lambda: x//y,
+        "operator.rfloordiv": lambda: 5//y,
+        "operator.mod": lambda: x%y,
+        "operator.rmod": lambda: 5%y,
+        "operator.pow": lambda: x**2,
+        "operator.pow5": lambda: x**5,
+        "operator.neg": lambda: -y,
+        "operator.abs": lambda: abs(y),
+        "operator.eq": lambda: x==y,
+        "operator.ne": lambda: x!=y,
+        "operator.gt": lambda: x>0.5,
+        "operator.ge": lambda: x>=0.5,
+        "operator.lt": lambda: x<0.5,
+        "operator.le": lambda: x<=0.5,
+        "operator.iadd": lambda: operator.iadd(acc,zero),
+        "operator.isub": lambda: operator.isub(acc,zero),
+        "operator.imul": lambda: operator.imul(acc,one),
+        "operator.itruediv": lambda: operator.itruediv(acc,one),
+        "operator.ifloordiv": lambda: operator.ifloordiv(acc,one),
+        "operator.imod": lambda: operator.imod(acc,Dual(1e9,0.0)),
+        "operator.ipow": lambda: operator.ipow(acc,1),
+    }
+
+def function_cases():
+    """
+    Returns the benchmarks of the elementary functions of the Dual class.
+    """
+    return {
+        "function."+name: (lambda method=operator.methodcaller(name),operand=u if name in ("arcsin","arccos") else y: method(operand))
+        for name in ["sin","cos","tan","log","exp","square","floor","ceil","inverse","sqrt","cbrt","sinh","cosh","tanh",
+                     "arcsin","arccos","arctan","log1p","expm1","log2","log10","erf","sigmoid","softplus"]
+    }
+
+def composite_cases():
+    """
+    Returns the benchmarks of the composite expressions of the notebook.
+    """
+    return {
+        "composite.loop_y_times_x": lambda: [y*x for i in range(10000)],
+        "composite.f_x_y": lambda: f(x,y),
+        "composite.f1": lambda: f1(Dual(4.5,1.0)),
+    }
+
+def batched_cases(points):
+    """
+    Returns the benchmarks of the derivative of f1 over a grid of points, one Dual at a time, with DualArray and with a compiled kernel.
+    """
+    grid=np.linspace(0.5,5.0,points)
+    kernel=dual_autodiff.compile(f1)
+    kernel(grid)
+    return {
+        "batched.scalar_loop": lambda: [f1(Dual(float(p),1.0)).dual for p in grid],
+        "batched.dual_array": lambda: f1(DualArray(grid,1.0)).dual,
+        "batched.compiled": lambda: kernel(grid),
+    }
+
+def bytes_per_element(n):
+    """
+    Returns the number of bytes allocated per element by the result of an operation on a DualArray of n elements.
+    """
+    a=DualArray(np.linspace(0.0,1.0,n),1.0)
+    tracemalloc.start()
+    start,_=tracemalloc.get_traced_memory()
+    b=a+1.0
+    end,_=tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del b
+    return (end-start)/n
+
+def time_case(function,repeat,budget):
+    """
+    Times a benchmark with timeit, choosing the number of calls per repetition so that one repetition lasts about `budget` seconds.
+
+    Returns:
+        Dict: the best and median time per call in seconds, and the number of calls per repetition.
+    """
+    timer=timeit.Timer(function)
+    number,elapsed=timer.autorange()
+    number=max(1,int(number*budget/max(elapsed,1e-9)))
+    times=sorted(t/number for t in timer.repeat(repeat=repeat,number=number))
+    return {"unit": "s","best": times[0],"median": times[len(times)//2],"number": number}
+
+def run(args):
+    """
+    Runs the benchmarks whose names match the filter and writes the results as JSON.
+    """
+    cases={}
+    cases.update(operator_cases())
+    cases.update(function_cases())
+    cases.update(composite_cases())
+    cases.update(batched_cases(args.points))
+    pattern=re.compile(args.filter)
+    results={}
+    for name,function in cases.items():
+        if pattern.search(name):
+            results[name]=time_case(function,args.repeat,args.budget)
+            print("%-36s %.3e s" % (name,results[name]["best"]))
+    memory={
+        "memory.dual_bytes": bytes_per_instance,
+        "memory.dual_array_bytes_per_element": bytes_per_element,
+    }
+    for name,function in memory.items():
+        if pattern.search(name):
+            value=function(args.instances)
+            results[name]={"unit": "bytes","best": value,"median": value,"number": args.instances}
+            print("%-36s %.1f bytes" % (name,value))
+    report={
+        "meta": {
+            "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "backend": dual_autodiff.BACKEND,
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output,"w") as file:
+            json.dump(report,file,indent=2,sort_keys=True)
+    return 0
+
+def compare(args):
+    """
+    Compares two result files and flags the benchmarks whose best time or memory grew by more than the threshold.
+
+    Returns:
+        Int: 1 if there is a regression, 0 otherwise, to be used as the exit code of the script.
+    """
+    with open(args.baseline) as file:
+        baseline=json.load(file)["results"]
+    with open(args.current) as file:
+        current=json.load(file)["results"]
+    regressions=0
+    for name in sorted(set(baseline)&set(current)):
+        ratio=current[name]["best"]/baseline[name]["best"] if baseline[name]["best"] else 1.0
+        flag=""
+        if ratio>1+args.threshold:
+            flag="REGRESSION"
+            regressions+=1
+        elif ratio<1-args.threshold:
+            flag="improvement"
+        print("%-40s %10.3e -> %10.3e %s  x%.2f %s" % (name,baseline[name]["best"],current[name]["best"],current[name]["unit"],ratio,flag))
+    for name in sorted(set(baseline)^set(current)):
+        print("%-40s only in %s" % (name,"the baseline" if name in baseline else "the current run"))
+    print("%d regression(s) beyond %.0f%%" % (regressions,100*args.threshold))
+    return 1 if regressions else 0
+
+def main():
+    parser=argparse.ArgumentParser(description=__doc__,formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands=parser.add_subparsers(dest="command",required=True)
+    parser_run=commands.add_parser("run",help="run the benchmarks")
+    parser_run.add_argument("--output",help="JSON file of the results")
+    parser_run.add_argument("--filter",default="",help="regular expression selecting the benchmarks by name")
+    parser_run.add_argument("--repeat",type=int,default=5)
+    parser_run.add_argument("--budget",type=float,default=0.05,help="duration of one repetition in seconds")
+    parser_run.add_argument("--points",type=int,default=10000,help="number of points of the batched benchmarks")
+    parser_run.add_argument("--instances",type=int,default=100000,help="number of dual numbers of the memory benchmarks")
+    parser_compare=commands.add_parser("compare",help="compare two result files")
+    parser_compare.add_argument("baseline")
+    parser_compare.add_argument("current")
+    parser_compare.add_argument("--threshold",type=float,default=0.1,help="relative slowdown flagged as a regression")
+    args=parser.parse_args()
+    return run(args) if args.command=="run" else compare(args)
+
+if __name__=="__main__":
+    sys.exit(main())
@@ -0,0 +1,71 @@
+# benchmarks/thread_scaling.py
+"""
+Measures the throughput of threaded_derivative with the number of threads, on a large batch of points evaluated
+with the NumPy kernels of DualArray and with a compiled kernel, compared with calling Dual from a thread pool,
+which holds the GIL throughout and does not scale.
+
+Run from the root of the repository with:
+    python benchmarks/thread_scaling.py --points 2000000 --threads 4
+"""
+
+#Importing dependencies
+import argparse
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from dual_autodiff import Dual, compile, threaded_derivative
+
+def f(x):
+    """
+    A function of dual numbers costing about twenty elementary operations per point.
+    """
+    y=x
+    for i in range(4):
+        y=(y.sin()+x).cos()*x+(x*x+1.0).log()
+    return y
+
+def _dual_loop(points):
+    """
+    Evaluates f on the scalar Dual class at each point of a chunk.
+    """
+    return [f(Dual(p,1.0)) for p in points.tolist()]
+
+def _scalar(points,threads):
+    """
+    Evaluates f on the scalar Dual class in a pool of threads, one chunk per thread.
+    """
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(_dual_loop,np.array_split(points,threads)))
+
+def _time(run):
+    start=time.perf_counter()
+    run()
+    return time.perf_counter()-start
+
+def main():
+    parser=argparse.ArgumentParser(description=__doc__,formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--points",type=int,default=2000000)
+    parser.add_argument("--threads",type=int,default=os.cpu_count() or 1,help="largest number of threads")
+    args=parser.parse_args()
+
+    print("CPU count: %s" % os.cpu_count())
+    points=np.linspace(0.5,5.0,args.points)
+    compiled=compile(f)
+    #A small batch for the scalar Dual loop, which is much slower
+    scalar_points=points[:args.points//100]
+    for name,run in (("DualArray",lambda t: threaded_derivative(f,points,threads=t)),
+                     ("compiled",lambda t: threaded_derivative(compiled,points,threads=t)),
+                     ("Dual loop",lambda t: _scalar(scalar_points,t))):
+        size=len(scalar_points) if name=="Dual loop" else len(points)
+        reference=None
+        for threads in range(1,args.threads+1):
+            elapsed=_time(lambda: run(threads))
+            if reference is None:
+                reference=elapsed
+            print("%-9s %2d thread(s): %8.3f s  speedup x%.2f  %.0f points/s" % (name,threads,elapsed,reference/elapsed,size/elapsed))
+
+if __name__=="__main__":
+    main()
@@ -1 +1,17 @@
-from .dual import Dual
+from .dual import Dual, COMPILED
+from .errors import set_error_policy, get_error_policy, error_policy, error_counts, reset_error_counts
+from .dual_array import DualArray, DUAL_DTYPE
+from .multi_dual import MultiDual
+from .reverse import Tape
+from .jet import Jet
+from .drivers import jacobian, jvp, hessian, hvp
+from .sparse import sparse_jacobian, sparsity_pattern, color_columns, CSRMatrix
+from .compiler import compile
+from .memo import memoize
+from .parallel import parallel_derivative, threaded_derivative
+from .streaming import stream_derivative, reduce_derivative, StreamStatistics
+from .service import DerivativeService
+from .storage import save_duals, load_duals, DualWriter, DualReader
+
+#Name of the backend of the Dual class: "compiled" when the extension module built by setup.py is imported, "python" otherwise
+BACKEND="compiled" if COMPILED else "python"
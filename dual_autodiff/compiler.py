@@ -0,0 +1,712 @@
+# dual_autodiff/compiler.py
+
+#Importing dependencies
+import builtins
+import functools
+import logging
+import threading
+
+import numpy as np
+
+from .dual import Dual, _LN2, _LN10, _TWO_OVER_SQRT_PI
+from .dual_array import DualArray, _apply_ufunc, _domain_mask, _erf, _sigmoid
+from .errors import get_error_policy
+
+#Logger of the module
+logger=logging.getLogger(__name__)
+
+#Operations of the expression graph and the NumPy code computing them
+_TEMPLATES={
+    "add": "{0} + {1}",
+    "sub": "{0} - {1}",
+    "mul": "{0} * {1}",
+    "truediv": "{0} / {1}",
+    "floordiv": "{0} // {1}",
+    "mod": "{0} % {1}",
+    "pow": "{0} ** {1}",
+    "neg": "-{0}",
+    "abs": "np.abs({0})",
+    "sin": "np.sin({0})",
+    "cos": "np.cos({0})",
+    "tan": "np.tan({0})",
+    "log": "np.log({0})",
+    "exp": "np.exp({0})",
+    "square": "np.square({0})",
+    "floor": "np.floor({0})",
+    "ceil": "np.ceil({0})",
+    "inverse": "1 / {0}",
+    "sqrt": "np.sqrt({0})",
+    "cbrt": "np.cbrt({0})",
+    "sinh": "np.sinh({0})",
+    "cosh": "np.cosh({0})",
+    "tanh": "np.tanh({0})",
+    "arcsin": "np.arcsin({0})",
+    "arccos": "np.arccos({0})",
+    "arctan": "np.arctan({0})",
+    "log1p": "np.log1p({0})",
+    "expm1": "np.expm1({0})",
+    "log2": "np.log2({0})",
+    "log10": "np.log10({0})",
+    "erf": "_erf({0})",
+    "sigmoid": "_sigmoid(np.exp(-np.abs({0})), {0})",
+    "softplus": "np.maximum({0}, 0) + np.log1p(np.exp(-np.abs({0})))",
+    "arctan2": "np.arctan2({0}, {1})",
+    "hypot": "np.hypot({0}, {1})",
+}
+
+#Nodes that are not computed by the kernel (inputs, derivatives of the inputs and constants) and the prefix of their names
+_LEAVES={"input": "r","dinput": "d","const": "c"}
+
+#Checks of the domain errors of Dual and DualArray, and the code of the mask of the points outside of the domain
+_GUARDS={
+    "nonzero": ("{0} == 0","Division is not defined when the real part of the dual number (denominator) is zero"),
+    "log": ("{0} == 0","Logarithm of dual number not defined when real part is zero"),
+    "inverse": ("{0} == 0","Cannot invert this dual number because its real part is nul"),
+    "tan": ("np.isclose({0}, 0)","Tan can't be defined for this function"),
+    "pow": ("({0} == 0) & ({1} < 0)","Negative power not defined when real part of dual number is zero"),
+    "pow_fraction": ("({0} == 0) & ({1} > 0) & ({1} < 1) & ({2} != 0)","Power lower than one not differentiable when real part of dual number is zero"),
+    "sqrt": ("{0} == 0","Square root of dual number not differentiable when real part is zero"),
+    "cbrt": ("{0} == 0","Cube root of dual number not differentiable when real part is zero"),
+    "arcsin": ("np.abs({0}) == 1","Arcsin of dual number not differentiable when real part is 1 or -1"),
+    "arccos": ("np.abs({0}) == 1","Arccos of dual number not differentiable when real part is 1 or -1"),
+    "log1p": ("{0} == -1","Log1p of dual number not defined when real part is -1"),
+    "arctan2": ("{0} * {0} + {1} * {1} == 0","Arctan2 of dual numbers not defined when both real parts are zero"),
+    "hypot": ("np.hypot({0}, {1}) == 0","Hypot of dual numbers not differentiable when both real parts are zero"),
+}
+
+#Elementary functions of one argument recorded by Tracer._function, and the key of their domain check in _GUARDS or None
+_FUNCTIONS={
+    "sqrt": "sqrt",
+    "cbrt": "cbrt",
+    "sinh": None,
+    "cosh": None,
+    "tanh": None,
+    "arcsin": "arcsin",
+    "arccos": "arccos",
+    "arctan": None,
+    "log1p": "log1p",
+    "expm1": None,
+    "log2": "log",
+    "log10": "log",
+    "erf": None,
+    "sigmoid": None,
+    "softplus": None,
+}
+
+class _Graph:
+    """
+    A class that stores an expression graph in which each distinct operation on the same arguments is recorded once.
+
+    Attributes:
+        nodes: list of the (operation, arguments) of each node, in the order of creation.
+        constants: list of the constants used by the graph.
+        guards: dictionary mapping a node to the domain checks to perform before computing it.
+    """
+    def __init__(self):
+        self.nodes=[]
+        self.constants=[]
+        self.guards={}
+        self._index={}
+
+    def emit(self,op,*args):
+        """
+        Records an operation, or returns the existing node if the same operation on the same arguments was already recorded.
+
+        Parameters:
+            op: the name of the operation.
+            args: the indices of the argument nodes.
+
+        Returns:
+            Int: the index of the node.
+        """
+        #commutative operations are recorded with sorted arguments, so that a*b and b*a share one node
+        if op in ("add","mul"):
+            args=tuple(sorted(args))
+        key=(op,)+args
+        index=self._index.get(key)
+        if index is None:
+            index=len(self.nodes)
+            self.nodes.append((op,args))
+            self._index[key]=index
+        return index
+
+    def constant(self,value):
+        """
+        Records a constant, scalar constants being shared by value.
+
+        Parameters:
+            value: the scalar or array constant.
+
+        Returns:
+            Int: the index of the node.
+        """
+        if np.ndim(value)==0:
+            key=("const",float(value))
+            value=float(value)
+        else:
+            value=np.asarray(value,dtype=np.float64)
+            key=("const",id(value))
+        index=self._index.get(key)
+        if index is None:
+            self.constants.append(value)
+            index=len(self.nodes)
+            self.nodes.append(("const",(len(self.constants)-1,)))
+            self._index[key]=index
+        return index
+
+    def guard(self,index,kind,*args):
+        """
+        Records a domain check to perform before computing a node.
+
+        Parameters:
+            index: the index of the node.
+            kind: the name of the check, a key of _GUARDS.
+            args: the indices of the nodes that are checked.
+        """
+        guards=self.guards.setdefault(index,[])
+        if (kind,args) not in guards:
+            guards.append((kind,args))
+
+class Tracer:
+    """
+    A class that stands for a dual number while a function is traced, and records the operations performed on it in an expression graph.
+
+    Tracers support the operators and functions of the Dual class. Comparisons are not supported, since the result of
+    a traced function cannot depend on the values of its inputs.
+
+    Attributes:
+        graph: the expression graph in which the operations are recorded.
+        index: the index of the node of the tracer in the graph.
+    """
+    __slots__=("graph","index")
+
+    def __init__(self,graph,index):
+        self.graph=graph
+        self.index=index
+
+    def __array_ufunc__(self,ufunc,method,*inputs,**kwargs):
+        """
+        Implements the NumPy ufunc protocol, so that traced functions can use ``np.sin(x)``, ``np.exp(x)``, etc.
+        """
+        if method!="__call__" or kwargs:
+            return NotImplemented
+        return _apply_ufunc(ufunc,inputs)
+
+    def _operand(self,x):
+        """
+        Returns the index of the node of an operand, recording constants in the graph.
+        """
+        if isinstance(x,Tracer):
+            return x.index
+        if isinstance(x,(Dual,DualArray)):
+            raise TypeError("Dual numbers cannot be used as constants of a compiled function")
+        return self.graph.constant(x)
+
+    def _binary(self,op,x,reverse=False):
+        """
+        Records a binary operation between the current tracer and an operand.
+        """
+        a,b=self.index,self._operand(x)
+        if reverse:
+            a,b=b,a
+        index=self.graph.emit(op,a,b)
+        if op in ("truediv","floordiv","mod"):
+            #constant denominators are also checked when the kernel is called, so that the error policy of the call applies
+            self.graph.guard(index,"nonzero",b)
+        elif op in ("arctan2","hypot"):
+            self.graph.guard(index,op,a,b)
+        return Tracer(self.graph,index)
+
+    def _unary(self,op):
+        """
+        Records an elementary function of the current tracer.
+        """
+        return Tracer(self.graph,self.graph.emit(op,self.index))
+
+    def __add__(self,x):
+        return self._binary("add",x)
+
+    def __radd__(self,x):
+        return self._binary("add",x,True)
+
+    def __sub__(self,x):
+        return self._binary("sub",x)
+
+    def __rsub__(self,x):
+        return self._binary("sub",x,True)
+
+    def __mul__(self,x):
+        return self._binary("mul",x)
+
+    def __rmul__(self,x):
+        return self._binary("mul",x,True)
+
+    def __truediv__(self,x):
+        return self._binary("truediv",x)
+
+    def __rtruediv__(self,x):
+        return self._binary("truediv",x,True)
+
+    def __floordiv__(self,x):
+        return self._binary("floordiv",x)
+
+    def __rfloordiv__(self,x):
+        return self._binary("floordiv",x,True)
+
+    def __mod__(self,x):
+        return self._binary("mod",x)
+
+    def __rmod__(self,x):
+        return self._binary("mod",x,True)
+
+    def __pow__(self,power):
+        """
+        Records the current tracer raised to a constant power.
+
+        Raises:
+            Warning: logging warning is triggered when the power is a dual number.
+            TypeError: if the power is a dual number.
+        """
+        if isinstance(power,(Tracer,Dual,DualArray)):
+            logger.warning("The power cant be a dual number")
+            raise TypeError
+        if np.all(np.asarray(power)==0):
+            return Tracer(self.graph,self.graph.constant(1.0))
+        p=self.graph.constant(power)
+        index=self.graph.emit("pow",self.index,p)
+        if np.any(np.asarray(power)<0):
+            self.graph.guard(index,"pow",self.index,p)
+        return Tracer(self.graph,index)
+
+    def __rpow__(self,x):
+        """
+        Raises:
+            Warning: logging warning is triggered to alert the user that the power cannot be a dual number.
+            TypeError: if the power is a dual number.
+        """
+        logger.warning("The power cannot be a dual number")
+        raise TypeError
+
+    def __neg__(self):
+        return self._unary("neg")
+
+    def __abs__(self):
+        return self._unary("abs")
+
+    def _compare(self,x):
+        """
+        Raises:
+            TypeError: comparisons cannot be traced.
+        """
+        raise TypeError("Comparisons of dual numbers cannot be compiled, as the compiled function cannot depend on the values of its inputs")
+
+    __eq__=__ne__=__gt__=__ge__=__lt__=__le__=_compare
+    __hash__=None
+
+    def sin(self):
+        return self._unary("sin")
+
+    def cos(self):
+        return self._unary("cos")
+
+    def tan(self):
+        #the cosine is recorded so that the check and the derivative share it
+        cos=self.graph.emit("cos",self.index)
+        index=self.graph.emit("tan",self.index)
+        self.graph.guard(index,"tan",cos)
+        return Tracer(self.graph,index)
+
+    def log(self):
+        index=self.graph.emit("log",self.index)
+        self.graph.guard(index,"log",self.index)
+        return Tracer(self.graph,index)
+
+    def exp(self):
+        return self._unary("exp")
+
+    def square(self):
+        return self._unary("square")
+
+    def floor(self):
+        return self._unary("floor")
+
+    def ceil(self):
+        return self._unary("ceil")
+
+    def inverse(self):
+        index=self.graph.emit("inverse",self.index)
+        self.graph.guard(index,"inverse",self.index)
+        return Tracer(self.graph,index)
+
+    def _function(self,op):
+        """
+        Records an elementary function of the current tracer with the domain check of _FUNCTIONS.
+        """
+        index=self.graph.emit(op,self.index)
+        if _FUNCTIONS[op] is not None:
+            self.graph.guard(index,_FUNCTIONS[op],self.index)
+        return Tracer(self.graph,index)
+
+    def sqrt(self):
+        return self._function("sqrt")
+
+    def cbrt(self):
+        return self._function("cbrt")
+
+    def sinh(self):
+        return self._function("sinh")
+
+    def cosh(self):
+        return self._function("cosh")
+
+    def tanh(self):
+        return self._function("tanh")
+
+    def arcsin(self):
+        return self._function("arcsin")
+
+    def arccos(self):
+        return self._function("arccos")
+
+    def arctan(self):
+        return self._function("arctan")
+
+    def log1p(self):
+        return self._function("log1p")
+
+    def expm1(self):
+        return self._function("expm1")
+
+    def log2(self):
+        return self._function("log2")
+
+    def log10(self):
+        return self._function("log10")
+
+    def erf(self):
+        return self._function("erf")
+
+    def sigmoid(self):
+        return self._function("sigmoid")
+
+    def softplus(self):
+        return self._function("softplus")
+
+    def arctan2(self,x):
+        return self._binary("arctan2",x)
+
+    def _rarctan2(self,y):
+        return self._binary("arctan2",y,True)
+
+    def hypot(self,x):
+        return self._binary("hypot",x)
+
+class _Tangents:
+    """
+    A class that records the derivative of each node of a graph in the same graph, following the rules of the Dual class.
+
+    A derivative of None stands for a derivative that is identically zero, so that no code is generated for it.
+    """
+    def __init__(self,graph):
+        self.g=graph
+
+    def add(self,a,b):
+        if a is None:
+            return b
+        if b is None:
+            return a
+        return self.g.emit("add",a,b)
+
+    def sub(self,a,b):
+        if b is None:
+            return a
+        if a is None:
+            return self.g.emit("neg",b)
+        return self.g.emit("sub",a,b)
+
+    def mul(self,a,b):
+        if a is None or b is None:
+            return None
+        return self.g.emit("mul",a,b)
+
+    def op(self,name,a,b):
+        if a is None:
+            return None
+        return self.g.emit(name,a,b)
+
+    def derivative(self,index,tangents):
+        """
+        Records the derivative of a node given the derivatives of its arguments.
+
+        Parameters:
+            index: the index of the node.
+            tangents: list of the indices of the derivatives of the previous nodes.
+
+        Returns:
+            Int: the index of the derivative of the node, or None if it is zero.
+        """
+        g=self.g
+        op,args=g.nodes[index]
+        if op in ("const","input","dinput"):
+            return None
+        a=args[0]
+        da=tangents[a]
+        if len(args)==2:
+            b=args[1]
+            db=tangents[b]
+        if op=="add":
+            return self.add(da,db)
+        if op=="sub":
+            return self.sub(da,db)
+        if op=="mul":
+            return self.add(self.mul(a,db),self.mul(da,b))
+        if op in ("truediv","floordiv","mod"):
+            #if the denominator is a constant, the Dual class divides the dual part directly
+            if db is None:
+                return self.op(op,da,b)
+            numerator=self.sub(self.mul(da,b),self.mul(a,db))
+            return g.emit(op,numerator,g.emit("square",b))
+        if op=="pow":
+            if da is None:
+                return None
+            p=g.constants[g.nodes[b][1][0]]
+            power=g.emit("pow",a,g.constant(p-1))
+            #the derivative v u^(v-1) du is infinite at u=0 for 0<v<1, which is checked before u^(v-1) is computed
+            if np.any((np.asarray(p)>0)&(np.asarray(p)<1)):
+                g.guard(power,"pow_fraction",a,b,da)
+            return g.emit("mul",g.emit("mul",b,power),da)
+        if op=="arctan2":
+            #d arctan2(a, b) = (b da - a db) / (a^2 + b^2)
+            numerator=self.sub(self.mul(b,da),self.mul(a,db))
+            if numerator is None:
+                return None
+            return g.emit("truediv",numerator,g.emit("add",g.emit("square",a),g.emit("square",b)))
+        if op=="hypot":
+            numerator=self.add(self.mul(a,da),self.mul(b,db))
+            if numerator is None:
+                return None
+            return g.emit("truediv",numerator,index)
+        if da is None:
+            return None
+        if op=="neg":
+            return g.emit("neg",da)
+        if op in ("abs","floor","ceil"):
+            return g.emit(op,da)
+        if op=="sin":
+            return g.emit("mul",g.emit("cos",a),da)
+        if op=="cos":
+            return g.emit("mul",g.emit("neg",g.emit("sin",a)),da)
+        if op=="tan":
+            return g.emit("truediv",da,g.emit("square",g.emit("cos",a)))
+        if op=="log":
+            return g.emit("truediv",da,a)
+        if op=="exp":
+            return g.emit("mul",index,da)
+        if op=="square":
+            return g.emit("mul",g.emit("mul",g.constant(2.0),a),da)
+        if op=="inverse":
+            return g.emit("neg",g.emit("truediv",da,g.emit("square",a)))
+        if op=="sqrt":
+            return g.emit("truediv",da,g.emit("mul",g.constant(2.0),index))
+        if op=="cbrt":
+            return g.emit("truediv",da,g.emit("mul",g.constant(3.0),g.emit("square",index)))
+        if op=="sinh":
+            return g.emit("mul",g.emit("cosh",a),da)
+        if op=="cosh":
+            return g.emit("mul",g.emit("sinh",a),da)
+        if op=="tanh":
+            return g.emit("mul",g.emit("sub",g.constant(1.0),g.emit("square",index)),da)
+        if op in ("arcsin","arccos"):
+            derivative=g.emit("truediv",da,g.emit("sqrt",g.emit("sub",g.constant(1.0),g.emit("square",a))))
+            return derivative if op=="arcsin" else g.emit("neg",derivative)
+        if op=="arctan":
+            return g.emit("truediv",da,g.emit("add",g.constant(1.0),g.emit("square",a)))
+        if op=="log1p":
+            return g.emit("truediv",da,g.emit("add",g.constant(1.0),a))
+        if op=="expm1":
+            return g.emit("mul",g.emit("add",index,g.constant(1.0)),da)
+        if op in ("log2","log10"):
+            return g.emit("truediv",da,g.emit("mul",a,g.constant(_LN2 if op=="log2" else _LN10)))
+        if op=="erf":
+            gaussian=g.emit("exp",g.emit("neg",g.emit("square",a)))
+            return g.emit("mul",g.emit("mul",g.constant(_TWO_OVER_SQRT_PI),gaussian),da)
+        if op=="sigmoid":
+            return g.emit("mul",g.emit("mul",index,g.emit("sub",g.constant(1.0),index)),da)
+        if op=="softplus":
+            return g.emit("mul",g.emit("sigmoid",a),da)
+        raise ValueError("No derivative rule for the operation "+op)
+
+class CompiledFunction:
+    """
+    A class that wraps a function of dual numbers compiled into a fused NumPy kernel by compile().
+
+    The function is traced once per number of arguments, the first time it is called with that number of arguments.
+    The tracing is done under a lock, and the kernels only use NumPy arrays local to the call, so a compiled function
+    can be called from several threads.
+    """
+    def __init__(self,f):
+        self.f=f
+        self._kernels={}
+        self._lock=threading.Lock()
+        functools.update_wrapper(self,f)
+
+    def _kernel(self,n):
+        """
+        Returns the kernel of the function for n arguments, tracing and compiling it if needed.
+        """
+        kernel=self._kernels.get(n)
+        if kernel is None:
+            with self._lock:
+                if n not in self._kernels:
+                    self._kernels[n]=_compile_kernel(self.f,n)
+                kernel=self._kernels[n]
+        return kernel
+
+    def source(self,n=1):
+        """
+        Returns the Python source code of the kernel generated for n arguments.
+
+        Parameters:
+            n: the number of arguments of the function.
+
+        Returns:
+            String: the source code of the kernel.
+        """
+        return self._kernel(n).source
+
+    def __call__(self,*args):
+        """
+        Evaluates the function and its derivative on whole arrays with the fused kernel.
+
+        Parameters:
+            args: the inputs of the function. A DualArray or Dual argument is differentiated along its dual part,
+                  and any other argument (scalar or array) is seeded with a dual part of one, as Dual(x, 1).
+
+        Returns:
+            Tuple: (value, derivative) arrays of the function. Under the "nan" and "count" error policies, both are NaN
+                   at the points where an operation was outside of its domain.
+        """
+        kernel=self._kernel(len(args))
+        parts=[]
+        for x in args:
+            if isinstance(x,(Dual,DualArray)):
+                parts+=[np.asarray(x.real,dtype=np.float64),np.asarray(x.dual,dtype=np.float64)]
+            else:
+                x=np.asarray(x,dtype=np.float64)
+                parts+=[x,np.ones_like(x)]
+        if get_error_policy()=="raise":
+            return kernel(*parts)
+        with np.errstate(divide="ignore",invalid="ignore",over="ignore"):
+            return kernel(*parts)
+
+def _guard(mask,message,bad):
+    """
+    Applies the error policy to a domain check of a compiled kernel, with the same warning and exception as DualArray.
+
+    Parameters:
+        mask: array of bools marking the points outside of the domain of the operation.
+        message: description of the domain error.
+        bad: the points outside of the domain of the previous operations, or None.
+
+    Returns:
+        Array of bools: the points outside of the domain of the operations checked so far, or None if there is none.
+    """
+    mask=_domain_mask(mask,message)
+    if mask is None:
+        return bad
+    return mask if bad is None else bad|mask
+
+def _compile_kernel(f,n):
+    """
+    Traces a function of n dual numbers and generates the NumPy kernel computing its value and derivative.
+
+    Parameters:
+        f: the function to compile.
+        n: the number of arguments of the function.
+
+    Returns:
+        Function: the kernel, taking the real and dual parts of each argument and returning (value, derivative).
+    """
+    graph=_Graph()
+    inputs=[graph.emit("input",i) for i in range(n)]
+    output=f(*[Tracer(graph,i) for i in inputs])
+    value=output.index if isinstance(output,Tracer) else graph.constant(output)
+    #derivatives of the nodes, the derivatives of the inputs being the inputs "dinput" of the kernel
+    tangents=[None]*len(graph.nodes)
+    for i in inputs:
+        tangents[i]=graph.emit("dinput",i)
+    rules=_Tangents(graph)
+    for i in range(value+1):
+        if i not in inputs:
+            tangents[i]=rules.derivative(i,tangents)
+        #the derivative rules record new nodes after the current one, whose derivatives are never needed
+        tangents+=[None]*(len(graph.nodes)-len(tangents))
+    tangent=tangents[value]
+
+    #nodes needed by the value and the derivative, and their names in the generated code
+    needed=set()
+    stack=[value]+([] if tangent is None else [tangent])
+    while stack:
+        i=stack.pop()
+        if i in needed:
+            continue
+        needed.add(i)
+        op,args=graph.nodes[i]
+        if op not in _LEAVES:
+            stack.extend(args)
+        for kind,guard_args in graph.guards.get(i,()):
+            stack.extend(guard_args)
+    names={}
+    for i in needed:
+        op,args=graph.nodes[i]
+        names[i]=_LEAVES[op]+str(args[0]) if op in _LEAVES else "t"+str(i)
+    lines=["def kernel("+", ".join("r%d, d%d" % (i,i) for i in range(n))+"):","    bad = None"]
+    for i in sorted(needed):
+        op,args=graph.nodes[i]
+        if op in _LEAVES:
+            continue
+        for kind,guard_args in graph.guards.get(i,()):
+            condition,message=_GUARDS[kind]
+            lines.append("    bad = _guard("+condition.format(*[names[a] for a in guard_args])+", "+repr(message)+", bad)")
+        lines.append("    "+names[i]+" = "+_TEMPLATES[op].format(*[names[a] for a in args]))
+    lines.append("    return _finish("+names[value]+", "+("None" if tangent is None else names[tangent])+", bad)")
+    source="\n".join(lines)+"\n"
+    namespace={"np":np,"_guard":_guard,"_finish":_finish,"_erf":_erf,"_sigmoid":_sigmoid}
+    namespace.update(("c"+str(i),c) for i,c in enumerate(graph.constants))
+    exec(builtins.compile(source,"<dual_autodiff.compile:"+getattr(f,"__name__","f")+">","exec"),namespace)
+    kernel=namespace["kernel"]
+    kernel.source=source
+    return kernel
+
+def _finish(value,derivative,bad):
+    """
+    Returns the value and derivative computed by a kernel as float64 arrays of the same shape, with NaN at the points outside of the domain.
+    """
+    value=np.asarray(value,dtype=np.float64)
+    if derivative is None:
+        derivative=np.zeros(value.shape)
+    derivative=np.asarray(derivative,dtype=np.float64)
+    if value.shape!=derivative.shape:
+        value,derivative=np.broadcast_arrays(value,derivative)
+    if bad is not None:
+        value=np.where(bad,np.nan,value)
+        derivative=np.where(bad,np.nan,derivative)
+    return value,derivative
+
+def compile(f):
+    """
+    Compiles a function of dual numbers into a fused NumPy kernel returning its value and derivative on whole arrays.
+
+    The function is run once on symbolic inputs (Tracer) which record its operations in an expression graph where
+    common subexpressions are shared, e.g. ``cos(x)`` is computed once for both ``sin(cos(x))`` and its derivative.
+    The derivative is then recorded in the same graph with the rules of the Dual class, and a single NumPy function is
+    generated for the graph. The function must only use the operators and functions of the Dual class (or the NumPy
+    ufuncs they support), and no comparisons or branches on the values of its inputs.
+
+    Parameters:
+        f: the function to compile, e.g. ``lambda x: x.cos().sin() + x.log()``.
+
+    Returns:
+        CompiledFunction: the compiled function, called with arrays and returning (value, derivative).
+    """
+    return CompiledFunction(f)
@@ -0,0 +1,240 @@
+# dual_autodiff/drivers.py
+
+#Importing dependencies
+import logging
+
+import numpy as np
+
+from .dual import Dual
+from .dual_array import DualArray
+from .jet import Jet
+from .reverse import Tape
+
+#Logger of the module
+logger=logging.getLogger(__name__)
+
+#Bytes taken by one seeded input in one direction: the real and dual float64 parts of a DualArray element,
+#and the three float64 coefficients of a jet of order 2
+_BYTES_PER_SEED=16
+_BYTES_PER_JET_SEED=24
+
+def jacobian(f,x,mode="auto",chunk_size=None,memory_budget=None):
+    """
+    Computes the Jacobian matrix of a function at a point.
+
+    In forward mode, each input is seeded with a DualArray holding one seed direction per element, so all the columns
+    of a chunk are computed with one vectorized evaluation of f. In reverse mode, f is recorded once on a Tape and each
+    row is computed with one backward sweep. The automatic mode records f on a Tape, and uses this recording for the
+    reverse mode when there are fewer outputs than inputs. It uses the forward mode otherwise, or when f uses an operation
+    that the Var class of the reverse mode does not support, such as sqrt or a variable power.
+
+    Parameters:
+        f: the function to differentiate, called with one argument per input and returning one output or a list of outputs.
+        x: the values of the inputs.
+        mode: "forward", "reverse" or "auto".
+        chunk_size: the largest number of columns computed by one evaluation in forward mode, all of them by default.
+        memory_budget: the largest number of bytes taken by the seeded inputs of one evaluation in forward mode, used when chunk_size is not given.
+
+    Returns:
+        Array: the gradient of shape (n,) if f returns one output, the Jacobian of shape (m, n) otherwise.
+
+    Raises:
+        Warning: logging warning is triggered when the mode is not supported.
+        ValueError: if the mode is not "forward", "reverse" or "auto".
+    """
+    x=_point(x)
+    if mode=="auto":
+        try:
+            recording=_record(f,x)
+        except (AttributeError,TypeError):
+            #an operation of f is not supported by Var
+            mode="forward"
+        else:
+            if len(recording[2])<len(x):
+                return _reverse_jacobian(*recording)
+            mode="forward"
+    if mode=="forward":
+        return _forward_jacobian(f,x,_chunk_size(len(x),len(x),chunk_size,memory_budget,_BYTES_PER_SEED))
+    if mode=="reverse":
+        return _reverse_jacobian(*_record(f,x))
+    logger.warning("The mode has to be 'forward', 'reverse' or 'auto'.")
+    raise ValueError
+
+def jvp(f,x,v):
+    """
+    Computes the Jacobian-vector product of a function, i.e. its derivative along one direction, with one evaluation of f on Dual inputs.
+
+    Parameters:
+        f: the function to differentiate, called with one argument per input and returning one output or a list of outputs.
+        x: the values of the inputs.
+        v: the direction, with one component per input.
+
+    Returns:
+        Tuple: (value, tangent) with the outputs of f and their derivatives along v, as floats for one output and arrays otherwise.
+    """
+    x=_point(x)
+    v=_point(v)
+    outputs,scalar=_outputs(f(*[Dual(a,b) for a,b in zip(x,v)]))
+    value=np.array([o.real if isinstance(o,Dual) else o for o in outputs],dtype=np.float64)
+    tangent=np.array([o.dual if isinstance(o,Dual) else 0.0 for o in outputs],dtype=np.float64)
+    if scalar:
+        return float(value[0]),float(tangent[0])
+    return value,tangent
+
+def hessian(f,x,chunk_size=None,memory_budget=None):
+    """
+    Computes the Hessian matrix of a scalar function at a point with jets of order 2.
+
+    The second derivative of f along a direction u is twice the second Taylor coefficient of f(x+tu), so the Hessian is
+    recovered by polarization from the n(n+1)/2 directions e_i and e_i+e_j, which are evaluated as one batch of jets.
+
+    Parameters:
+        f: the scalar function to differentiate, called with one argument per input.
+        x: the values of the inputs.
+        chunk_size: the largest number of directions computed by one evaluation, all of them by default.
+        memory_budget: the largest number of bytes taken by the seeded inputs of one evaluation, used when chunk_size is not given.
+
+    Returns:
+        Array: the symmetric Hessian matrix of shape (n, n).
+    """
+    x=_point(x)
+    n=len(x)
+    rows,cols=np.triu_indices(n)
+    directions=np.zeros((len(rows),n))
+    directions[np.arange(len(rows)),rows]=1
+    directions[np.arange(len(rows)),cols]+=np.where(rows!=cols,1,0)
+    c2=_second_coefficients(f,x,directions,_chunk_size(len(directions),n,chunk_size,memory_budget,_BYTES_PER_JET_SEED))
+    #the diagonal directions e_i come first on each row of the upper triangle
+    diagonal=c2[rows==cols]
+    hessian=np.empty((n,n))
+    hessian[rows,cols]=np.where(rows==cols,2*c2,c2-diagonal[rows]-diagonal[cols])
+    hessian[cols,rows]=hessian[rows,cols]
+    return hessian
+
+def hvp(f,x,v,chunk_size=None,memory_budget=None):
+    """
+    Computes the Hessian-vector product of a scalar function without building the Hessian, with jets of order 2.
+
+    Each component (Hv)_i is recovered by polarization from the second derivatives along v, e_i and v+e_i, so the 2n+1 directions are evaluated as one batch of jets.
+
+    Parameters:
+        f: the scalar function to differentiate, called with one argument per input.
+        x: the values of the inputs.
+        v: the vector multiplied with the Hessian.
+        chunk_size: the largest number of directions computed by one evaluation, all of them by default.
+        memory_budget: the largest number of bytes taken by the seeded inputs of one evaluation, used when chunk_size is not given.
+
+    Returns:
+        Array: the product of the Hessian of f at x with v.
+    """
+    x=_point(x)
+    v=_point(v)
+    n=len(x)
+    identity=np.eye(n)
+    directions=np.vstack([v[None,:],identity,identity+v])
+    c2=_second_coefficients(f,x,directions,_chunk_size(len(directions),n,chunk_size,memory_budget,_BYTES_PER_JET_SEED))
+    return c2[n+1:]-c2[0]-c2[1:n+1]
+
+def _point(x):
+    """
+    Converts the values of the inputs of a function into a 1-D float64 array.
+    """
+    return np.atleast_1d(np.asarray(x,dtype=np.float64))
+
+def _outputs(y):
+    """
+    Converts the result of a function into a list of outputs, and tells whether the function returned one output.
+    """
+    if isinstance(y,(list,tuple)):
+        return list(y),False
+    return [y],True
+
+def _chunk_size(total,n,chunk_size,memory_budget,seed_bytes):
+    """
+    Returns the number of directions evaluated at once, from the chunk size or the memory budget given by the user.
+
+    Parameters:
+        total: the number of directions to evaluate.
+        n: the number of inputs of the function.
+        chunk_size: the number of directions given by the user, or None.
+        memory_budget: the number of bytes given by the user, or None.
+        seed_bytes: the number of bytes taken by one seeded input in one direction.
+
+    Returns:
+        Int: the number of directions of one evaluation, at least 1.
+    """
+    if chunk_size is None:
+        if memory_budget is None:
+            return max(total,1)
+        chunk_size=memory_budget//(seed_bytes*n)
+    return int(max(1,min(chunk_size,total)))
+
+def _forward_jacobian(f,x,chunk):
+    """
+    Computes the Jacobian of f column by column, evaluating f on DualArray inputs seeded with chunk columns of the identity matrix at once.
+    """
+    n=len(x)
+    columns=[]
+    scalar=True
+    for start in range(0,n,chunk):
+        stop=min(n,start+chunk)
+        seeds=np.zeros((n,stop-start))
+        seeds[np.arange(start,stop),np.arange(stop-start)]=1
+        inputs=[DualArray._new(np.full(stop-start,v),seeds[i]) for i,v in enumerate(x)]
+        outputs,scalar=_outputs(f(*inputs))
+        columns.append(np.array([_tangents(o,stop-start) for o in outputs]))
+    jacobian=np.hstack(columns)
+    return jacobian[0] if scalar else jacobian
+
+def _tangents(output,size):
+    """
+    Returns the dual parts of one output of a batched evaluation, with zeros for the outputs that do not depend on the inputs.
+    """
+    if isinstance(output,(DualArray,Dual)):
+        return np.broadcast_to(output.dual,(size,))
+    return np.zeros(size)
+
+def _record(f,x):
+    """
+    Records f on a Tape.
+
+    Returns:
+        Tuple: (tape, inputs, outputs, scalar) with the tape, the input variables, the list of outputs of f and whether f returned one output.
+    """
+    tape=Tape()
+    inputs=tape.variables(x)
+    outputs,scalar=_outputs(f(*inputs))
+    return tape,inputs,outputs,scalar
+
+def _reverse_jacobian(tape,inputs,outputs,scalar):
+    """
+    Computes the Jacobian of a function recorded on a Tape row by row, with one backward sweep per output.
+    """
+    jacobian=np.array([tape.gradient(o,inputs) for o in outputs])
+    return jacobian[0] if scalar else jacobian
+
+def _second_coefficients(f,x,directions,chunk):
+    """
+    Computes the second Taylor coefficient of f(x+tu) for each direction u, evaluating f on jets of order 2 holding chunk directions at once.
+
+    Parameters:
+        f: the scalar function.
+        x: the values of the inputs.
+        directions: array of shape (d, n) of the directions.
+        chunk: the number of directions of one evaluation.
+
+    Returns:
+        Array: the d second coefficients.
+    """
+    c2=[]
+    for start in range(0,len(directions),chunk):
+        block=directions[start:start+chunk]
+        inputs=[]
+        for i,v in enumerate(x):
+            coefficients=np.zeros((3,len(block)))
+            coefficients[0]=v
+            coefficients[1]=block[:,i]
+            inputs.append(Jet._new(coefficients))
+        y=f(*inputs)
+        c2.append(np.broadcast_to(y.coefficients[2],(len(block),)) if isinstance(y,Jet) else np.zeros(len(block)))
+    return np.concatenate(c2)
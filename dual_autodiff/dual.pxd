@@ -0,0 +1,12 @@
+# dual_autodiff/dual.pxd
+
+# Declarations used when dual.py is compiled with Cython (see setup.py).
+# They turn Dual into an extension type with its two parts stored in C slots,
+# and let the operators call _new_dual without a Python-level function call.
+# They are ignored when dual.py runs as pure Python.
+
+cdef class Dual:
+    cdef public object real
+    cdef public object dual
+
+cpdef Dual _new_dual(object real, object dual)
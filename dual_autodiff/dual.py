@@ -3,18 +3,110 @@
 #Importing dependencies
 import numpy as np
 import logging
+import math
 
-#Configure basic logging
-logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
+#True when this module was compiled into the extension module of the optional compiled backend (see setup.py)
+try:
+    import cython
+    COMPILED=cython.compiled
+except ImportError:
+    COMPILED=False
+
+from .errors import _handle_domain_error
+
+#Logger of the module, the package does not configure logging when it is imported
+logger=logging.getLogger(__name__)
+
+#Real and dual parts of the result of an operation outside of its domain under the "nan" and "count" error policies
+_NAN=float("nan")
+
+#Constants of the derivatives of the elementary functions
+_LN2=math.log(2)
+_LN10=math.log(10)
+_TWO_OVER_SQRT_PI=2/math.sqrt(math.pi)
+#Absolute tolerance under which the cosine is zero for tan, as np.isclose(cos, 0)
+_TAN_TOLERANCE=1e-8
+
+def _scalar(function,numpy_function):
+    """
+    Returns a function of a real number computed with the math module, which is several times faster than NumPy on a single float.
+
+    The math module raises a ValueError or an OverflowError where NumPy returns NaN or inf with a RuntimeWarning (log of a
+    negative number, sine of inf, overflow of exp, ...), so these points are computed with NumPy to give the same results.
+
+    Parameters:
+        function: the function of the math module.
+        numpy_function: the NumPy ufunc computing the same function.
+
+    Returns:
+        Function: the function of one real number, returning a float.
+    """
+    def call(x):
+        try:
+            return function(x)
+        except (ValueError,OverflowError):
+            return float(numpy_function(x))
+    return call
+
+def _scalar2(function,numpy_function):
+    """
+    Returns a function of two real numbers computed with the math module, as _scalar() does for functions of one real number.
+    """
+    def call(x,y):
+        try:
+            return function(x,y)
+        except (ValueError,OverflowError):
+            return float(numpy_function(float(x),float(y)))
+    return call
+
+def _float_floor(x):
+    """
+    Returns the floor of a real number as a float, as np.floor does.
+    """
+    return float(math.floor(x))
+
+def _float_ceil(x):
+    """
+    Returns the ceil of a real number as a float, as np.ceil does.
+    """
+    return float(math.ceil(x))
+
+#Elementary functions of the real and dual parts of a dual number, the Dual class only holding Python numbers
+_sin=_scalar(math.sin,np.sin)
+_cos=_scalar(math.cos,np.cos)
+_tan=_scalar(math.tan,np.tan)
+_log=_scalar(math.log,np.log)
+_exp=_scalar(math.exp,np.exp)
+_floor=_scalar(_float_floor,np.floor)
+_ceil=_scalar(_float_ceil,np.ceil)
+_sqrt=_scalar(math.sqrt,np.sqrt)
+_pow=_scalar2(math.pow,np.power)
+#math.cbrt is new in Python 3.11
+_cbrt=_scalar(getattr(math,"cbrt",np.cbrt),np.cbrt)
+_sinh=_scalar(math.sinh,np.sinh)
+_cosh=_scalar(math.cosh,np.cosh)
+_tanh=_scalar(math.tanh,np.tanh)
+_asin=_scalar(math.asin,np.arcsin)
+_acos=_scalar(math.acos,np.arccos)
+_atan=_scalar(math.atan,np.arctan)
+_log1p=_scalar(math.log1p,np.log1p)
+_expm1=_scalar(math.expm1,np.expm1)
+_log2=_scalar(math.log2,np.log2)
+_log10=_scalar(math.log10,np.log10)
 
 class Dual:
     """
     A class that defines a structure for dual numbers and performs standard operations on them.
 
+    The real and dual parts are stored in slots rather than in a per-instance dictionary, and the operators build
+    their results with _new_dual(), which skips the validation done by __init__ for the user-provided parts.
+
     Attributes:
         real: real part of the number.
         dual: dual part of the number.
     """
+    __slots__=("real","dual")
+
     def __init__(self,real,dual):
         """
         Initializes the dual number using its real and dual parts.
@@ -28,7 +120,7 @@ class Dual:
             TypeError: if either `real` or `dual` is not a number.
         """
         if (not isinstance(real,(int,float)) or not isinstance(dual,(int,float))):
-             logging.warning("Real and Dual parts have to be numbers.")
+             logger.warning("Real and Dual parts have to be numbers.")
              raise TypeError
         self.real=real
         self.dual=dual
@@ -43,6 +135,51 @@ class Dual:
         string="Dual(real="+ str(self.real) +", dual="+ str(self.dual)+ ")."
         return string
 
+    def __reduce__(self):
+        """
+        Pickles the dual number as its two parts only, e.g. to send it to another process, which rebuilds it with _new_dual().
+
+        Returns:
+            Tuple: the function rebuilding the dual number and its arguments.
+        """
+        return (_new_dual,(self.real,self.dual))
+
+    def __array_ufunc__(self,ufunc,method,*inputs,**kwargs):
+        """
+        Implements the NumPy ufunc protocol, so that NumPy functions such as ``np.sin(x)`` or ``np.exp(x)`` can be applied to dual numbers.
+
+        Operations between dual numbers and NumPy arrays return a DualArray.
+
+        Parameters:
+            ufunc: the NumPy ufunc that is called.
+            method: the ufunc method that is called, only "__call__" is supported.
+            inputs: the inputs of the ufunc.
+            kwargs: the keyword arguments of the ufunc, which are not supported.
+
+        Returns:
+            Dual number or DualArray: the result of the ufunc, or NotImplemented if the ufunc is not supported.
+        """
+        from .dual_array import _apply_ufunc
+        if method!="__call__" or kwargs:
+            return NotImplemented
+        return _apply_ufunc(ufunc,inputs)
+
+    def __array_function__(self,func,types,args,kwargs):
+        """
+        Implements the NumPy function protocol, so that functions such as ``np.sum`` or ``np.dot`` can be applied to dual numbers.
+
+        Parameters:
+            func: the NumPy function that is called.
+            types: the types of the arguments that implement the protocol.
+            args: the positional arguments of the function.
+            kwargs: the keyword arguments of the function.
+
+        Returns:
+            Dual number or DualArray: the result of the function, or NotImplemented if the function is not supported.
+        """
+        from .dual_array import _apply_function
+        return _apply_function(func,args,kwargs)
+
     def __add__(self,x):
         """
         Redefines the ``+`` operator to adapt it to dual numbers.
@@ -55,10 +192,13 @@ class Dual:
         """
         #if x is a dual number
         if isinstance(x, Dual):
-            return Dual(x.real+self.real,x.dual+self.dual)
+            return _new_dual(x.real+self.real,x.dual+self.dual)
+        #if x is an array, let NumPy dispatch the operation to DualArray
+        elif hasattr(x,"__array_ufunc__"):
+            return NotImplemented
         #if x is a scalar
         else:
-            return Dual(x + self.real,self.dual)
+            return _new_dual(x + self.real,self.dual)
 
     def __radd__(self, x):
         """
@@ -87,6 +227,9 @@ class Dual:
             self.real+=x.real
             self.dual+=x.dual
             return self
+        #if x is an array, let NumPy dispatch the operation to DualArray
+        elif hasattr(x,"__array_ufunc__"):
+            return NotImplemented
         #if x is a scalar
         else: 
             self.real+=x
@@ -109,19 +252,21 @@ class Dual:
         #if x is a dual number
         if isinstance(x, Dual):
             if (x.real==0):
-                logging.warning("Division is not defined when the real part of the dual number (denominator) is zero")
-                raise ZeroDivisionError
+                return _domain_error("Division is not defined when the real part of the dual number (denominator) is zero")
             #logic of division in the report
             real=self.real/x.real
             dual=(self.dual*x.real-self.real*x.dual)/(x.real**2)
-            return Dual(real,dual)
+            return _new_dual(real,dual)
+        #if x is an array, let NumPy dispatch the operation to DualArray
+        elif hasattr(x,"__array_ufunc__"):
+            return NotImplemented
         #if x is a scalar
         else:
             if (x==0):
-                raise ZeroDivisionError
+                return _domain_error(None)
             real=self.real/x
             dual=self.dual/x
-            return Dual(real,dual)
+            return _new_dual(real,dual)
 
     def __rtruediv__(self, x):
         """
@@ -138,11 +283,10 @@ class Dual:
             ZeroDivisionError: If division by zero is attempted.
         """
         if (self.real==0):
-            logging.warning("Division is not defined when the real part of the dual number (denominator) is zero")
-            raise ZeroDivisionError
+            return _domain_error("Division is not defined when the real part of the dual number (denominator) is zero")
         real = x / self.real
         dual = -(self.dual*x)/(self.real**2)
-        return Dual(real,dual)
+        return _new_dual(real,dual)
         
 
     def __itruediv__(self, x):
@@ -162,17 +306,19 @@ class Dual:
         #if x is a dual number
         if isinstance(x, Dual):
             if (x.real == 0):
-                logging.warning("Division of dual numbers is not defined when the real part of the denominator is zero")
-                raise ZeroDivisionError
+                return _domain_error("Division of dual numbers is not defined when the real part of the denominator is zero")
             real = self.real / x.real
             dual = (self.dual*x.real-self.real*x.dual)/(x.real**2)
             self.real=real
             self.dual=dual
             return self
+        #if x is an array, let NumPy dispatch the operation to DualArray
+        elif hasattr(x,"__array_ufunc__"):
+            return NotImplemented
         #if x is a scalar
         else:
             if (x==0):
-                raise ZeroDivisionError
+                return _domain_error(None)
             self.real/=x
             self.dual/=x
             return self
@@ -190,10 +336,13 @@ class Dual:
         """
         #if x is a dual number
         if isinstance(x, Dual):
-            return Dual(self.real-x.real,self.dual-x.dual)
+            return _new_dual(self.real-x.real,self.dual-x.dual)
+        #if x is an array, let NumPy dispatch the operation to DualArray
+        elif hasattr(x,"__array_ufunc__"):
+            return NotImplemented
         #if x is a scalar
         else:
-            return Dual(self.real-x,self.dual)
+            return _new_dual(self.real-x,self.dual)
 
     def __rsub__(self, x):
         """
@@ -205,7 +354,7 @@ class Dual:
         Returns:
             Dual number: the result of the subtraction of the current instance from the scalar.
         """
-        return Dual(x-self.real,-self.dual)
+        return _new_dual(x-self.real,-self.dual)
     
     def __isub__(self,x):
         """
@@ -222,6 +371,9 @@ class Dual:
             self.real-=x.real
             self.dual-=x.dual
             return self
+        #if x is an array, let NumPy dispatch the operation to DualArray
+        elif hasattr(x,"__array_ufunc__"):
+            return NotImplemented
         #if x is a scalar
         else: 
             self.real-=x
@@ -241,10 +393,13 @@ class Dual:
         if isinstance(x, Dual):
             real=self.real*x.real
             dual=self.real*x.dual+self.dual*x.real
-            return Dual(real,dual)
+            return _new_dual(real,dual)
+        #if x is an array, let NumPy dispatch the operation to DualArray
+        elif hasattr(x,"__array_ufunc__"):
+            return NotImplemented
         #if x is a scalar
         else:
-            return Dual(self.real*x,self.dual*x)
+            return _new_dual(self.real*x,self.dual*x)
         
     def __rmul__(self, x):
 
@@ -277,6 +432,9 @@ class Dual:
             self.real=real
             self.dual=dual
             return self
+        #if x is an array, let NumPy dispatch the operation to DualArray
+        elif hasattr(x,"__array_ufunc__"):
+            return NotImplemented
         #if x is a scalar
         else:
             self.real*=x
@@ -289,97 +447,67 @@ class Dual:
         Redefines the ``**`` operator to adapt it to dual numbers.
 
         Parameters:
-            x: the power to which we want to raise the current instance.
+            power: the dual number or scalar to which we want to raise the current instance.
 
         Returns:
-            Dual number: the current instance raised to the power of the input.
+            Dual number: the current instance raised to the power of the input, with the derivative v u^(v-1) du + u^v ln(u) dv of u^v.
 
         Raises:
-            Warning: logging warning is triggered when the power is a dual number or if the power is -1 and the real part of the dual number is zero.
-            TypeError: if the power is a dual number.
+            Warning: logging warning is triggered when the power is negative, or is a dual number with a non nul dual part, and the real part of the dual number is zero.
             ZeroDivisionError: If division by zero is attempted.
         """
+        #if power is a dual number
         if isinstance(power, Dual):
-            #if power is a dual number with a non nul dual part 
-            if(power.dual!=0):
-                logging.warning("The power cant be a dual number")
-                raise TypeError
-            #if power is a dual number with a nul dual part 
-            else:
-                if self.real==0 and power.real==-1 :
-                    logging.warning("Power of -1 not defined when real part of dual number is zero")
-                    raise ZeroDivisionError
-                if power.real==0:
-                    return 1
-                real=self.real**power.real
-                dual=(power.real*self.real**(power.real-1))*self.dual
-                return Dual(real,dual)
+            return _power(self.real,self.dual,power.real,power.dual)
+        #if power is an array, let NumPy dispatch the operation to DualArray
+        elif hasattr(power,"__array_ufunc__"):
+            return NotImplemented
         #the power is a scalar
-        else:  
-            if self.real==0 and power==-1 :
-                    logging.warning("Power of -1 not defined when real part of dual number is 0")
-                    raise ZeroDivisionError 
-            if power==0:
-                    return 1
-            real=self.real**power
-            dual=(power*self.real**(power-1))*self.dual
-            return Dual(real,dual)
-    
+        else:
+            return _power(self.real,self.dual,power,0)
+
     def __ipow__(self,power):
         """
         Redefines the ``**=`` operator to adapt it to dual numbers.
 
         Parameters:
-            x: the power to which we want to raise the current instance.
+            power: the dual number or scalar to which we want to raise the current instance.
 
         Returns:
-            Dual number: the current instance raised to the power of the input.
+            Dual number: The modified current instance after raising it to the power of the input.
 
         Raises:
-            Warning: logging warning is triggered when the power is a dual number or if the power is -1 and the real part of the dual number is zero.
-            TypeError: if the power is a dual number.
+            Warning: logging warning is triggered when the power is negative, or is a dual number with a non nul dual part, and the real part of the dual number is zero.
             ZeroDivisionError: If division by zero is attempted.
         """
+        #if power is a dual number
         if isinstance(power, Dual):
-            #if power is a dual number with a non nul dual part 
-            if (power.dual!=0):
-                logging.warning("The power cannot be a dual number")
-                raise TypeError
-            #if power is a dual number with a nul dual part 
-            else:
-                if self.real==0 and power.real==-1 :
-                    logging.warning("Power of -1 not defined when real part of dual number is 0")
-                    raise ZeroDivisionError
-                if power.real==0:
-                    return 1
-                real=self.real**power.real
-                dual=(power.real*self.real**(power.real-1))*self.dual
-                self.real=real
-                self.dual=dual
-                return self
+            result=_power(self.real,self.dual,power.real,power.dual)
+        #if power is an array, let NumPy dispatch the operation to DualArray
+        elif hasattr(power,"__array_ufunc__"):
+            return NotImplemented
         #the power is a scalar
         else:
-            if self.real==0 and power==-1 :
-                    logging.warning("Power of -1 not defined when real part of dual number is 0")
-                    raise ZeroDivisionError  
-            if power==0:
-                    return 1       
-            real=self.real**power
-            dual=(power*self.real**(power-1))*self.dual
-            self.real=real
-            self.dual=dual
-            return self
+            result=_power(self.real,self.dual,power,0)
+        self.real=result.real
+        self.dual=result.dual
+        return self
 
     def __rpow__(self,x):
         """
         Redefines the reverse ``**`` operator to adapt it to dual numbers and consider the case of the following operation: scalar ** dual number.
 
+        Parameters:
+            x: the scalar raised to the power of the current instance.
+
+        Returns:
+            Dual number: the scalar raised to the power of the current instance, with the derivative x^v ln(x) dv.
+
         Raises:
-            Warning: logging warning is triggered to alert the user that the power cannot be a dual number.
-            TypeError: if the power is a dual number.
+            Warning: logging warning is triggered when the scalar is zero and the dual part of the current instance is not nul.
+            ZeroDivisionError: If division by zero is attempted.
         """
-        logging.warning("The power cannot be a dual number")
-        raise TypeError
+        return _power(x,0,self.real,self.dual)
 
 
     def __floordiv__(self,x):
@@ -399,18 +527,20 @@ class Dual:
         #if x is a dual number
         if isinstance(x, Dual):
             if (x.real == 0):
-                logging.warning("Floor division of dual numbers is not defined when the real part of the denominator is zero")
-                raise ZeroDivisionError
+                return _domain_error("Floor division of dual numbers is not defined when the real part of the denominator is zero")
             real= self.real // x.real
             dual= (self.dual * x.real - self.real * x.dual) // (x.real ** 2)
-            return Dual(real,dual)
+            return _new_dual(real,dual)
+        #if x is an array, let NumPy dispatch the operation to DualArray
+        elif hasattr(x,"__array_ufunc__"):
+            return NotImplemented
         #if x is a scalar
         else:
             if (x==0):
-                raise ZeroDivisionError
+                return _domain_error(None)
             real=self.real//x
             dual=self.dual//x
-            return Dual(real,dual)
+            return _new_dual(real,dual)
 
     def __rfloordiv__(self, x):
         """
@@ -427,11 +557,10 @@ class Dual:
             ZeroDivisionError: If division by zero is attempted.
         """
         if (self.real==0):
-            logging.warning("Division is not defined when the real part of the dual number (denominator) is zero")
-            raise ZeroDivisionError
+            return _domain_error("Division is not defined when the real part of the dual number (denominator) is zero")
         real = x // self.real
         dual = -(self.dual*x)//(self.real**2)
-        return Dual(real,dual)
+        return _new_dual(real,dual)
 
     def __ifloordiv__(self,x):
         """
@@ -450,17 +579,19 @@ class Dual:
         #if x is a dual number
         if isinstance(x, Dual):
             if (x.real == 0):
-                logging.warning("Division is not defined when the real part of the dual number (denominator) is zero")
-                raise ZeroDivisionError
+                return _domain_error("Division is not defined when the real part of the dual number (denominator) is zero")
             real= self.real // x.real
             dual= (self.dual * x.real - self.real * x.dual) // (x.real ** 2)
             self.real=real
             self.dual=dual
             return self
+        #if x is an array, let NumPy dispatch the operation to DualArray
+        elif hasattr(x,"__array_ufunc__"):
+            return NotImplemented
         #if x is a scalar
         else:
             if (x==0):
-                raise ZeroDivisionError
+                return _domain_error(None)
             self.real//=x
             self.dual//=x
             return self
@@ -482,18 +613,20 @@ class Dual:
         #if x is a dual number
         if isinstance(x, Dual):
             if (x.real == 0):
-                logging.warning("Modulus by zero is not defined")
-                raise ZeroDivisionError
+                return _domain_error("Modulus by zero is not defined")
             real= self.real % x.real
             dual= (self.dual * x.real - self.real * x.dual) % (x.real ** 2)
-            return Dual(real,dual)
+            return _new_dual(real,dual)
+        #if x is an array, let NumPy dispatch the operation to DualArray
+        elif hasattr(x,"__array_ufunc__"):
+            return NotImplemented
         #if x is a scalar
         else:
             if (x==0):
-                raise ZeroDivisionError
+                return _domain_error(None)
             real=self.real%x
             dual=self.dual%x
-            return Dual(real,dual)
+            return _new_dual(real,dual)
 
     def __imod__(self,x):
         """
@@ -512,17 +645,19 @@ class Dual:
         #If x is a dual number
         if isinstance(x, Dual):
             if (x.real == 0):
-                logging.warning("Modulus by zero is not defined")
-                raise ZeroDivisionError
+                return _domain_error("Modulus by zero is not defined")
             real= self.real % x.real
             dual= (self.dual * x.real - self.real * x.dual) % (x.real ** 2)
             self.real=real
             self.dual=dual
             return self
+        #if x is an array, let NumPy dispatch the operation to DualArray
+        elif hasattr(x,"__array_ufunc__"):
+            return NotImplemented
         #if x is a scalar
         else:
             if (x==0):
-                raise ZeroDivisionError
+                return _domain_error(None)
             self.real%=x
             self.dual%=x
             return self
@@ -542,11 +677,10 @@ class Dual:
             ZeroDivisionError: If modulus by zero is attempted.
         """
         if (self.real==0):
-            logging.warning("Modulus by zero is not defined")
-            raise ZeroDivisionError
+            return _domain_error("Modulus by zero is not defined")
         real = x % self.real
         dual = -(self.dual*x)%(self.real**2)
-        return Dual(real,dual)
+        return _new_dual(real,dual)
 
     def __neg__(self):
         """
@@ -555,7 +689,7 @@ class Dual:
         Returns:
             Dual number: the negation of the current instance.
         """
-        return Dual(-self.real,-self.dual)
+        return _new_dual(-self.real,-self.dual)
 
     def __eq__(self,x):
         """
@@ -571,6 +705,9 @@ class Dual:
         #if x is a dual number
         if isinstance(x, Dual):
             return ((self.real==x.real) and (self.dual==x.dual))
+        #if x is an array, let NumPy dispatch the operation to DualArray
+        elif hasattr(x,"__array_ufunc__"):
+            return NotImplemented
         #if x is a scalar
         else:
             return((self.real==x) and (self.dual==0))
@@ -589,10 +726,26 @@ class Dual:
         #if x is a dual number
         if isinstance(x, Dual):
             return ((self.real!=x.real) or (self.dual!=x.dual))
+        #if x is an array, let NumPy dispatch the operation to DualArray
+        elif hasattr(x,"__array_ufunc__"):
+            return NotImplemented
         #if x is a scalar
         else:
             return((self.real!=x) or (self.dual!=0))
 
+    def __hash__(self):
+        """
+        Makes dual numbers hashable consistently with ``==``: a dual number with a nul dual part is equal to its real part and has the same hash.
+
+        The ``+=``-like operators modify a dual number in place and change its hash, so a dual number must not be modified while it is a key of a dict or an element of a set.
+
+        Returns:
+            Int: the hash of the real and dual parts of the current instance.
+        """
+        if self.dual==0:
+            return hash(self.real)
+        return hash((self.real,self.dual))
+
     def __gt__(self,x):
         """
         Redefines the ``>`` operator for dual numbers.
@@ -608,14 +761,17 @@ class Dual:
             if (x.dual==0 and self.dual==0):
                 return self.real>x.real
             else:
-                logging.warning("> comparision not defined for dual numbers with non nul dual parts. Return type corresponds to the comparision between the real part of the numbers.")
+                logger.warning("> comparision not defined for dual numbers with non nul dual parts. Return type corresponds to the comparision between the real part of the numbers.")
                 return self.real > x.real
+        #if x is an array, let NumPy dispatch the operation to DualArray
+        elif hasattr(x,"__array_ufunc__"):
+            return NotImplemented
         #if x is a scalar
         else:
             if (self.dual==0):
                 return self.real>x
             else:
-                logging.warning("> comparision not defined for dual numbers with non nul dual parts. Return type corresponds to the comparision between the real part of the dual number and the scalar.") 
+                logger.warning("> comparision not defined for dual numbers with non nul dual parts. Return type corresponds to the comparision between the real part of the dual number and the scalar.") 
                 return self.real > x
 
     def __ge__(self,x):
@@ -633,14 +789,17 @@ class Dual:
             if (x.dual==0 and self.dual==0):
                 return self.real>=x.real
             else:
-                logging.warning(">= comparision not defined for dual numbers with non nul dual parts. Return type corresponds to the comparision between the real part of the numbers.")
+                logger.warning(">= comparision not defined for dual numbers with non nul dual parts. Return type corresponds to the comparision between the real part of the numbers.")
                 return self.real >= x.real
+        #if x is an array, let NumPy dispatch the operation to DualArray
+        elif hasattr(x,"__array_ufunc__"):
+            return NotImplemented
         #if x is a scalar
         else:
             if (self.dual==0):
                 return self.real>=x
             else:
-                logging.warning(">= comparision not defined for dual numbers with non nul dual parts. Return type corresponds to the comparision between the real part of the dual number and the scalar.") 
+                logger.warning(">= comparision not defined for dual numbers with non nul dual parts. Return type corresponds to the comparision between the real part of the dual number and the scalar.") 
                 return self.real >= x
 
     def __lt__(self,x):
@@ -659,14 +818,17 @@ class Dual:
             if (x.dual==0 and self.dual==0):
                 return self.real<x.real
             else:
-                logging.warning("< comparision not defined for dual numbers with non nul dual parts. Return type corresponds to the comparision between the real part of the numbers.")
+                logger.warning("< comparision not defined for dual numbers with non nul dual parts. Return type corresponds to the comparision between the real part of the numbers.")
                 return self.real < x.real
+        #if x is an array, let NumPy dispatch the operation to DualArray
+        elif hasattr(x,"__array_ufunc__"):
+            return NotImplemented
         #if x is a scalar
         else: 
             if (self.dual==0):
                 return self.real<x
             else:
-                logging.warning("< comparision not defined for dual numbers with non nul dual parts. Return type corresponds to the comparision between the real part of the dual number and the scalar.") 
+                logger.warning("< comparision not defined for dual numbers with non nul dual parts. Return type corresponds to the comparision between the real part of the dual number and the scalar.") 
                 return self.real<x
 
     def __le__(self,x):
@@ -684,14 +846,17 @@ class Dual:
             if (x.dual==0 and self.dual==0):
                 return self.real<=x.real
             else:
-                logging.warning("<= comparision not defined for dual numbers with non nul dual parts. Return type corresponds to the comparision between the real part of the numbers.")
+                logger.warning("<= comparision not defined for dual numbers with non nul dual parts. Return type corresponds to the comparision between the real part of the numbers.")
                 return self.real <= x.real
+        #if x is an array, let NumPy dispatch the operation to DualArray
+        elif hasattr(x,"__array_ufunc__"):
+            return NotImplemented
         #if x is a scalar
         else: 
             if (self.dual==0):
                 return self.real<=x
             else:
-                logging.warning("<= comparision not defined for dual numbers with non nul dual parts. Return type corresponds to the comparision between the real part of the dual number and the scalar.") 
+                logger.warning("<= comparision not defined for dual numbers with non nul dual parts. Return type corresponds to the comparision between the real part of the dual number and the scalar.") 
                 return self.real<=x
         
     def __abs__(self):
@@ -701,7 +866,7 @@ class Dual:
         Returns:
             Dual number: the absolute value of the current instance.
         """
-        return Dual(np.abs(self.real),np.abs(self.dual))
+        return _new_dual(abs(self.real),abs(self.dual))
 
     def sin(self):
         """
@@ -712,8 +877,8 @@ class Dual:
                         The real part of the reult is the sine function of the real part of the current instance.
                         The dual part of the result is the derivative of the sine function evaluated at the real part of the current instance multiplied with the dual part of the current instance.
         """    
-        dual=self.dual*np.cos(self.real)
-        return  Dual(np.sin(self.real),dual)
+        dual=self.dual*_cos(self.real)
+        return  _new_dual(_sin(self.real),dual)
 
     def cos(self):
         """
@@ -724,8 +889,8 @@ class Dual:
                         The real part of the result is the cosine function of the real part of the current instance.
                         The dual part of the result is the derivative of the cosine function evaluated at the real part of the current instance multiplied with the dual part of the current instance.
         """  
-        dual=self.dual*-np.sin(self.real)
-        return  Dual(np.cos(self.real),dual)
+        dual=self.dual*-_sin(self.real)
+        return  _new_dual(_cos(self.real),dual)
 
     def tan(self):
         """
@@ -740,11 +905,11 @@ class Dual:
             Warning: logging warning is triggered when the cosine of the real part is zero.
             ZeroDivisionError: Division by zero attempted
         """  
-        if (np.isclose(np.cos(self.real), 0)):
-            logging.warning("Tan can't be defined for this function")
-            raise ZeroDivisionError
-        dual=self.dual/(np.cos(self.real)**2)
-        return  Dual(np.tan(self.real),dual)
+        cos=_cos(self.real)
+        if (abs(cos)<=_TAN_TOLERANCE):
+            return _domain_error("Tan can't be defined for this function")
+        dual=self.dual/(cos*cos)
+        return  _new_dual(_tan(self.real),dual)
 
     def log(self):
         """
@@ -760,10 +925,9 @@ class Dual:
             ZeroDivisionError: Division by zero attempted
         """ 
         if (self.real==0):
-            logging.warning("Logarithm of dual number not defined when real part is zero")
-            raise ZeroDivisionError
+            return _domain_error("Logarithm of dual number not defined when real part is zero")
         dual=(1/self.real)*self.dual
-        return  Dual(np.log(self.real),dual)
+        return  _new_dual(_log(self.real),dual)
 
 
     def exp(self):
@@ -775,8 +939,8 @@ class Dual:
                         The real part of the result is the exp of the real part of the current instance.
                         The dual part of the result is the derivative of the exp evaluated at the real part of the current instance multiplied with the dual part of the current instance.
         """  
-        dual=np.exp(self.real)*self.dual
-        return  Dual(np.exp(self.real),dual)
+        real=_exp(self.real)
+        return  _new_dual(real,real*self.dual)
 
 
     def square(self):
@@ -789,7 +953,7 @@ class Dual:
                         The dual part of the result is the derivative of the square function evaluated at the real part of the current instance multiplied with the dual part of the current instance.
         """  
         dual=2*self.real*self.dual
-        return  Dual(np.square(self.real),dual)
+        return  _new_dual(self.real*self.real,dual)
 
 
     def floor(self):
@@ -801,7 +965,7 @@ class Dual:
                         The real part of the result is the floor of the real part of the current instance.
                         The dual part of the result is the floor of the dual part of the current instance.
         """  
-        return  Dual(np.floor(self.real),np.floor(self.dual))
+        return  _new_dual(_floor(self.real),_floor(self.dual))
 
 
     def ceil(self):
@@ -813,7 +977,7 @@ class Dual:
                         The real part of the result is the ceil of the real part of the current instance.
                         The dual part of the result is the ceil of the dual part of the current instance.
         """  
-        return  Dual(np.ceil(self.real),np.ceil(self.dual))
+        return  _new_dual(_ceil(self.real),_ceil(self.dual))
 
     def inverse(self):
         """
@@ -828,12 +992,361 @@ class Dual:
             ZeroDivisionError: Division by zero attempted
         """  
         if (self.real==0):
-            logging.warning("Cannot invert this dual number because its real part is nul")
-            raise ZeroDivisionError
+            return _domain_error("Cannot invert this dual number because its real part is nul")
         real=1/self.real
         dual=-self.dual/(self.real**2)
 
-        return  Dual(real,dual)
+        return  _new_dual(real,dual)
+
+    def sqrt(self):
+        """
+        Computes the square root function of the dual number.
+
+        Returns:
+            Dual number: 
+                        The real part of the result is the square root of the real part of the current instance.
+                        The dual part of the result is the derivative of the square root evaluated at the real part of the current instance multiplied with the dual part of the current instance.
+
+        Raises:
+            Warning: logging warning is triggered when the real part of the dual number is zero.
+            ZeroDivisionError: Division by zero attempted
+        """
+        if (self.real==0):
+            return _domain_error("Square root of dual number not differentiable when real part is zero")
+        real=_sqrt(self.real)
+        return _new_dual(real,self.dual/(2*real))
+
+    def cbrt(self):
+        """
+        Computes the cube root function of the dual number.
+
+        Returns:
+            Dual number: 
+                        The real part of the result is the cube root of the real part of the current instance.
+                        The dual part of the result is the derivative of the cube root evaluated at the real part of the current instance multiplied with the dual part of the current instance.
+
+        Raises:
+            Warning: logging warning is triggered when the real part of the dual number is zero.
+            ZeroDivisionError: Division by zero attempted
+        """
+        if (self.real==0):
+            return _domain_error("Cube root of dual number not differentiable when real part is zero")
+        real=_cbrt(self.real)
+        return _new_dual(real,self.dual/(3*real*real))
+
+    def sinh(self):
+        """
+        Computes the hyperbolic sine function of the dual number.
+
+        Returns:
+            Dual number: 
+                        The real part of the result is the hyperbolic sine of the real part of the current instance.
+                        The dual part of the result is the derivative of the hyperbolic sine evaluated at the real part of the current instance multiplied with the dual part of the current instance.
+        """
+        return _new_dual(_sinh(self.real),self.dual*_cosh(self.real))
+
+    def cosh(self):
+        """
+        Computes the hyperbolic cosine function of the dual number.
+
+        Returns:
+            Dual number: 
+                        The real part of the result is the hyperbolic cosine of the real part of the current instance.
+                        The dual part of the result is the derivative of the hyperbolic cosine evaluated at the real part of the current instance multiplied with the dual part of the current instance.
+        """
+        return _new_dual(_cosh(self.real),self.dual*_sinh(self.real))
+
+    def tanh(self):
+        """
+        Computes the hyperbolic tangent function of the dual number.
+
+        Returns:
+            Dual number: 
+                        The real part of the result is the hyperbolic tangent of the real part of the current instance.
+                        The dual part of the result is the derivative of the hyperbolic tangent evaluated at the real part of the current instance multiplied with the dual part of the current instance.
+        """
+        real=_tanh(self.real)
+        return _new_dual(real,self.dual*(1-real*real))
+
+    def arcsin(self):
+        """
+        Computes the inverse sine function of the dual number.
+
+        Returns:
+            Dual number: 
+                        The real part of the result is the inverse sine of the real part of the current instance.
+                        The dual part of the result is the derivative of the inverse sine evaluated at the real part of the current instance multiplied with the dual part of the current instance.
+
+        Raises:
+            Warning: logging warning is triggered when the real part of the dual number is 1 or -1.
+            ZeroDivisionError: Division by zero attempted
+        """
+        if (self.real==1 or self.real==-1):
+            return _domain_error("Arcsin of dual number not differentiable when real part is 1 or -1")
+        return _new_dual(_asin(self.real),self.dual/_sqrt(1-self.real*self.real))
+
+    def arccos(self):
+        """
+        Computes the inverse cosine function of the dual number.
+
+        Returns:
+            Dual number: 
+                        The real part of the result is the inverse cosine of the real part of the current instance.
+                        The dual part of the result is the derivative of the inverse cosine evaluated at the real part of the current instance multiplied with the dual part of the current instance.
+
+        Raises:
+            Warning: logging warning is triggered when the real part of the dual number is 1 or -1.
+            ZeroDivisionError: Division by zero attempted
+        """
+        if (self.real==1 or self.real==-1):
+            return _domain_error("Arccos of dual number not differentiable when real part is 1 or -1")
+        return _new_dual(_acos(self.real),-self.dual/_sqrt(1-self.real*self.real))
+
+    def arctan(self):
+        """
+        Computes the inverse tangent function of the dual number.
+
+        Returns:
+            Dual number: 
+                        The real part of the result is the inverse tangent of the real part of the current instance.
+                        The dual part of the result is the derivative of the inverse tangent evaluated at the real part of the current instance multiplied with the dual part of the current instance.
+        """
+        return _new_dual(_atan(self.real),self.dual/(1+self.real*self.real))
+
+    def log1p(self):
+        """
+        Computes the function log(1+x) of the dual number.
+
+        Returns:
+            Dual number: 
+                        The real part of the result is the log(1+x) of the real part of the current instance.
+                        The dual part of the result is the derivative of the log(1+x) evaluated at the real part of the current instance multiplied with the dual part of the current instance.
+
+        Raises:
+            Warning: logging warning is triggered when the real part of the dual number is -1.
+            ZeroDivisionError: Division by zero attempted
+        """
+        if (self.real==-1):
+            return _domain_error("Log1p of dual number not defined when real part is -1")
+        return _new_dual(_log1p(self.real),self.dual/(1+self.real))
+
+    def expm1(self):
+        """
+        Computes the function exp(x)-1 of the dual number.
+
+        Returns:
+            Dual number: 
+                        The real part of the result is the exp(x)-1 of the real part of the current instance.
+                        The dual part of the result is the derivative of the exp(x)-1 evaluated at the real part of the current instance multiplied with the dual part of the current instance.
+        """
+        real=_expm1(self.real)
+        return _new_dual(real,(real+1)*self.dual)
+
+    def log2(self):
+        """
+        Computes the base 2 logarithm function of the dual number.
+
+        Returns:
+            Dual number: 
+                        The real part of the result is the base 2 logarithm of the real part of the current instance.
+                        The dual part of the result is the derivative of the base 2 logarithm evaluated at the real part of the current instance multiplied with the dual part of the current instance.
+
+        Raises:
+            Warning: logging warning is triggered when the real part of the dual number is zero.
+            ZeroDivisionError: Division by zero attempted
+        """
+        if (self.real==0):
+            return _domain_error("Logarithm of dual number not defined when real part is zero")
+        return _new_dual(_log2(self.real),self.dual/(self.real*_LN2))
+
+    def log10(self):
+        """
+        Computes the base 10 logarithm function of the dual number.
+
+        Returns:
+            Dual number: 
+                        The real part of the result is the base 10 logarithm of the real part of the current instance.
+                        The dual part of the result is the derivative of the base 10 logarithm evaluated at the real part of the current instance multiplied with the dual part of the current instance.
+
+        Raises:
+            Warning: logging warning is triggered when the real part of the dual number is zero.
+            ZeroDivisionError: Division by zero attempted
+        """
+        if (self.real==0):
+            return _domain_error("Logarithm of dual number not defined when real part is zero")
+        return _new_dual(_log10(self.real),self.dual/(self.real*_LN10))
+
+    def erf(self):
+        """
+        Computes the error function of the dual number.
+
+        Returns:
+            Dual number: 
+                        The real part of the result is the error function of the real part of the current instance.
+                        The dual part of the result is the derivative of the error function evaluated at the real part of the current instance multiplied with the dual part of the current instance.
+        """
+        return _new_dual(math.erf(self.real),self.dual*_TWO_OVER_SQRT_PI*math.exp(-self.real*self.real))
+
+    def sigmoid(self):
+        """
+        Computes the logistic sigmoid function 1/(1+exp(-x)) of the dual number.
+
+        Returns:
+            Dual number: 
+                        The real part of the result is the sigmoid of the real part of the current instance.
+                        The dual part of the result is the derivative of the sigmoid evaluated at the real part of the current instance multiplied with the dual part of the current instance.
+        """
+        #exp(-|x|) does not overflow, and gives the sigmoid on both sides of zero
+        e=math.exp(-abs(self.real))
+        real=1/(1+e) if self.real>=0 else e/(1+e)
+        return _new_dual(real,self.dual*real*(1-real))
+
+    def softplus(self):
+        """
+        Computes the softplus function log(1+exp(x)) of the dual number.
+
+        Returns:
+            Dual number: 
+                        The real part of the result is the softplus of the real part of the current instance.
+                        The dual part of the result is the derivative of the softplus evaluated at the real part of the current instance multiplied with the dual part of the current instance.
+        """
+        #log(1+exp(x)) = max(x,0)+log(1+exp(-|x|)), whose derivative is the sigmoid
+        e=math.exp(-abs(self.real))
+        real=max(self.real,0)+_log1p(e)
+        sigmoid=1/(1+e) if self.real>=0 else e/(1+e)
+        return _new_dual(real,self.dual*sigmoid)
 
+    def arctan2(self,x):
+        """
+        Computes the angle of the point (x, y) where y is the current instance, as np.arctan2(y, x).
 
-    
\ No newline at end of file
+        Parameters:
+            x: the dual number or scalar of the second coordinate.
+
+        Returns:
+            Dual number: 
+                        The real part of the result is the arctan2 of the real parts.
+                        The dual part of the result is (x.real*y.dual-y.real*x.dual)/(x.real**2+y.real**2).
+
+        Raises:
+            Warning: logging warning is triggered when both real parts are zero.
+            ZeroDivisionError: Division by zero attempted
+        """
+        #if x is a dual number
+        if isinstance(x, Dual):
+            return _arctan2(self.real,self.dual,x.real,x.dual)
+        #if x is an array, let NumPy dispatch the operation to DualArray
+        elif hasattr(x,"__array_ufunc__"):
+            return NotImplemented
+        #if x is a scalar
+        else:
+            return _arctan2(self.real,self.dual,x,0.0)
+
+    def _rarctan2(self,y):
+        """
+        Computes np.arctan2(y, x) where x is the current instance and y a scalar, the reverse of arctan2().
+        """
+        return _arctan2(y,0.0,self.real,self.dual)
+
+    def hypot(self,x):
+        """
+        Computes the length of the hypotenuse sqrt(self**2+x**2) without overflow, as np.hypot.
+
+        Parameters:
+            x: the dual number or scalar of the other side.
+
+        Returns:
+            Dual number: 
+                        The real part of the result is the hypot of the real parts.
+                        The dual part of the result is (self.real*self.dual+x.real*x.dual)/hypot.
+
+        Raises:
+            Warning: logging warning is triggered when both real parts are zero.
+            ZeroDivisionError: Division by zero attempted
+        """
+        #if x is a dual number
+        if isinstance(x, Dual):
+            xr,xd=x.real,x.dual
+        #if x is an array, let NumPy dispatch the operation to DualArray
+        elif hasattr(x,"__array_ufunc__"):
+            return NotImplemented
+        #if x is a scalar
+        else:
+            xr,xd=x,0.0
+        real=math.hypot(self.real,xr)
+        if (real==0):
+            return _domain_error("Hypot of dual numbers not differentiable when both real parts are zero")
+        return _new_dual(real,(self.real*self.dual+xr*xd)/real)
+
+
+def _power(ur,ud,vr,vd):
+    """
+    Computes u**v for the real and dual parts of u and v, with the derivative v u^(v-1) du + u^v ln(u) dv.
+
+    The real part is raised to the power once: u^(n-1) is computed for a constant integer power n, and u^(v-1) is
+    recovered from u^v by a division otherwise. The logarithm is only computed when the power has a non nul dual part.
+    """
+    #a power of zero gives exactly one, with no dual part
+    if vr==0 and vd==0:
+        return _new_dual(1.0,0.0)
+    #a constant integer power computes u^(n-1) once for both parts
+    if vd==0 and type(vr) is int and (ur!=0 or vr>0):
+        previous=ur**(vr-1)
+        return _new_dual(previous*ur,vr*previous*ud)
+    if ur==0:
+        if vd!=0:
+            return _domain_error("Power with a dual exponent not defined when real part of dual number is zero")
+        if vr<0:
+            return _domain_error("Negative power not defined when real part of dual number is zero")
+        #the derivative v u^(v-1) du is infinite at u=0 for 0<v<1
+        if vr<1 and ud!=0:
+            return _domain_error("Power lower than one not differentiable when real part of dual number is zero")
+        #0**v is 0, and its derivative du is only non nul for v=1
+        return _new_dual(0.0,ud if vr==1 else 0.0)
+    real=_pow(ur,vr)
+    dual=vr*(real/ur)*ud
+    if vd!=0:
+        dual+=real*_log(ur)*vd
+    return _new_dual(real,dual)
+
+def _arctan2(yr,yd,xr,xd):
+    """
+    Computes np.arctan2(y, x) for the real and dual parts of y and x, with the derivative (x.real*y.dual-y.real*x.dual)/(x.real**2+y.real**2).
+    """
+    r2=xr*xr+yr*yr
+    if (r2==0):
+        return _domain_error("Arctan2 of dual numbers not defined when both real parts are zero")
+    return _new_dual(math.atan2(yr,xr),(xr*yd-yr*xd)/r2)
+
+def _domain_error(message):
+    """
+    Handles an operation outside of its domain with the error policy set by set_error_policy().
+
+    Parameters:
+        message: description of the error, logged under the "raise" policy, or None.
+
+    Returns:
+        Dual number: a dual number with NaN real and dual parts, under the "nan" and "count" policies.
+
+    Raises:
+        Warning: logging warning is triggered with the message under the "raise" policy.
+        ZeroDivisionError: under the "raise" policy.
+    """
+    _handle_domain_error(message,logger)
+    return _new_dual(_NAN,_NAN)
+
+def _new_dual(real,dual):
+    """
+    Builds a dual number without validating its parts, for results of operations on numbers that were already validated.
+
+    Parameters:
+        real: real part of the number.
+        dual: dual part of the number.
+
+    Returns:
+        Dual number: the new dual number.
+    """
+    obj=Dual.__new__(Dual)
+    obj.real=real
+    obj.dual=dual
+    return obj
@@ -0,0 +1,1856 @@
+# dual_autodiff/dual_array.py
+
+#Importing dependencies
+import numpy as np
+import contextlib
+import logging
+import math
+import operator
+
+from .dual import Dual, _new_dual, _LN2, _LN10, _TWO_OVER_SQRT_PI, _TAN_TOLERANCE
+from .errors import _handle_domain_error
+
+#Logger of the module
+logger=logging.getLogger(__name__)
+
+#Structured dtype storing a dual number as its two float64 parts, 16 bytes per number
+DUAL_DTYPE=np.dtype([("real",np.float64),("dual",np.float64)])
+
+#Layouts of the real and dual parts in a buffer: all the real parts followed by all the dual parts, or (real, dual) pairs
+_LAYOUTS=("planar","interleaved")
+
+#scipy is an optional dependency: its erf ufunc is used when it is installed, and math.erf is applied elementwise otherwise
+try:
+    from scipy.special import erf as _erf
+except ImportError:
+    _erf=np.vectorize(math.erf,otypes=[np.float64])
+
+class DualArray:
+    """
+    A class that stores many dual numbers as two float64 NumPy arrays and performs the operations of the Dual class on them elementwise.
+
+    Operations between a DualArray and another DualArray, a Dual, a scalar or a NumPy array follow the NumPy broadcasting rules,
+    so a whole grid of points is differentiated with one batch of NumPy calls instead of one Python call per point.
+
+    Under the "nan" and "count" error policies (see set_error_policy), the points of an operation outside of its domain
+    get NaN real and dual parts instead of raising for the whole array, and are recorded in the `failed` mask of the result
+    and of every array computed from it.
+
+    Attributes:
+        real: array of the real parts of the numbers.
+        dual: array of the dual parts of the numbers.
+    """
+    def __init__(self,real,dual):
+        """
+        Initializes the array of dual numbers using its real and dual parts.
+
+        The two parts are broadcast against each other and copied into contiguous float64 arrays, so that the in-place
+        operators never modify the arrays of the caller. from_buffer builds an array viewing existing data instead.
+
+        Parameters:
+            real: array-like of the real parts of the numbers.
+            dual: array-like of the dual parts of the numbers.
+
+        Raises:
+            Warning: logging warning is triggered when an invalid type is provided.
+            TypeError: if either `real` or `dual` does not contain numbers.
+        """
+        real=np.asarray(real)
+        dual=np.asarray(dual)
+        if (real.dtype.kind not in "biuf" or dual.dtype.kind not in "biuf"):
+            logger.warning("Real and Dual parts have to be arrays of numbers.")
+            raise TypeError
+        real,dual=np.broadcast_arrays(real,dual)
+        self.real=np.array(real,dtype=np.float64,order="C")
+        self.dual=np.array(dual,dtype=np.float64,order="C")
+        self._failed=None
+
+    @classmethod
+    def _new(cls,real,dual,failed=None):
+        """
+        Builds an array of dual numbers from two float64 arrays of the same shape without validating or copying them.
+
+        Parameters:
+            real: array of the real parts.
+            dual: array of the dual parts.
+            failed: array of bools of the same shape marking the failed points, or None if no point failed.
+
+        Returns:
+            DualArray: the new array of dual numbers.
+        """
+        obj=object.__new__(cls)
+        obj.real=real
+        obj.dual=dual
+        obj._failed=failed
+        return obj
+
+    @classmethod
+    def from_duals(cls,duals):
+        """
+        Builds an array of dual numbers from an iterable of Dual instances.
+
+        Parameters:
+            duals: iterable of Dual instances.
+
+        Returns:
+            DualArray: the array holding the real and dual parts of the Dual instances.
+        """
+        duals=list(duals)
+        real=np.fromiter((d.real for d in duals),dtype=np.float64,count=len(duals))
+        dual=np.fromiter((d.dual for d in duals),dtype=np.float64,count=len(duals))
+        return cls._new(real,dual)
+
+    @classmethod
+    def from_buffer(cls,buffer,shape=None,layout="planar",offset=0):
+        """
+        Builds an array of dual numbers whose real and dual parts are views of a buffer of float64 values, without copying it.
+
+        The buffer can be any object of the buffer protocol, e.g. a bytearray, an mmap, the `buf` of a multiprocessing.shared_memory.SharedMemory
+        or a contiguous NumPy array such as an np.memmap. When the buffer is writable, writing into the array, e.g. with ``array[...] = result``,
+        writes into the buffer in place. With the "interleaved" layout, the parts are strided views of the buffer.
+
+        Parameters:
+            buffer: the buffer holding the float64 values, in the native byte order.
+            shape: the shape of the array of dual numbers, by default one dimension with all the values of the buffer.
+            layout: "planar" if the buffer holds all the real parts followed by all the dual parts (the default),
+                    "interleaved" if it holds (real, dual) pairs.
+            offset: the number of bytes skipped at the start of the buffer.
+
+        Returns:
+            DualArray: the array of dual numbers viewing the buffer.
+
+        Raises:
+            Warning: logging warning is triggered when the layout is not supported or when the buffer does not hold a whole number of dual numbers.
+            ValueError: if the layout is not supported, or if the buffer does not hold a whole number of dual numbers or fewer than the shape requires.
+        """
+        if layout not in _LAYOUTS:
+            logger.warning("The layout has to be one of "+", ".join(_LAYOUTS)+".")
+            raise ValueError
+        shape=_shape(shape)
+        count=-1 if shape is None else 2*math.prod(shape)
+        try:
+            data=np.frombuffer(buffer,dtype=np.float64,count=count,offset=offset)
+        except ValueError:
+            logger.warning("The buffer is too small for the shape of the array.")
+            raise
+        if len(data)%2:
+            logger.warning("The buffer has to hold a real part and a dual part for each dual number.")
+            raise ValueError
+        if shape is None:
+            shape=(len(data)//2,)
+        if layout=="planar":
+            n=len(data)//2
+            return cls._new(data[:n].reshape(shape),data[n:].reshape(shape))
+        pairs=data.reshape(tuple(shape)+(2,))
+        return cls._new(pairs[...,0],pairs[...,1])
+
+    @classmethod
+    def memmap(cls,filename,shape=None,layout="planar",mode="r+",offset=0):
+        """
+        Maps a file of float64 values in memory as an array of dual numbers, so that only the pages used are read from the disk.
+
+        Parameters:
+            filename: the path of the file.
+            shape: the shape of the array of dual numbers, by default one dimension with all the values of the file. Required with mode "w+".
+            layout: "planar" or "interleaved", as in from_buffer.
+            mode: the mode of np.memmap: "r" (read-only), "r+" (read and write in place, the default), "w+" (create or overwrite) or "c" (copy on write).
+            offset: the number of bytes skipped at the start of the file.
+
+        Returns:
+            DualArray: the array of dual numbers viewing the mapped file.
+
+        Raises:
+            ValueError: as from_buffer, or if the file is too small for the shape.
+        """
+        shape=_shape(shape)
+        data=np.memmap(filename,dtype=np.float64,mode=mode,offset=offset,shape=None if shape is None else (2*math.prod(shape),))
+        return cls.from_buffer(data,shape,layout)
+
+    @classmethod
+    def from_structured(cls,array):
+        """
+        Builds an array of dual numbers from a NumPy array of the structured dtype DUAL_DTYPE.
+
+        The real and dual parts are views of the "real" and "dual" fields of the array, without copying it. For any other
+        structured array with "real" and "dual" fields, the two fields are copied by name into float64 arrays, and the
+        other fields are ignored.
+
+        Parameters:
+            array: structured array with "real" and "dual" fields.
+
+        Returns:
+            DualArray: the array of dual numbers, viewing the fields of an array of the dtype DUAL_DTYPE.
+
+        Raises:
+            Warning: logging warning is triggered when the array does not have "real" and "dual" fields.
+            TypeError: if the array does not have "real" and "dual" fields.
+        """
+        array=np.asarray(array)
+        if array.dtype!=DUAL_DTYPE:
+            if array.dtype.names is None or not {"real","dual"}<=set(array.dtype.names):
+                logger.warning("The structured array has to have real and dual fields.")
+                raise TypeError
+            #the fields are read by name, as casting a structured array converts its fields by position
+            return cls._new(np.array(array["real"],dtype=np.float64),np.array(array["dual"],dtype=np.float64))
+        return cls._new(array["real"],array["dual"])
+
+    def to_structured(self):
+        """
+        Converts the array of dual numbers into a NumPy array of the structured dtype DUAL_DTYPE.
+
+        The result stores each number as its two float64 parts, so it can be sorted (by real part, then dual part),
+        saved with np.save and loaded without pickle, and sent to other processes as raw bytes.
+
+        Returns:
+            Array of DUAL_DTYPE: a new array of the shape of the array of dual numbers.
+        """
+        array=np.empty(self.shape,dtype=DUAL_DTYPE)
+        array["real"]=self.real
+        array["dual"]=self.dual
+        return array
+
+    def to_duals(self):
+        """
+        Converts the array of dual numbers into a flat list of Dual instances.
+
+        Returns:
+            List: the Dual instances, in the C order of the array.
+        """
+        return [_new_dual(r,d) for r,d in zip(self.real.ravel().tolist(),self.dual.ravel().tolist())]
+
+    @property
+    def shape(self):
+        """
+        Tuple: the shape of the array of dual numbers.
+        """
+        return self.real.shape
+
+    @property
+    def ndim(self):
+        """
+        Int: the number of dimensions of the array of dual numbers.
+        """
+        return self.real.ndim
+
+    @property
+    def size(self):
+        """
+        Int: the number of dual numbers in the array.
+        """
+        return self.real.size
+
+    @property
+    def failed(self):
+        """
+        Array of bools: True at the points where an operation leading to this array was outside of its domain under the "nan" or "count" error policy.
+        """
+        if self._failed is None:
+            return np.zeros(self.real.shape,dtype=bool)
+        return self._failed
+
+    def __len__(self):
+        """
+        Returns:
+            Int: the length of the first dimension of the array.
+        """
+        return len(self.real)
+
+    def __getitem__(self,index):
+        """
+        Indexes the real and dual parts together.
+
+        Parameters:
+            index: any index accepted by NumPy arrays.
+
+        Returns:
+            Dual number: if the index selects a single element.
+            DualArray: the selected elements otherwise.
+        """
+        real=self.real[index]
+        dual=self.dual[index]
+        if np.ndim(real)==0:
+            return Dual(float(real),float(dual))
+        return DualArray._new(real,dual,None if self._failed is None else self._failed[index])
+
+    def __setitem__(self,index,value):
+        """
+        Sets the real and dual parts of the selected elements in place, e.g. to write results into an array viewing a buffer.
+
+        The failed points of the value become failed points of the array, and the other selected points are no longer failed.
+
+        Parameters:
+            index: any index accepted by NumPy arrays.
+            value: the array of dual numbers, dual number, scalar or array of numbers (with a zero dual part) to write.
+
+        Raises:
+            Warning: logging warning is triggered when the value does not contain numbers.
+            TypeError: if the value does not contain numbers.
+            ValueError: if the array views a read-only buffer.
+        """
+        real,dual=_split(value)
+        if real is None:
+            logger.warning("Only dual numbers and numbers can be written into an array of dual numbers.")
+            raise TypeError
+        self.real[index]=real
+        self.dual[index]=0.0 if dual is None else dual
+        failed=_failed(value)
+        if failed is not None or self._failed is not None:
+            #The mask can be shared with the arrays this array was computed from, so it is copied before it is modified
+            mask=self.failed.copy()
+            mask[index]=False if failed is None else failed
+            self._failed=mask if mask.any() else None
+
+    def __str__(self):
+        """
+        Redefines the readable string form of the class to get the desired output when we use print on the array of dual numbers.
+
+        Returns:
+            String: in the form "DualArray(real=array.real, dual=array.dual)".
+        """
+        string="DualArray(real="+ str(self.real) +", dual="+ str(self.dual)+ ")."
+        return string
+
+    def __array_ufunc__(self,ufunc,method,*inputs,**kwargs):
+        """
+        Implements the NumPy ufunc protocol, so that NumPy functions such as ``np.sin(x)`` or ``np.exp(x)`` are computed together with their derivative.
+
+        Parameters:
+            ufunc: the NumPy ufunc that is called.
+            method: the ufunc method that is called, only "__call__" is supported.
+            inputs: the inputs of the ufunc.
+            kwargs: the keyword arguments of the ufunc, which are not supported.
+
+        Returns:
+            DualArray: the result of the ufunc, or NotImplemented if the ufunc is not supported.
+        """
+        if method!="__call__" or kwargs:
+            return NotImplemented
+        return _apply_ufunc(ufunc,inputs)
+
+    def __array_function__(self,func,types,args,kwargs):
+        """
+        Implements the NumPy function protocol, so that functions such as ``np.sum`` or ``np.dot`` are computed together with their derivative.
+
+        Parameters:
+            func: the NumPy function that is called.
+            types: the types of the arguments that implement the protocol.
+            args: the positional arguments of the function.
+            kwargs: the keyword arguments of the function.
+
+        Returns:
+            Dual number or DualArray: the result of the function, or NotImplemented if the function is not supported.
+        """
+        return _apply_function(func,args,kwargs)
+
+    def _full(self,real,dual,x=None,bad=None):
+        """
+        Builds the result of an operation whose parts may have different shapes, broadcasting both parts to a common shape.
+
+        The failed points of the operands are failed points of the result, as well as the points outside of the domain of the operation,
+        whose real and dual parts are set to NaN.
+
+        Parameters:
+            real: array of the real parts of the result.
+            dual: array of the dual parts of the result.
+            x: the other operand of the operation, if any.
+            bad: array of bools marking the points outside of the domain of the operation, or None.
+
+        Returns:
+            DualArray: the result of the operation.
+        """
+        if np.shape(real)!=np.shape(dual):
+            real,dual=np.broadcast_arrays(real,dual)
+            real,dual=np.array(real,dtype=np.float64),np.array(dual,dtype=np.float64)
+        failed=self._failed
+        if isinstance(x,DualArray) and x._failed is not None:
+            failed=x._failed if failed is None else failed|x._failed
+        if bad is not None:
+            real=np.where(bad,np.nan,real)
+            dual=np.where(bad,np.nan,dual)
+            failed=bad if failed is None else failed|bad
+        if failed is not None and np.shape(failed)!=np.shape(real):
+            failed=np.array(np.broadcast_to(failed,np.shape(real)))
+        return DualArray._new(real,dual,failed)
+
+    def _outputs(self,out,shape=None):
+        """
+        Returns the arrays receiving the real and dual parts of the result of an operation: the parts of out, or two new arrays.
+
+        Parameters:
+            out: the array of dual numbers receiving the result, or None.
+            shape: the shape of the result, by default the shape of the current instance.
+
+        Returns:
+            Tuple: (real, dual) float64 arrays of the shape of the result.
+
+        Raises:
+            Warning: logging warning is triggered when out is not an array of dual numbers of the shape of the result.
+            TypeError: if out is not an array of dual numbers.
+            ValueError: if out does not have the shape of the result.
+        """
+        if shape is None:
+            shape=self.real.shape
+        if out is None:
+            return np.empty(shape),np.empty(shape)
+        if not isinstance(out,DualArray):
+            logger.warning("The output of an operation on arrays of dual numbers has to be an array of dual numbers.")
+            raise TypeError
+        if out.shape!=tuple(shape):
+            logger.warning("The output of an operation on arrays of dual numbers has to have the shape of the result.")
+            raise ValueError
+        return out.real,out.dual
+
+    def _finish(self,real,dual,out,x=None,bad=None):
+        """
+        Completes the result of an operation written into the arrays given by _outputs, as _full does for new arrays.
+
+        The points outside of the domain of the operation are set to NaN in place, and the failed masks are merged.
+
+        Parameters:
+            real: array of the real parts of the result.
+            dual: array of the dual parts of the result.
+            out: the array of dual numbers that received the result, or None.
+            x: the other operand of the operation, if any.
+            bad: array of bools marking the points outside of the domain of the operation, or None.
+
+        Returns:
+            DualArray: out with its failed mask updated, or a new array of dual numbers.
+        """
+        failed=self._failed
+        if isinstance(x,DualArray) and x._failed is not None:
+            failed=x._failed if failed is None else failed|x._failed
+        if bad is not None:
+            np.copyto(real,np.nan,where=bad)
+            np.copyto(dual,np.nan,where=bad)
+            failed=bad if failed is None else failed|bad
+        if failed is not None and np.shape(failed)!=real.shape:
+            failed=np.array(np.broadcast_to(failed,real.shape))
+        if out is None:
+            return DualArray._new(real,dual,failed)
+        #The mask of out may be shared with other arrays, so it is replaced and not modified
+        out._failed=failed
+        return out
+
+    def __add__(self,x):
+        """
+        Redefines the ``+`` operator to adapt it to arrays of dual numbers.
+
+        Parameters:
+            x: the array of dual numbers, dual number, scalar or array to add to the current instance.
+
+        Returns:
+            DualArray: the elementwise result of the addition of the current instance and the parameter.
+        """
+        xr,xd=_split(x)
+        if xr is None:
+            return NotImplemented
+        #if x is a constant
+        if xd is None:
+            return self._full(self.real+xr,self.dual.copy())
+        return self._full(self.real+xr,self.dual+xd,x)
+
+    def __radd__(self,x):
+        """
+        Redefines the reverse ``+`` operator to consider the case of the following operation: scalar or array + array of dual numbers.
+
+        Parameters:
+            x: the scalar or array to add to the current instance.
+
+        Returns:
+            DualArray: the elementwise result of the addition of the parameter and the current instance.
+        """
+        return self + x
+
+    def __iadd__(self,x):
+        """
+        Redefines the ``+=`` operator to add to the array of dual numbers in place, without allocating new arrays.
+
+        Parameters:
+            x: the array of dual numbers, dual number, scalar or array to add, broadcastable to the shape of the current instance.
+
+        Returns:
+            DualArray: the modified current instance after performing the addition.
+
+        Raises:
+            ValueError: if the result does not have the shape of the current instance.
+        """
+        xr,xd=_split(x)
+        if xr is None:
+            return NotImplemented
+        self._check_inplace(xr)
+        np.add(self.real,xr,out=self.real)
+        #if x is a dual number
+        if xd is not None:
+            np.add(self.dual,xd,out=self.dual)
+        return self._finish(self.real,self.dual,self,x)
+
+    def __sub__(self,x):
+        """
+        Redefines the ``-`` operator to adapt it to arrays of dual numbers.
+
+        Parameters:
+            x: the array of dual numbers, dual number, scalar or array to subtract from the current instance.
+
+        Returns:
+            DualArray: the elementwise result of the subtraction of the parameter from the current instance.
+        """
+        xr,xd=_split(x)
+        if xr is None:
+            return NotImplemented
+        #if x is a constant
+        if xd is None:
+            return self._full(self.real-xr,self.dual.copy())
+        return self._full(self.real-xr,self.dual-xd,x)
+
+    def __rsub__(self,x):
+        """
+        Redefines the reverse ``-`` operator to consider the case of the following operation: scalar or array - array of dual numbers.
+
+        Parameters:
+            x: the scalar or array from which the current instance will be subtracted.
+
+        Returns:
+            DualArray: the elementwise result of the subtraction of the current instance from the parameter.
+        """
+        xr,xd=_split(x)
+        if xr is None:
+            return NotImplemented
+        #if x is a constant
+        if xd is None:
+            return self._full(xr-self.real,-self.dual)
+        return self._full(xr-self.real,xd-self.dual,x)
+
+    def __isub__(self,x):
+        """
+        Redefines the ``-=`` operator to subtract from the array of dual numbers in place, without allocating new arrays.
+
+        Parameters:
+            x: the array of dual numbers, dual number, scalar or array to subtract, broadcastable to the shape of the current instance.
+
+        Returns:
+            DualArray: the modified current instance after performing the subtraction.
+
+        Raises:
+            ValueError: if the result does not have the shape of the current instance.
+        """
+        xr,xd=_split(x)
+        if xr is None:
+            return NotImplemented
+        self._check_inplace(xr)
+        np.subtract(self.real,xr,out=self.real)
+        #if x is a dual number
+        if xd is not None:
+            np.subtract(self.dual,xd,out=self.dual)
+        return self._finish(self.real,self.dual,self,x)
+
+    def __mul__(self,x):
+        """
+        Redefines the ``*`` operator to adapt it to arrays of dual numbers.
+
+        Parameters:
+            x: the array of dual numbers, dual number, scalar or array to multiply the current instance with.
+
+        Returns:
+            DualArray: the elementwise result of the multiplication of the current instance and the parameter.
+        """
+        xr,xd=_split(x)
+        if xr is None:
+            return NotImplemented
+        #if x is a constant
+        if xd is None:
+            return self._full(self.real*xr,self.dual*xr)
+        return self._full(self.real*xr,self.real*xd+self.dual*xr,x)
+
+    def __rmul__(self,x):
+        """
+        Redefines the reverse ``*`` operator to consider the case of the following operation: scalar or array * array of dual numbers.
+
+        Parameters:
+            x: the scalar or array to multiply the current instance with.
+
+        Returns:
+            DualArray: the elementwise result of the multiplication of the parameter and the current instance.
+        """
+        return self * x
+
+    def __imul__(self,x):
+        """
+        Redefines the ``*=`` operator to multiply the array of dual numbers in place, with at most one temporary array.
+
+        Parameters:
+            x: the array of dual numbers, dual number, scalar or array to multiply with, broadcastable to the shape of the current instance.
+
+        Returns:
+            DualArray: the modified current instance after performing the multiplication.
+
+        Raises:
+            ValueError: if the result does not have the shape of the current instance.
+        """
+        xr,xd=_split(x)
+        if xr is None:
+            return NotImplemented
+        self._check_inplace(xr)
+        #the term of the dual part of x is computed before the parts of the current instance, which x may share, are modified
+        term=None if xd is None else self.real*xd
+        np.multiply(self.dual,xr,out=self.dual)
+        if term is not None:
+            np.add(self.dual,term,out=self.dual)
+        np.multiply(self.real,xr,out=self.real)
+        return self._finish(self.real,self.dual,self,x)
+
+    def __truediv__(self,x):
+        """
+        Redefines the ``/`` operator to adapt it to arrays of dual numbers.
+
+        Parameters:
+            x: the array of dual numbers, dual number, scalar or array to divide the current instance with.
+
+        Returns:
+            DualArray: the elementwise result of dividing the current instance by the parameter.
+
+        Raises:
+            Warning: logging warning is triggered when division by zero in the real part of a dual number is attempted.
+            ZeroDivisionError: If division by zero is attempted at any point of the array, under the "raise" error policy.
+        """
+        xr,xd=_split(x)
+        if xr is None:
+            return NotImplemented
+        bad=_domain_mask(xr==0,"Division is not defined when the real part of the dual number (denominator) is zero")
+        with _ignore(bad):
+            #if x is a constant
+            if xd is None:
+                return self._full(self.real/xr,self.dual/xr,x,bad)
+            return self._full(self.real/xr,(self.dual*xr-self.real*xd)/(xr**2),x,bad)
+
+    def __rtruediv__(self,x):
+        """
+        Redefines the reverse ``/`` operator to consider the case of the following operation: scalar or array / array of dual numbers.
+
+        Parameters:
+            x: the scalar or array that is the numerator of the division.
+
+        Returns:
+            DualArray: the elementwise result of dividing the parameter by the current instance.
+
+        Raises:
+            Warning: logging warning is triggered when division by zero in the real part of a dual number is attempted.
+            ZeroDivisionError: If division by zero is attempted at any point of the array, under the "raise" error policy.
+        """
+        xr,xd=_split(x)
+        if xr is None:
+            return NotImplemented
+        bad=_domain_mask(self.real==0,"Division is not defined when the real part of the dual number (denominator) is zero")
+        with _ignore(bad):
+            #if x is a constant
+            if xd is None:
+                return self._full(xr/self.real,-(self.dual*xr)/(self.real**2),x,bad)
+            return self._full(xr/self.real,(xd*self.real-xr*self.dual)/(self.real**2),x,bad)
+
+    def __itruediv__(self,x):
+        """
+        Redefines the ``/=`` operator to divide the array of dual numbers in place, with at most one temporary array.
+
+        Parameters:
+            x: the array of dual numbers, dual number, scalar or array to divide with, broadcastable to the shape of the current instance.
+
+        Returns:
+            DualArray: the modified current instance after performing the division.
+
+        Raises:
+            Warning: logging warning is triggered when the real part of the denominator is zero.
+            ZeroDivisionError: Division by zero attempted at any point of the array, under the "raise" error policy.
+            ValueError: if the result does not have the shape of the current instance.
+        """
+        xr,xd=_split(x)
+        if xr is None:
+            return NotImplemented
+        self._check_inplace(xr)
+        bad=_domain_mask(xr==0,"Division is not defined when the real part of the dual number (denominator) is zero")
+        with _ignore(bad):
+            #(d*xr-r*xd)/xr**2 is computed as (d-r*xd/xr)/xr, before the real parts, which x may share, are modified
+            if xd is not None:
+                term=self.real*xd
+                np.divide(term,xr,out=term)
+                np.subtract(self.dual,term,out=self.dual)
+            np.divide(self.dual,xr,out=self.dual)
+            np.divide(self.real,xr,out=self.real)
+        return self._finish(self.real,self.dual,self,x,bad)
+
+    def __floordiv__(self,x):
+        """
+        Redefines the ``//`` operator to adapt it to arrays of dual numbers, with the same logic as Dual.__floordiv__.
+
+        Parameters:
+            x: the array of dual numbers, dual number, scalar or array to divide the current instance with.
+
+        Returns:
+            DualArray: the elementwise result of the floor division of the current instance by the parameter.
+
+        Raises:
+            Warning: logging warning is triggered when division by zero in the real part of a dual number is attempted.
+            ZeroDivisionError: If division by zero is attempted at any point of the array, under the "raise" error policy.
+        """
+        xr,xd=_split(x)
+        if xr is None:
+            return NotImplemented
+        bad=_domain_mask(xr==0,"Floor division of dual numbers is not defined when the real part of the denominator is zero")
+        with _ignore(bad):
+            #if x is a constant
+            if xd is None:
+                return self._full(self.real//xr,self.dual//xr,x,bad)
+            return self._full(self.real//xr,(self.dual*xr-self.real*xd)//(xr**2),x,bad)
+
+    def __rfloordiv__(self,x):
+        """
+        Redefines the reverse ``//`` operator to consider the case of the following operation: scalar or array // array of dual numbers.
+
+        Parameters:
+            x: the scalar or array that is the numerator of the division.
+
+        Returns:
+            DualArray: the elementwise result of the floor division of the parameter by the current instance.
+
+        Raises:
+            Warning: logging warning is triggered when division by zero in the real part of a dual number is attempted.
+            ZeroDivisionError: If division by zero is attempted at any point of the array, under the "raise" error policy.
+        """
+        xr,xd=_split(x)
+        if xr is None:
+            return NotImplemented
+        bad=_domain_mask(self.real==0,"Division is not defined when the real part of the dual number (denominator) is zero")
+        with _ignore(bad):
+            #if x is a constant
+            if xd is None:
+                return self._full(xr//self.real,-(self.dual*xr)//(self.real**2),x,bad)
+            return self._full(xr//self.real,(xd*self.real-xr*self.dual)//(self.real**2),x,bad)
+
+    def __mod__(self,x):
+        """
+        Redefines the ``%`` operator to adapt it to arrays of dual numbers, with the same logic as Dual.__mod__.
+
+        Parameters:
+            x: the array of dual numbers, dual number, scalar or array to compute the modulus with.
+
+        Returns:
+            DualArray: the elementwise result of the modulus operation.
+
+        Raises:
+            Warning: logging warning is triggered when modulus by zero in the real part of a dual number is attempted.
+            ZeroDivisionError: If modulus by zero is attempted at any point of the array.
+        """
+        xr,xd=_split(x)
+        if xr is None:
+            return NotImplemented
+        bad=_domain_mask(xr==0,"Modulus by zero is not defined")
+        with _ignore(bad):
+            #if x is a constant
+            if xd is None:
+                return self._full(self.real%xr,self.dual%xr,x,bad)
+            return self._full(self.real%xr,(self.dual*xr-self.real*xd)%(xr**2),x,bad)
+
+    def __rmod__(self,x):
+        """
+        Redefines the reverse ``%`` operator to consider the case of the following operation: scalar or array % array of dual numbers.
+
+        Parameters:
+            x: the scalar or array to compute the modulus with.
+
+        Returns:
+            DualArray: the elementwise result of the modulus operation.
+
+        Raises:
+            Warning: logging warning is triggered when modulus by zero in the real part of a dual number is attempted.
+            ZeroDivisionError: If modulus by zero is attempted at any point of the array.
+        """
+        xr,xd=_split(x)
+        if xr is None:
+            return NotImplemented
+        bad=_domain_mask(self.real==0,"Modulus by zero is not defined")
+        with _ignore(bad):
+            #if x is a constant
+            if xd is None:
+                return self._full(xr%self.real,-(self.dual*xr)%(self.real**2),x,bad)
+            return self._full(xr%self.real,(xd*self.real-xr*self.dual)%(self.real**2),x,bad)
+
+    def __pow__(self,power):
+        """
+        Redefines the ``**`` operator to adapt it to arrays of dual numbers.
+
+        A constant integer power is computed by repeated squaring, and any other power with np.power, the derivative of u^v being v u^(v-1) du + u^v ln(u) dv.
+
+        Parameters:
+            power: the array of dual numbers, dual number, scalar or array to which we want to raise the current instance.
+
+        Returns:
+            DualArray: the current instance raised elementwise to the power of the input.
+
+        Raises:
+            Warning: logging warning is triggered when the real part of a dual number is zero and the power is negative or has a non nul dual part.
+            ZeroDivisionError: If division by zero is attempted at any point of the array, under the "raise" error policy.
+        """
+        pr,pd=_split(power)
+        if pr is None:
+            return NotImplemented
+        #a dual power with nul dual parts is a constant power
+        if pd is not None and not np.any(pd!=0):
+            pd=None
+        if pd is None and np.ndim(pr)==0 and float(pr).is_integer() and abs(pr)<=_SQUARING_LIMIT:
+            return self._integer_power(int(pr))
+        real,dual,bad=_power(self.real,self.dual,pr,pd)
+        return self._full(real,dual,power,bad)
+
+    def __rpow__(self,x):
+        """
+        Redefines the reverse ``**`` operator to consider the case of the following operation: scalar or array ** array of dual numbers.
+
+        Parameters:
+            x: the dual number, scalar or array raised to the power of the current instance.
+
+        Returns:
+            DualArray: the input raised elementwise to the power of the current instance.
+
+        Raises:
+            Warning: logging warning is triggered when the input is zero and the current instance is negative or has a non nul dual part.
+            ZeroDivisionError: If division by zero is attempted at any point of the array, under the "raise" error policy.
+        """
+        xr,xd=_split(x)
+        if xr is None:
+            return NotImplemented
+        real,dual,bad=_power(xr,xd,self.real,self.dual)
+        return self._full(real,dual,x,bad)
+
+    def __ipow__(self,power):
+        """
+        Redefines the ``**=`` operator to raise the array of dual numbers to a power in place.
+
+        The power is computed as with ``**`` and written into the parts of the current instance, which keeps its arrays, e.g. the buffer of from_buffer.
+
+        Parameters:
+            power: the array of dual numbers, dual number, scalar or array to which we want to raise the current instance.
+
+        Returns:
+            DualArray: the modified current instance after raising it to the power.
+
+        Raises:
+            Warning: logging warning is triggered when the power is negative, or has a non nul dual part, and the real part of a dual number is zero.
+            ZeroDivisionError: Division by zero attempted at any point of the array, under the "raise" error policy.
+            ValueError: if the result does not have the shape of the current instance.
+        """
+        pr,pd=_split(power)
+        if pr is None:
+            return NotImplemented
+        self._check_inplace(pr)
+        result=self**power
+        np.copyto(self.real,result.real)
+        np.copyto(self.dual,result.dual)
+        self._failed=None if result._failed is None else np.array(np.broadcast_to(result._failed,self.real.shape))
+        return self
+
+    def _check_inplace(self,x):
+        """
+        Checks that an in-place operation with an operand of the shape of x keeps the shape of the current instance.
+
+        Raises:
+            Warning: logging warning is triggered when the shape of the result is not the shape of the current instance.
+            ValueError: if the shape of the result is not the shape of the current instance.
+        """
+        try:
+            shape=np.broadcast_shapes(self.real.shape,np.shape(x))
+        except ValueError:
+            shape=None
+        if shape!=self.real.shape:
+            logger.warning("The result of an in-place operation has to have the shape of the array of dual numbers.")
+            raise ValueError
+
+    def _integer_power(self,n):
+        """
+        Raises the array of dual numbers to a constant integer power, computing u^(|n|-1) once by repeated squaring for both parts.
+        """
+        if n==0:
+            return DualArray._new(np.ones(self.real.shape),np.zeros(self.real.shape),self._failed)
+        previous=_repeated_squaring(self.real,abs(n)-1)
+        if n>0:
+            return DualArray._new(previous*self.real,n*previous*self.dual,self._failed)
+        bad=_domain_mask(self.real==0,"Negative power not defined when real part of dual number is zero")
+        with _ignore(bad):
+            real=1/(previous*self.real)
+            return self._full(real,n*real/self.real*self.dual,bad=bad)
+
+    def __neg__(self):
+        """
+        Redefines the ``-`` operator to adapt it to arrays of dual numbers.
+
+        Returns:
+            DualArray: the elementwise negation of the current instance.
+        """
+        return DualArray._new(-self.real,-self.dual,self._failed)
+
+    def __abs__(self):
+        """
+        Redefines the abs function to adapt it to arrays of dual numbers, with the same logic as Dual.__abs__.
+
+        Returns:
+            DualArray: the elementwise absolute value of the current instance.
+        """
+        return DualArray._new(np.abs(self.real),np.abs(self.dual),self._failed)
+
+    def __eq__(self,x):
+        """
+        Redefines the ``==`` operator to adapt it to arrays of dual numbers.
+
+        Parameters:
+            x: the array of dual numbers, dual number, scalar or array to compare the current instance with.
+
+        Returns:
+            Array of bools: True where the current instance and input are equal, False elsewhere.
+        """
+        xr,xd=_split(x)
+        if xr is None:
+            return NotImplemented
+        #if x is a constant
+        if xd is None:
+            return (self.real==xr)&(self.dual==0)
+        return (self.real==xr)&(self.dual==xd)
+
+    def __ne__(self,x):
+        """
+        Redefines the ``!=`` operator to adapt it to arrays of dual numbers.
+
+        Parameters:
+            x: the array of dual numbers, dual number, scalar or array to compare the current instance with.
+
+        Returns:
+            Array of bools: True where the current instance and input are not equal, False elsewhere.
+        """
+        xr,xd=_split(x)
+        if xr is None:
+            return NotImplemented
+        #if x is a constant
+        if xd is None:
+            return (self.real!=xr)|(self.dual!=0)
+        return (self.real!=xr)|(self.dual!=xd)
+
+    def _compare_real(self,x,symbol):
+        """
+        Returns the real parts of the current instance and of the input, warning the user when a dual part is not nul as Dual does.
+
+        Parameters:
+            x: the array of dual numbers, dual number, scalar or array to compare the current instance with.
+            symbol: the comparison operator, used in the warning message.
+
+        Returns:
+            Array: the real part of the input, or None if the input is not supported.
+        """
+        xr,xd=_split(x)
+        if xr is not None and (np.any(self.dual!=0) or (xd is not None and np.any(xd!=0))):
+            logger.warning(symbol+" comparision not defined for dual numbers with non nul dual parts. Return type corresponds to the comparision between the real parts.")
+        return xr
+
+    def __gt__(self,x):
+        """
+        Redefines the ``>`` operator for arrays of dual numbers.
+
+        Returns:
+            Array of bools: Comparasion based on the real parts of the dual numbers.
+
+        Raises:
+            Warning: alerts the user that the ``>`` operator not defined for dual numbers if their dual parts are not nul.
+        """
+        xr=self._compare_real(x,">")
+        if xr is None:
+            return NotImplemented
+        return self.real>xr
+
+    def __ge__(self,x):
+        """
+        Redefines the ``>=`` operator for arrays of dual numbers.
+
+        Returns:
+            Array of bools: Comparasion based on the real parts of the dual numbers.
+
+        Raises:
+            Warning: alerts the user that the ``>=`` operator not defined for dual numbers if their dual parts are not nul.
+        """
+        xr=self._compare_real(x,">=")
+        if xr is None:
+            return NotImplemented
+        return self.real>=xr
+
+    def __lt__(self,x):
+        """
+        Redefines the ``<`` operator for arrays of dual numbers.
+
+        Returns:
+            Array of bools: Comparasion based on the real parts of the dual numbers.
+
+        Raises:
+            Warning: alerts the user that the ``<`` operator not defined for dual numbers if their dual parts are not nul.
+        """
+        xr=self._compare_real(x,"<")
+        if xr is None:
+            return NotImplemented
+        return self.real<xr
+
+    def __le__(self,x):
+        """
+        Redefines the ``<=`` operator for arrays of dual numbers.
+
+        Returns:
+            Array of bools: Comparasion based on the real parts of the dual numbers.
+
+        Raises:
+            Warning: alerts the user that the ``<=`` operator not defined for dual numbers if their dual parts are not nul.
+        """
+        xr=self._compare_real(x,"<=")
+        if xr is None:
+            return NotImplemented
+        return self.real<=xr
+
+    def sin(self,out=None):
+        """
+        Computes the sine function of the array of dual numbers.
+
+        Parameters:
+            out: the array of dual numbers of the same shape receiving the result, e.g. the current instance, or None for a new array.
+
+        Returns:
+            DualArray: the sine of the real parts, and the derivative of the sine multiplied with the dual parts.
+        """
+        real,dual=self._outputs(out)
+        np.multiply(self.dual,np.cos(self.real),out=dual)
+        np.sin(self.real,out=real)
+        return self._finish(real,dual,out)
+
+    def cos(self,out=None):
+        """
+        Computes the cosine function of the array of dual numbers.
+
+        Parameters:
+            out: the array of dual numbers of the same shape receiving the result, e.g. the current instance, or None for a new array.
+
+        Returns:
+            DualArray: the cosine of the real parts, and the derivative of the cosine multiplied with the dual parts.
+        """
+        real,dual=self._outputs(out)
+        sin=np.sin(self.real)
+        np.negative(sin,out=sin)
+        np.multiply(self.dual,sin,out=dual)
+        np.cos(self.real,out=real)
+        return self._finish(real,dual,out)
+
+    def tan(self,out=None):
+        """
+        Computes the tangent function of the array of dual numbers.
+
+        Parameters:
+            out: the array of dual numbers of the same shape receiving the result, e.g. the current instance, or None for a new array.
+
+        Returns:
+            DualArray: the tangent of the real parts, and the derivative of the tangent multiplied with the dual parts.
+
+        Raises:
+            Warning: logging warning is triggered when the cosine of a real part is zero.
+            ZeroDivisionError: Division by zero attempted at any point of the array, under the "raise" error policy.
+        """
+        cos=np.cos(self.real)
+        bad=_domain_mask(np.abs(cos)<=_TAN_TOLERANCE,"Tan can't be defined for this function")
+        real,dual=self._outputs(out)
+        with _ignore(bad):
+            np.multiply(cos,cos,out=cos)
+            np.divide(self.dual,cos,out=dual)
+            np.tan(self.real,out=real)
+        return self._finish(real,dual,out,bad=bad)
+
+    def log(self,out=None):
+        """
+        Computes the logarithm function of the array of dual numbers.
+
+        Parameters:
+            out: the array of dual numbers of the same shape receiving the result, e.g. the current instance, or None for a new array.
+
+        Returns:
+            DualArray: the log of the real parts, and the derivative of the log multiplied with the dual parts.
+
+        Raises:
+            Warning: logging warning is triggered when the real part of a dual number is zero.
+            ZeroDivisionError: Division by zero attempted at any point of the array, under the "raise" error policy.
+        """
+        bad=_domain_mask(self.real==0,"Logarithm of dual number not defined when real part is zero")
+        real,dual=self._outputs(out)
+        with _ignore(bad):
+            np.divide(self.dual,self.real,out=dual)
+            np.log(self.real,out=real)
+        return self._finish(real,dual,out,bad=bad)
+
+    def exp(self,out=None):
+        """
+        Computes the exponential function of the array of dual numbers.
+
+        Parameters:
+            out: the array of dual numbers of the same shape receiving the result, e.g. the current instance, or None for a new array.
+
+        Returns:
+            DualArray: the exp of the real parts, and the derivative of the exp multiplied with the dual parts.
+        """
+        real,dual=self._outputs(out)
+        np.exp(self.real,out=real)
+        np.multiply(real,self.dual,out=dual)
+        return self._finish(real,dual,out)
+
+    def square(self,out=None):
+        """
+        Computes the square of the array of dual numbers.
+
+        Parameters:
+            out: the array of dual numbers of the same shape receiving the result, e.g. the current instance, or None for a new array.
+
+        Returns:
+            DualArray: the square of the real parts, and the derivative of the square multiplied with the dual parts.
+        """
+        real,dual=self._outputs(out)
+        np.multiply(self.real,self.dual,out=dual)
+        np.multiply(dual,2,out=dual)
+        np.square(self.real,out=real)
+        return self._finish(real,dual,out)
+
+    def floor(self,out=None):
+        """
+        Computes the floor of the array of dual numbers, with the same logic as Dual.floor.
+
+        Parameters:
+            out: the array of dual numbers of the same shape receiving the result, e.g. the current instance, or None for a new array.
+
+        Returns:
+            DualArray: the floor of the real parts and the floor of the dual parts.
+        """
+        real,dual=self._outputs(out)
+        np.floor(self.dual,out=dual)
+        np.floor(self.real,out=real)
+        return self._finish(real,dual,out)
+
+    def ceil(self,out=None):
+        """
+        Computes the ceil of the array of dual numbers, with the same logic as Dual.ceil.
+
+        Parameters:
+            out: the array of dual numbers of the same shape receiving the result, e.g. the current instance, or None for a new array.
+
+        Returns:
+            DualArray: the ceil of the real parts and the ceil of the dual parts.
+        """
+        real,dual=self._outputs(out)
+        np.ceil(self.dual,out=dual)
+        np.ceil(self.real,out=real)
+        return self._finish(real,dual,out)
+
+    def inverse(self,out=None):
+        """
+        Computes the inverse of the array of dual numbers.
+
+        Parameters:
+            out: the array of dual numbers of the same shape receiving the result, e.g. the current instance, or None for a new array.
+
+        Returns:
+            DualArray: the inverse of the real parts, and the derivative of the inverse multiplied with the dual parts.
+
+        Raises:
+            Warning: logging warning is triggered when the real part of a dual number is zero.
+            ZeroDivisionError: Division by zero attempted at any point of the array, under the "raise" error policy.
+        """
+        bad=_domain_mask(self.real==0,"Cannot invert this dual number because its real part is nul")
+        real,dual=self._outputs(out)
+        with _ignore(bad):
+            np.divide(self.dual,self.real**2,out=dual)
+            np.negative(dual,out=dual)
+            np.divide(1,self.real,out=real)
+        return self._finish(real,dual,out,bad=bad)
+
+    def sqrt(self,out=None):
+        """
+        Computes the square root of the array of dual numbers.
+
+        Parameters:
+            out: the array of dual numbers of the same shape receiving the result, e.g. the current instance, or None for a new array.
+
+        Returns:
+            DualArray: the square root of the real parts, and the derivative of the square root multiplied with the dual parts.
+
+        Raises:
+            Warning: logging warning is triggered when the real part of a dual number is zero.
+            ZeroDivisionError: Division by zero attempted at any point of the array, under the "raise" error policy.
+        """
+        bad=_domain_mask(self.real==0,"Square root of dual number not differentiable when real part is zero")
+        real,dual=self._outputs(out)
+        with _ignore(bad):
+            np.sqrt(self.real,out=real)
+            np.divide(self.dual,2*real,out=dual)
+        return self._finish(real,dual,out,bad=bad)
+
+    def cbrt(self,out=None):
+        """
+        Computes the cube root of the array of dual numbers.
+
+        Parameters:
+            out: the array of dual numbers of the same shape receiving the result, e.g. the current instance, or None for a new array.
+
+        Returns:
+            DualArray: the cube root of the real parts, and the derivative of the cube root multiplied with the dual parts.
+
+        Raises:
+            Warning: logging warning is triggered when the real part of a dual number is zero.
+            ZeroDivisionError: Division by zero attempted at any point of the array, under the "raise" error policy.
+        """
+        bad=_domain_mask(self.real==0,"Cube root of dual number not differentiable when real part is zero")
+        real,dual=self._outputs(out)
+        with _ignore(bad):
+            np.cbrt(self.real,out=real)
+            np.divide(self.dual,3*real*real,out=dual)
+        return self._finish(real,dual,out,bad=bad)
+
+    def sinh(self,out=None):
+        """
+        Computes the hyperbolic sine of the array of dual numbers.
+
+        Parameters:
+            out: the array of dual numbers of the same shape receiving the result, e.g. the current instance, or None for a new array.
+
+        Returns:
+            DualArray: the hyperbolic sine of the real parts, and the derivative of the hyperbolic sine multiplied with the dual parts.
+        """
+        real,dual=self._outputs(out)
+        np.multiply(self.dual,np.cosh(self.real),out=dual)
+        np.sinh(self.real,out=real)
+        return self._finish(real,dual,out)
+
+    def cosh(self,out=None):
+        """
+        Computes the hyperbolic cosine of the array of dual numbers.
+
+        Parameters:
+            out: the array of dual numbers of the same shape receiving the result, e.g. the current instance, or None for a new array.
+
+        Returns:
+            DualArray: the hyperbolic cosine of the real parts, and the derivative of the hyperbolic cosine multiplied with the dual parts.
+        """
+        real,dual=self._outputs(out)
+        np.multiply(self.dual,np.sinh(self.real),out=dual)
+        np.cosh(self.real,out=real)
+        return self._finish(real,dual,out)
+
+    def tanh(self,out=None):
+        """
+        Computes the hyperbolic tangent of the array of dual numbers.
+
+        Parameters:
+            out: the array of dual numbers of the same shape receiving the result, e.g. the current instance, or None for a new array.
+
+        Returns:
+            DualArray: the hyperbolic tangent of the real parts, and the derivative of the hyperbolic tangent multiplied with the dual parts.
+        """
+        real,dual=self._outputs(out)
+        np.tanh(self.real,out=real)
+        derivative=real*real
+        np.subtract(1,derivative,out=derivative)
+        np.multiply(self.dual,derivative,out=dual)
+        return self._finish(real,dual,out)
+
+    def arcsin(self,out=None):
+        """
+        Computes the inverse sine of the array of dual numbers.
+
+        Parameters:
+            out: the array of dual numbers of the same shape receiving the result, e.g. the current instance, or None for a new array.
+
+        Returns:
+            DualArray: the inverse sine of the real parts, and the derivative of the inverse sine multiplied with the dual parts.
+
+        Raises:
+            Warning: logging warning is triggered when the real part of a dual number is 1 or -1.
+            ZeroDivisionError: Division by zero attempted at any point of the array, under the "raise" error policy.
+        """
+        bad=_domain_mask(np.abs(self.real)==1,"Arcsin of dual number not differentiable when real part is 1 or -1")
+        real,dual=self._outputs(out)
+        with _ignore(bad):
+            np.divide(self.dual,_sqrt_one_minus_square(self.real),out=dual)
+            np.arcsin(self.real,out=real)
+        return self._finish(real,dual,out,bad=bad)
+
+    def arccos(self,out=None):
+        """
+        Computes the inverse cosine of the array of dual numbers.
+
+        Parameters:
+            out: the array of dual numbers of the same shape receiving the result, e.g. the current instance, or None for a new array.
+
+        Returns:
+            DualArray: the inverse cosine of the real parts, and the derivative of the inverse cosine multiplied with the dual parts.
+
+        Raises:
+            Warning: logging warning is triggered when the real part of a dual number is 1 or -1.
+            ZeroDivisionError: Division by zero attempted at any point of the array, under the "raise" error policy.
+        """
+        bad=_domain_mask(np.abs(self.real)==1,"Arccos of dual number not differentiable when real part is 1 or -1")
+        real,dual=self._outputs(out)
+        with _ignore(bad):
+            np.divide(self.dual,_sqrt_one_minus_square(self.real),out=dual)
+            np.negative(dual,out=dual)
+            np.arccos(self.real,out=real)
+        return self._finish(real,dual,out,bad=bad)
+
+    def arctan(self,out=None):
+        """
+        Computes the inverse tangent of the array of dual numbers.
+
+        Parameters:
+            out: the array of dual numbers of the same shape receiving the result, e.g. the current instance, or None for a new array.
+
+        Returns:
+            DualArray: the inverse tangent of the real parts, and the derivative of the inverse tangent multiplied with the dual parts.
+        """
+        real,dual=self._outputs(out)
+        denominator=self.real*self.real
+        np.add(denominator,1,out=denominator)
+        np.divide(self.dual,denominator,out=dual)
+        np.arctan(self.real,out=real)
+        return self._finish(real,dual,out)
+
+    def log1p(self,out=None):
+        """
+        Computes the function log(1+x) of the array of dual numbers.
+
+        Parameters:
+            out: the array of dual numbers of the same shape receiving the result, e.g. the current instance, or None for a new array.
+
+        Returns:
+            DualArray: the log(1+x) of the real parts, and the derivative of the log(1+x) multiplied with the dual parts.
+
+        Raises:
+            Warning: logging warning is triggered when the real part of a dual number is -1.
+            ZeroDivisionError: Division by zero attempted at any point of the array, under the "raise" error policy.
+        """
+        bad=_domain_mask(self.real==-1,"Log1p of dual number not defined when real part is -1")
+        real,dual=self._outputs(out)
+        with _ignore(bad):
+            np.divide(self.dual,1+self.real,out=dual)
+            np.log1p(self.real,out=real)
+        return self._finish(real,dual,out,bad=bad)
+
+    def expm1(self,out=None):
+        """
+        Computes the function exp(x)-1 of the array of dual numbers.
+
+        Parameters:
+            out: the array of dual numbers of the same shape receiving the result, e.g. the current instance, or None for a new array.
+
+        Returns:
+            DualArray: the exp(x)-1 of the real parts, and the derivative of the exp(x)-1 multiplied with the dual parts.
+        """
+        real,dual=self._outputs(out)
+        np.expm1(self.real,out=real)
+        np.multiply(real+1,self.dual,out=dual)
+        return self._finish(real,dual,out)
+
+    def log2(self,out=None):
+        """
+        Computes the base 2 logarithm of the array of dual numbers.
+
+        Parameters:
+            out: the array of dual numbers of the same shape receiving the result, e.g. the current instance, or None for a new array.
+
+        Returns:
+            DualArray: the base 2 logarithm of the real parts, and the derivative of the base 2 logarithm multiplied with the dual parts.
+
+        Raises:
+            Warning: logging warning is triggered when the real part of a dual number is zero.
+            ZeroDivisionError: Division by zero attempted at any point of the array, under the "raise" error policy.
+        """
+        bad=_domain_mask(self.real==0,"Logarithm of dual number not defined when real part is zero")
+        real,dual=self._outputs(out)
+        with _ignore(bad):
+            np.divide(self.dual,self.real*_LN2,out=dual)
+            np.log2(self.real,out=real)
+        return self._finish(real,dual,out,bad=bad)
+
+    def log10(self,out=None):
+        """
+        Computes the base 10 logarithm of the array of dual numbers.
+
+        Parameters:
+            out: the array of dual numbers of the same shape receiving the result, e.g. the current instance, or None for a new array.
+
+        Returns:
+            DualArray: the base 10 logarithm of the real parts, and the derivative of the base 10 logarithm multiplied with the dual parts.
+
+        Raises:
+            Warning: logging warning is triggered when the real part of a dual number is zero.
+            ZeroDivisionError: Division by zero attempted at any point of the array, under the "raise" error policy.
+        """
+        bad=_domain_mask(self.real==0,"Logarithm of dual number not defined when real part is zero")
+        real,dual=self._outputs(out)
+        with _ignore(bad):
+            np.divide(self.dual,self.real*_LN10,out=dual)
+            np.log10(self.real,out=real)
+        return self._finish(real,dual,out,bad=bad)
+
+    def erf(self,out=None):
+        """
+        Computes the error function of the array of dual numbers.
+
+        Parameters:
+            out: the array of dual numbers of the same shape receiving the result, e.g. the current instance, or None for a new array.
+
+        Returns:
+            DualArray: the error function of the real parts, and the derivative of the error function multiplied with the dual parts.
+        """
+        real,dual=self._outputs(out)
+        derivative=self.real*self.real
+        np.negative(derivative,out=derivative)
+        np.exp(derivative,out=derivative)
+        np.multiply(derivative,_TWO_OVER_SQRT_PI,out=derivative)
+        np.multiply(self.dual,derivative,out=dual)
+        real[...]=_erf(self.real)
+        return self._finish(real,dual,out)
+
+    def sigmoid(self,out=None):
+        """
+        Computes the logistic sigmoid 1/(1+exp(-x)) of the array of dual numbers.
+
+        Parameters:
+            out: the array of dual numbers of the same shape receiving the result, e.g. the current instance, or None for a new array.
+
+        Returns:
+            DualArray: the sigmoid of the real parts, and the derivative of the sigmoid multiplied with the dual parts.
+        """
+        real,dual=self._outputs(out)
+        real[...]=_sigmoid(np.exp(-np.abs(self.real)),self.real)
+        derivative=1-real
+        np.multiply(derivative,real,out=derivative)
+        np.multiply(self.dual,derivative,out=dual)
+        return self._finish(real,dual,out)
+
+    def softplus(self,out=None):
+        """
+        Computes the softplus log(1+exp(x)) of the array of dual numbers.
+
+        Parameters:
+            out: the array of dual numbers of the same shape receiving the result, e.g. the current instance, or None for a new array.
+
+        Returns:
+            DualArray: the softplus of the real parts, and the derivative of the softplus multiplied with the dual parts.
+        """
+        real,dual=self._outputs(out)
+        #log(1+exp(x)) = max(x,0)+log(1+exp(-|x|)), whose derivative is the sigmoid
+        e=np.exp(-np.abs(self.real))
+        np.multiply(self.dual,_sigmoid(e,self.real),out=dual)
+        np.maximum(self.real,0,out=real)
+        np.add(real,np.log1p(e,out=e),out=real)
+        return self._finish(real,dual,out)
+
+    def arctan2(self,x,out=None):
+        """
+        Computes the angle of the points (x, y) where y is the current instance, as np.arctan2(y, x).
+
+        Parameters:
+            x: the array of dual numbers, dual number, scalar or array of the second coordinates.
+            out: the array of dual numbers of the shape of the result receiving the result, or None for a new array.
+
+        Returns:
+            DualArray: the arctan2 of the real parts, and (x.real*y.dual-y.real*x.dual)/(x.real**2+y.real**2) as dual parts.
+
+        Raises:
+            Warning: logging warning is triggered when both real parts are zero.
+            ZeroDivisionError: Division by zero attempted at any point of the array, under the "raise" error policy.
+        """
+        xr,xd=_split(x)
+        if xr is None:
+            return NotImplemented
+        r2=xr*xr+self.real*self.real
+        bad=_domain_mask(r2==0,"Arctan2 of dual numbers not defined when both real parts are zero")
+        real,dual=self._outputs(out,np.shape(r2))
+        with _ignore(bad):
+            #if x is a constant
+            if xd is None:
+                numerator=xr*self.dual
+            else:
+                numerator=xr*self.dual-self.real*xd
+            np.divide(numerator,r2,out=dual)
+            np.arctan2(self.real,xr,out=real)
+        return self._finish(real,dual,out,x,bad)
+
+    def _rarctan2(self,y):
+        """
+        Computes np.arctan2(y, x) where x is the current instance and y a dual number or a constant, the reverse of arctan2().
+        """
+        yr,yd=_split(y)
+        if yr is None:
+            return NotImplemented
+        r2=self.real*self.real+yr*yr
+        bad=_domain_mask(r2==0,"Arctan2 of dual numbers not defined when both real parts are zero")
+        with _ignore(bad):
+            #if y is a constant
+            if yd is None:
+                return self._full(np.arctan2(yr,self.real),-yr*self.dual/r2,y,bad)
+            return self._full(np.arctan2(yr,self.real),(self.real*yd-yr*self.dual)/r2,y,bad)
+
+    def hypot(self,x,out=None):
+        """
+        Computes the length of the hypotenuses sqrt(self**2+x**2) without overflow, as np.hypot.
+
+        Parameters:
+            x: the array of dual numbers, dual number, scalar or array of the other sides.
+            out: the array of dual numbers of the shape of the result receiving the result, or None for a new array.
+
+        Returns:
+            DualArray: the hypot of the real parts, and (self.real*self.dual+x.real*x.dual)/hypot as dual parts.
+
+        Raises:
+            Warning: logging warning is triggered when both real parts are zero.
+            ZeroDivisionError: Division by zero attempted at any point of the array, under the "raise" error policy.
+        """
+        xr,xd=_split(x)
+        if xr is None:
+            return NotImplemented
+        hypot=np.hypot(self.real,xr)
+        bad=_domain_mask(hypot==0,"Hypot of dual numbers not differentiable when both real parts are zero")
+        real,dual=self._outputs(out,hypot.shape)
+        with _ignore(bad):
+            #if x is a constant
+            if xd is None:
+                numerator=self.real*self.dual
+            else:
+                numerator=self.real*self.dual+xr*xd
+            np.divide(numerator,hypot,out=dual)
+            real[...]=hypot
+        return self._finish(real,dual,out,x,bad)
+
+
+def _split(x):
+    """
+    Splits an operand of a DualArray operation into its real and dual parts.
+
+    Parameters:
+        x: an array of dual numbers, a dual number, a scalar or an array of numbers.
+
+    Returns:
+        Tuple: (real, dual) where dual is None for constants, or (None, None) if the operand is not supported.
+    """
+    if isinstance(x,DualArray):
+        return x.real,x.dual
+    if isinstance(x,Dual):
+        return x.real,x.dual
+    x=np.asarray(x)
+    if x.dtype.kind not in "biuf":
+        return None,None
+    return x,None
+
+def _shape(shape):
+    """
+    Converts a shape given as an int or a sequence of ints into a tuple, leaving None unchanged.
+    """
+    if shape is None:
+        return None
+    return (operator.index(shape),) if np.ndim(shape)==0 else tuple(operator.index(n) for n in shape)
+
+def _domain_mask(bad,message):
+    """
+    Applies the error policy to the points of an operation outside of its domain.
+
+    Parameters:
+        bad: array of bools marking the points outside of the domain of the operation.
+        message: description of the domain error.
+
+    Returns:
+        Array of bools: the points outside of the domain, or None if there is none.
+
+    Raises:
+        Warning: logging warning is triggered with the message under the "raise" policy.
+        ZeroDivisionError: under the "raise" policy, if any point is outside of the domain.
+    """
+    if not np.any(bad):
+        return None
+    _handle_domain_error(message,logger,int(np.count_nonzero(bad)))
+    return bad
+
+def _ignore(bad):
+    """
+    Returns a context in which NumPy does not warn about the divisions by zero and invalid values of the points outside of the domain of an operation.
+    """
+    if bad is None:
+        return _NO_ERRORS
+    return np.errstate(divide="ignore",invalid="ignore",over="ignore")
+
+#Context used when all the points are inside of the domain of an operation
+_NO_ERRORS=contextlib.nullcontext()
+
+#Largest constant integer power computed by repeated squaring, which takes about 2*log2(n) multiplications
+_SQUARING_LIMIT=64
+
+def _repeated_squaring(x,n):
+    """
+    Computes x**n elementwise for an integer n>=0 with multiplications only, which are faster than np.power.
+    """
+    result=None
+    while n:
+        if n&1:
+            result=x if result is None else result*x
+        n>>=1
+        if n:
+            x=x*x
+    return np.ones(np.shape(x)) if result is None else result
+
+def _power(ur,ud,vr,vd):
+    """
+    Computes u**v for the real and dual parts of u and v, with the derivative v u^(v-1) du + u^v ln(u) dv.
+
+    Parameters:
+        ur, ud: the real and dual parts of the base, ud being None for a constant.
+        vr, vd: the real and dual parts of the power, vd being None for a constant.
+
+    Returns:
+        Tuple: (real, dual, bad) where bad marks the points outside of the domain of the power, or is None.
+    """
+    ur=np.asarray(ur,dtype=np.float64)
+    zero=ur==0
+    if vd is None:
+        bad=_domain_mask(zero&(vr<0),"Negative power not defined when real part of dual number is zero")
+    else:
+        bad=_domain_mask(zero&((vr<0)|(vd!=0)),"Power with a dual exponent not defined when real part of dual number is zero")
+    #the derivative v u^(v-1) du is infinite at u=0 for 0<v<1
+    if ud is not None:
+        fraction=zero&(vr>0)&(vr<1)&(ud!=0)
+        if vd is not None:
+            fraction&=vd==0
+        fraction=_domain_mask(fraction,"Power lower than one not differentiable when real part of dual number is zero")
+        if fraction is not None:
+            bad=fraction if bad is None else bad|fraction
+    has_zero=np.any(zero)
+    with _ignore(bad):
+        real=np.power(ur,vr)
+        dual=0.0
+        if ud is not None:
+            #u^(v-1) is recovered from u^v, the derivative of 0**v being du for v=1 and zero otherwise
+            if has_zero:
+                with np.errstate(divide="ignore",invalid="ignore"):
+                    dual=vr*np.where(zero,np.where(vr==1,1.0,0.0),real/ur)*ud
+            else:
+                dual=vr*(real/ur)*ud
+        if vd is not None:
+            if has_zero:
+                with np.errstate(divide="ignore"):
+                    dual=dual+real*np.where(zero,0.0,np.log(ur))*vd
+            else:
+                dual=dual+real*np.log(ur)*vd
+    return real,dual,bad
+
+def _sqrt_one_minus_square(x):
+    """
+    Returns sqrt(1-x*x), the denominator of the derivatives of arcsin and arccos, in one new array.
+    """
+    a=x*x
+    np.subtract(1,a,out=a)
+    return np.sqrt(a,out=a)
+
+def _sigmoid(e,x):
+    """
+    Returns the sigmoid of x from e=exp(-|x|), which does not overflow on either side of zero.
+    """
+    r=1/(1+e)
+    return np.where(x>=0,r,e*r)
+
+def _lift(x):
+    """
+    Converts a Dual instance into a zero-dimensional DualArray, leaving other objects unchanged.
+    """
+    if isinstance(x,Dual):
+        return DualArray._new(np.array(float(x.real)),np.array(float(x.dual)))
+    return x
+
+def _result(real,dual,failed=None):
+    """
+    Wraps the real and dual parts of the result of a NumPy function, as a Dual if the result is a single number and as a DualArray otherwise.
+    """
+    if np.ndim(real)==0:
+        return Dual(float(real),float(dual))
+    return DualArray._new(np.asarray(real,dtype=np.float64),np.asarray(dual,dtype=np.float64),failed)
+
+def _failed(x):
+    """
+    Returns the mask of the failed points of an operand, or None if it is not a DualArray or none of its points failed.
+    """
+    return x._failed if isinstance(x,DualArray) else None
+
+def _method(name,fallback=None):
+    """
+    Returns a function calling a method of a dual number, which calls the fallback or returns NotImplemented for the classes that do not define the method.
+    """
+    def call(x):
+        method=getattr(x,name,None)
+        if method is not None:
+            return method()
+        return NotImplemented if fallback is None else fallback(x)
+    return call
+
+#NumPy ufuncs of one argument and the function computing them on dual numbers
+_UNARY_UFUNCS={
+    np.negative: operator.neg,
+    np.positive: operator.pos,
+    np.absolute: operator.abs,
+    np.sin: operator.methodcaller("sin"),
+    np.cos: operator.methodcaller("cos"),
+    np.tan: operator.methodcaller("tan"),
+    np.log: operator.methodcaller("log"),
+    np.exp: operator.methodcaller("exp"),
+    np.square: operator.methodcaller("square"),
+    np.floor: operator.methodcaller("floor"),
+    np.ceil: operator.methodcaller("ceil"),
+    np.reciprocal: operator.methodcaller("inverse"),
+    np.sqrt: _method("sqrt",lambda x: x**0.5),
+    np.cbrt: _method("cbrt"),
+    np.sinh: _method("sinh"),
+    np.cosh: _method("cosh"),
+    np.tanh: _method("tanh"),
+    np.arcsin: _method("arcsin"),
+    np.arccos: _method("arccos"),
+    np.arctan: _method("arctan"),
+    np.log1p: _method("log1p"),
+    np.expm1: _method("expm1"),
+    np.log2: _method("log2"),
+    np.log10: _method("log10"),
+}
+
+#scipy.special.erf is a ufunc when scipy is installed
+if isinstance(_erf,np.ufunc):
+    _UNARY_UFUNCS[_erf]=_method("erf")
+
+#NumPy ufuncs of two arguments and the names of the operator and of its reverse operator
+_BINARY_UFUNCS={
+    np.add: ("__add__","__radd__"),
+    np.subtract: ("__sub__","__rsub__"),
+    np.multiply: ("__mul__","__rmul__"),
+    np.true_divide: ("__truediv__","__rtruediv__"),
+    np.floor_divide: ("__floordiv__","__rfloordiv__"),
+    np.remainder: ("__mod__","__rmod__"),
+    np.power: ("__pow__","__rpow__"),
+    np.equal: ("__eq__","__eq__"),
+    np.not_equal: ("__ne__","__ne__"),
+    np.greater: ("__gt__","__lt__"),
+    np.greater_equal: ("__ge__","__le__"),
+    np.less: ("__lt__","__gt__"),
+    np.less_equal: ("__le__","__ge__"),
+    np.arctan2: ("arctan2","_rarctan2"),
+    np.hypot: ("hypot","hypot"),
+}
+
+def _apply_ufunc(ufunc,inputs):
+    """
+    Computes a NumPy ufunc on dual numbers using the operators and functions of their class (Dual, DualArray or MultiDual).
+
+    Parameters:
+        ufunc: the NumPy ufunc that is called.
+        inputs: the inputs of the ufunc, at least one of which is a dual number.
+
+    Returns:
+        Dual number or DualArray: the result of the ufunc, or NotImplemented if the ufunc is not supported.
+    """
+    if ufunc in _UNARY_UFUNCS:
+        return _UNARY_UFUNCS[ufunc](inputs[0])
+    if ufunc not in _BINARY_UFUNCS:
+        return NotImplemented
+    name,reverse_name=_BINARY_UFUNCS[ufunc]
+    a,b=inputs
+    #a dual number combined with a NumPy array gives an array of dual numbers
+    if isinstance(a,np.ndarray) or isinstance(b,np.ndarray):
+        a,b=_lift(a),_lift(b)
+    #the operators are called on the class directly, as ``a + b`` would dispatch back to NumPy for NumPy scalars
+    if isinstance(a,(int,float,np.generic,np.ndarray)) or (isinstance(b,DualArray) and not isinstance(a,DualArray)):
+        a,b,name=b,a,reverse_name
+    #the classes of dual numbers that do not define the method do not support the ufunc
+    method=getattr(type(a),name,None)
+    if method is None:
+        return NotImplemented
+    return method(a,b)
+
+#NumPy functions and the functions computing them on dual numbers
+_FUNCTIONS={}
+
+def _implements(func):
+    """
+    Registers the decorated function as the implementation of a NumPy function for dual numbers.
+    """
+    def decorator(implementation):
+        _FUNCTIONS[func]=implementation
+        return implementation
+    return decorator
+
+def _apply_function(func,args,kwargs):
+    """
+    Computes a NumPy function on dual numbers using the implementations registered with _implements.
+
+    Parameters:
+        func: the NumPy function that is called.
+        args: the positional arguments of the function.
+        kwargs: the keyword arguments of the function.
+
+    Returns:
+        Dual number or DualArray: the result of the function, or NotImplemented if the function is not supported.
+    """
+    if func not in _FUNCTIONS:
+        return NotImplemented
+    return _FUNCTIONS[func](*args,**kwargs)
+
+@_implements(np.sum)
+def _sum(a,axis=None,keepdims=False):
+    """
+    Sums dual numbers: the dual part of a sum is the sum of the dual parts.
+    """
+    a=_lift(a)
+    failed=None if a._failed is None else np.any(a._failed,axis=axis,keepdims=keepdims)
+    return _result(np.sum(a.real,axis=axis,keepdims=keepdims),np.sum(a.dual,axis=axis,keepdims=keepdims),failed)
+
+@_implements(np.mean)
+def _mean(a,axis=None,keepdims=False):
+    """
+    Averages dual numbers: the dual part of a mean is the mean of the dual parts.
+    """
+    a=_lift(a)
+    failed=None if a._failed is None else np.any(a._failed,axis=axis,keepdims=keepdims)
+    return _result(np.mean(a.real,axis=axis,keepdims=keepdims),np.mean(a.dual,axis=axis,keepdims=keepdims),failed)
+
+@_implements(np.dot)
+def _dot(a,b):
+    """
+    Computes the dot product of dual numbers with the product rule: dual(a.b) = a.real . b.dual + a.dual . b.real.
+    """
+    ar,ad=_split(a)
+    br,bd=_split(b)
+    if ar is None or br is None:
+        return NotImplemented
+    real=np.dot(ar,br)
+    #an element of the product failed if it was computed from a failed point
+    failed=None
+    if _failed(a) is not None or _failed(b) is not None:
+        fa=np.zeros(np.shape(ar)) if _failed(a) is None else _failed(a).astype(np.float64)
+        fb=np.zeros(np.shape(br)) if _failed(b) is None else _failed(b).astype(np.float64)
+        failed=(np.dot(fa,np.ones(np.shape(br)))+np.dot(np.ones(np.shape(ar)),fb))>0
+    #if a is a constant
+    if ad is None:
+        return _result(real,np.dot(ar,bd),failed)
+    #if b is a constant
+    if bd is None:
+        return _result(real,np.dot(ad,br),failed)
+    return _result(real,np.dot(ar,bd)+np.dot(ad,br),failed)
+
+@_implements(np.concatenate)
+def _concatenate(arrays,axis=0):
+    """
+    Joins arrays of dual numbers and arrays of constants, whose dual parts are zero.
+    """
+    parts=[_split(_lift(a)) for a in arrays]
+    if any(r is None for r,d in parts):
+        return NotImplemented
+    real=np.concatenate([r for r,d in parts],axis=axis)
+    dual=np.concatenate([np.zeros(np.shape(r)) if d is None else d for r,d in parts],axis=axis)
+    failed=None
+    if any(_failed(a) is not None for a in arrays):
+        failed=np.concatenate([np.zeros(np.shape(r),dtype=bool) if _failed(a) is None else _failed(a) for a,(r,d) in zip(arrays,parts)],axis=axis)
+    return _result(real,dual,failed)
@@ -0,0 +1,115 @@
+# dual_autodiff/errors.py
+
+#Importing dependencies
+import contextlib
+import contextvars
+import logging
+import threading
+from collections import Counter
+
+#Parent logger of the loggers of the modules of the package. The package does not configure logging:
+#without handlers, warnings are printed by the last resort handler of the logging module
+logger=logging.getLogger("dual_autodiff")
+
+#Policies for the domain errors of the operations (division by zero, logarithm of zero, ...)
+_POLICIES=("raise","nan","count")
+#The policy is a context variable, so that each thread and each asyncio task has its own policy
+_policy=contextvars.ContextVar("dual_autodiff_error_policy",default="raise")
+_counts=Counter()
+#Lock of the counts, which are updated by the operations of all the threads
+_counts_lock=threading.Lock()
+
+def set_error_policy(policy):
+    """
+    Sets how the operations of the Dual and DualArray classes handle domain errors, such as a division by a dual number with a zero real part.
+
+    - "raise": a logging warning is triggered and a ZeroDivisionError is raised (the default).
+    - "nan": no warning and no exception, the result is a dual number whose real and dual parts are NaN. For a DualArray,
+      only the points outside of the domain are NaN and they are marked in the `failed` mask of the result.
+    - "count": as "nan", and the error is counted in error_counts(), once per point for a DualArray.
+
+    The policy is set for the current thread or asyncio task only. A new thread starts with the "raise" policy, and an
+    asyncio task starts with the policy of the code that created it.
+
+    Parameters:
+        policy: "raise", "nan" or "count".
+
+    Returns:
+        String: the previous policy.
+
+    Raises:
+        ValueError: if the policy is not supported.
+    """
+    if policy not in _POLICIES:
+        raise ValueError("The error policy has to be one of "+", ".join(_POLICIES))
+    previous=_policy.get()
+    _policy.set(policy)
+    return previous
+
+def get_error_policy():
+    """
+    Returns:
+        String: the policy for domain errors of the current thread or asyncio task.
+    """
+    return _policy.get()
+
+@contextlib.contextmanager
+def error_policy(policy):
+    """
+    Context manager setting the policy for domain errors in a block of code, and restoring the previous policy afterwards.
+
+    Parameters:
+        policy: "raise", "nan" or "count".
+    """
+    previous=set_error_policy(policy)
+    try:
+        yield
+    finally:
+        set_error_policy(previous)
+
+def error_counts():
+    """
+    Returns:
+        Dict: the number of domain errors counted with the "count" policy, by error message.
+    """
+    with _counts_lock:
+        return dict(_counts)
+
+def reset_error_counts():
+    """
+    Sets the number of counted domain errors back to zero.
+    """
+    with _counts_lock:
+        _counts.clear()
+
+def _add_error_counts(counts):
+    """
+    Adds counts of domain errors made elsewhere, e.g. by the operations of a worker process, to the counts of this process.
+
+    Parameters:
+        counts: dict of the number of domain errors by error message, as returned by error_counts().
+    """
+    with _counts_lock:
+        _counts.update(counts)
+
+def _handle_domain_error(message,log,count=1):
+    """
+    Applies the error policy to a domain error. Returns only when the policy is not "raise", the caller then returns a NaN result.
+
+    Parameters:
+        message: description of the error, or None for errors raised without a warning.
+        log: the logger of the module where the error happened.
+        count: the number of points outside of the domain, for the operations on arrays of dual numbers.
+
+    Raises:
+        Warning: logging warning is triggered with the message under the "raise" policy.
+        ZeroDivisionError: under the "raise" policy.
+    """
+    policy=_policy.get()
+    if policy=="raise":
+        if message is not None:
+            log.warning(message)
+        raise ZeroDivisionError
+    if policy=="count":
+        with _counts_lock:
+            _counts[message or "Division by zero"]+=count
@@ -0,0 +1,833 @@
+# dual_autodiff/jet.py
+
+#Importing dependencies
+import numpy as np
+import logging
+from math import factorial
+
+#Logger of the module
+logger=logging.getLogger(__name__)
+
+class Jet:
+    """
+    A class that defines truncated Taylor series (jets) of configurable order, to compute higher order derivatives in one pass.
+
+    A jet of order k stores the Taylor coefficients c_0, ..., c_k of a function around a point, where c_j is the j-th derivative divided by j!.
+    The operations of the Dual class are propagated on the coefficients with the standard O(k^2) recurrences, so the
+    k-th derivative of a function costs one evaluation instead of the 2^k evaluations of nested dual numbers.
+    A jet of order 1 behaves like a Dual instance, and the coefficients may also be arrays to evaluate a batch of points at once.
+
+    Attributes:
+        coefficients: float64 array of shape (order+1, ...) holding the Taylor coefficients of the jet.
+    """
+    def __init__(self,coefficients):
+        """
+        Initializes the jet using its Taylor coefficients.
+
+        Parameters:
+            coefficients: array-like of the Taylor coefficients, the first axis being the order of the coefficient.
+
+        Raises:
+            Warning: logging warning is triggered when an invalid type is provided.
+            TypeError: if `coefficients` is not an array of numbers with at least one dimension.
+        """
+        coefficients=np.asarray(coefficients)
+        if (coefficients.dtype.kind not in "biuf" or coefficients.ndim==0):
+            logger.warning("The coefficients of a jet have to be an array of numbers with at least one dimension.")
+            raise TypeError
+        self.coefficients=np.array(coefficients,dtype=np.float64)
+
+    @classmethod
+    def _new(cls,coefficients):
+        """
+        Builds a jet from a float64 array of coefficients without validating or copying it.
+
+        Parameters:
+            coefficients: array of the Taylor coefficients.
+
+        Returns:
+            Jet: the new jet.
+        """
+        obj=object.__new__(cls)
+        obj.coefficients=coefficients
+        return obj
+
+    @classmethod
+    def variable(cls,x,order):
+        """
+        Creates the independent variable of a function, whose first coefficient is the point and second coefficient is one.
+
+        Parameters:
+            x: the point, or array of points, at which the function is differentiated.
+            order: the highest order of the derivatives to compute.
+
+        Returns:
+            Jet: the jet of the identity function at the point.
+
+        Raises:
+            Warning: logging warning is triggered when the order is not a positive integer.
+            ValueError: if the order is not a positive integer.
+        """
+        if (not isinstance(order,(int,np.integer)) or order<1):
+            logger.warning("The order of a jet has to be a positive integer.")
+            raise ValueError
+        x=np.asarray(x,dtype=np.float64)
+        coefficients=np.zeros((order+1,)+x.shape)
+        coefficients[0]=x
+        coefficients[1]=1
+        return cls._new(coefficients)
+
+    @property
+    def order(self):
+        """
+        Int: the order of the jet, i.e. the number of coefficients minus one.
+        """
+        return len(self.coefficients)-1
+
+    @property
+    def real(self):
+        """
+        Float or array: the value of the function, which is the first coefficient of the jet.
+        """
+        return self.coefficients[0]
+
+    @property
+    def shape(self):
+        """
+        Tuple: the shape of the batch of points of the jet.
+        """
+        return self.coefficients.shape[1:]
+
+    def derivative(self,n):
+        """
+        Computes one derivative of the function from the coefficients of the jet.
+
+        Parameters:
+            n: the order of the derivative, between 0 and the order of the jet.
+
+        Returns:
+            Float or array: the n-th derivative of the function, which is n! times the n-th coefficient.
+        """
+        return self.coefficients[n]*factorial(n)
+
+    def derivatives(self):
+        """
+        Computes all the derivatives of the function from the coefficients of the jet.
+
+        Returns:
+            Array: the derivatives of order 0 to k along the first axis.
+        """
+        factorials=np.array([factorial(j) for j in range(self.order+1)],dtype=np.float64)
+        return self.coefficients*factorials.reshape((-1,)+(1,)*len(self.shape))
+
+    def __getitem__(self,index):
+        """
+        Selects points of a batch of jets.
+
+        Parameters:
+            index: the NumPy index of the points, applied to every coefficient.
+
+        Returns:
+            Jet: the jets of the selected points.
+        """
+        if not isinstance(index,tuple):
+            index=(index,)
+        return Jet._new(self.coefficients[(slice(None),)+index])
+
+    def __str__(self):
+        """
+        Redefines the readable string form of the class to get the desired output when we use print on the jet.
+
+        Returns:
+            String: in the form "Jet(coefficients=jet.coefficients)".
+        """
+        string="Jet(coefficients="+ str(self.coefficients)+ ")."
+        return string
+
+    def __array_ufunc__(self,ufunc,method,*inputs,**kwargs):
+        """
+        Implements the NumPy ufunc protocol, so that NumPy functions such as ``np.sin(x)`` or ``np.exp(x)`` can be applied to jets.
+
+        Parameters:
+            ufunc: the NumPy ufunc that is called.
+            method: the ufunc method that is called, only "__call__" is supported.
+            inputs: the inputs of the ufunc.
+            kwargs: the keyword arguments of the ufunc, which are not supported.
+
+        Returns:
+            Jet: the result of the ufunc, or NotImplemented if the ufunc is not supported.
+        """
+        from .dual_array import _apply_ufunc
+        if method!="__call__" or kwargs:
+            return NotImplemented
+        return _apply_ufunc(ufunc,inputs)
+
+    def _operands(self,x):
+        """
+        Returns the coefficients of the two operands of a binary operation, truncated to the lower order of the two jets.
+
+        Parameters:
+            x: the jet to combine with the current instance.
+
+        Returns:
+            Tuple: the coefficients of the current instance and of the input.
+        """
+        k=min(self.order,x.order)
+        return self.coefficients[:k+1],x.coefficients[:k+1]
+
+    def __add__(self,x):
+        """
+        Redefines the ``+`` operator to adapt it to jets.
+
+        Parameters:
+            x: the jet, scalar or array of numbers to add to the current instance.
+
+        Returns:
+            Jet: the result of the addition of the current instance and the parameter.
+        """
+        #if x is a jet
+        if isinstance(x,Jet):
+            a,b=self._operands(x)
+            return Jet._new(a+b)
+        x=_constant(x)
+        #if x is a constant, only the first coefficient changes
+        if x is not None:
+            c=_shift(self.coefficients,x)
+            c[0]+=x
+            return Jet._new(c)
+        return NotImplemented
+
+    def __radd__(self,x):
+        """
+        Redefines the reverse ``+`` operator to consider the case of the following operation: constant + jet.
+
+        Parameters:
+            x: the scalar or array of numbers to add to the current instance.
+
+        Returns:
+            Jet: the result of the addition of the constant and the current instance.
+        """
+        return self + x
+
+    def __sub__(self,x):
+        """
+        Redefines the ``-`` operator to adapt it to jets.
+
+        Parameters:
+            x: the jet, scalar or array of numbers to subtract from the current instance.
+
+        Returns:
+            Jet: the result of the subtraction of the parameter from the current instance.
+        """
+        #if x is a jet
+        if isinstance(x,Jet):
+            a,b=self._operands(x)
+            return Jet._new(a-b)
+        x=_constant(x)
+        #if x is a constant
+        if x is not None:
+            c=_shift(self.coefficients,x)
+            c[0]-=x
+            return Jet._new(c)
+        return NotImplemented
+
+    def __rsub__(self,x):
+        """
+        Redefines the reverse ``-`` operator to consider the case of the following operation: constant - jet.
+
+        Parameters:
+            x: the scalar or array of numbers from which the current instance will be subtracted.
+
+        Returns:
+            Jet: the result of the subtraction of the current instance from the constant.
+        """
+        return -self + x
+
+    def __mul__(self,x):
+        """
+        Redefines the ``*`` operator to adapt it to jets, with the Cauchy product of the coefficients.
+
+        Parameters:
+            x: the jet, scalar or array of numbers to multiply the current instance with.
+
+        Returns:
+            Jet: the result of the multiplication of the current instance and the parameter.
+        """
+        #if x is a jet
+        if isinstance(x,Jet):
+            a,b=self._operands(x)
+            return Jet._new(_mul(a,b))
+        x=_constant(x)
+        #if x is a constant
+        if x is not None:
+            return Jet._new(self.coefficients*x)
+        return NotImplemented
+
+    def __rmul__(self,x):
+        """
+        Redefines the reverse ``*`` operator to consider the case of the following operation: constant * jet.
+
+        Parameters:
+            x: the scalar or array of numbers to multiply the current instance with.
+
+        Returns:
+            Jet: the result of the multiplication of the constant and the current instance.
+        """
+        return self * x
+
+    def __truediv__(self,x):
+        """
+        Redefines the ``/`` operator to adapt it to jets.
+
+        Parameters:
+            x: the jet, scalar or array of numbers to divide the current instance with.
+
+        Returns:
+            Jet: the result of dividing the current instance by the parameter.
+
+        Raises:
+            Warning: logging warning is triggered when division by a jet with a zero first coefficient is attempted.
+            ZeroDivisionError: If division by zero is attempted.
+        """
+        #if x is a jet
+        if isinstance(x,Jet):
+            if np.any(x.coefficients[0]==0):
+                logger.warning("Division is not defined when the first coefficient of the jet (denominator) is zero")
+                raise ZeroDivisionError
+            a,b=self._operands(x)
+            return Jet._new(_div(a,b))
+        x=_constant(x)
+        #if x is a constant
+        if x is not None:
+            if np.any(x==0):
+                raise ZeroDivisionError
+            return Jet._new(self.coefficients/x)
+        return NotImplemented
+
+    def __rtruediv__(self,x):
+        """
+        Redefines the reverse ``/`` operator to consider the case of the following operation: constant / jet.
+
+        Parameters:
+            x: the scalar or array of numbers that is the numerator of the division.
+
+        Returns:
+            Jet: the result of dividing the constant by the current instance.
+
+        Raises:
+            Warning: logging warning is triggered when division by a jet with a zero first coefficient is attempted.
+            ZeroDivisionError: If division by zero is attempted.
+        """
+        x=_constant(x)
+        if x is None:
+            return NotImplemented
+        return self.inverse()*x
+
+    def __floordiv__(self,x):
+        """
+        Redefines the ``//`` operator to adapt it to jets, with the same logic as Dual.__floordiv__: the floor of each coefficient of the quotient.
+
+        Parameters:
+            x: the jet, scalar or array of numbers to divide the current instance with.
+
+        Returns:
+            Jet: the result of the floor division of the current instance by the parameter.
+
+        Raises:
+            Warning: logging warning is triggered when division by a jet with a zero first coefficient is attempted.
+            ZeroDivisionError: If division by zero is attempted.
+        """
+        #if x is a jet
+        if isinstance(x,Jet):
+            if np.any(x.coefficients[0]==0):
+                logger.warning("Floor division of jets is not defined when the first coefficient of the denominator is zero")
+                raise ZeroDivisionError
+            a,b=self._operands(x)
+            return Jet._new(np.floor(_div(a,b)))
+        x=_constant(x)
+        #if x is a constant
+        if x is not None:
+            if np.any(x==0):
+                raise ZeroDivisionError
+            return Jet._new(self.coefficients//x)
+        return NotImplemented
+
+    def __rfloordiv__(self,x):
+        """
+        Redefines the reverse ``//`` operator to consider the case of the following operation: constant // jet.
+
+        Parameters:
+            x: the scalar or array of numbers that is the numerator of the division.
+
+        Returns:
+            Jet: the result of the floor division of the constant by the current instance.
+
+        Raises:
+            Warning: logging warning is triggered when division by a jet with a zero first coefficient is attempted.
+            ZeroDivisionError: If division by zero is attempted.
+        """
+        x=_constant(x)
+        if x is None:
+            return NotImplemented
+        return Jet._new(np.floor((self.inverse()*x).coefficients))
+
+    def __mod__(self,x):
+        """
+        Redefines the ``%`` operator to adapt it to jets, with the same logic as Dual.__mod__.
+
+        For a jet denominator b, the first coefficient is the modulus of the first coefficients, and the other
+        coefficients of the quotient are scaled by the square of the first coefficient of b and taken modulo that square.
+
+        Parameters:
+            x: the jet, scalar or array of numbers to compute the modulus with.
+
+        Returns:
+            Jet: the result of the modulus operation.
+
+        Raises:
+            Warning: logging warning is triggered when modulus by a jet with a zero first coefficient is attempted.
+            ZeroDivisionError: If modulus by zero is attempted.
+        """
+        #if x is a jet
+        if isinstance(x,Jet):
+            if np.any(x.coefficients[0]==0):
+                logger.warning("Modulus by zero is not defined")
+                raise ZeroDivisionError
+            a,b=self._operands(x)
+            return Jet._new(_mod(a,b))
+        x=_constant(x)
+        #if x is a constant
+        if x is not None:
+            if np.any(x==0):
+                raise ZeroDivisionError
+            return Jet._new(self.coefficients%x)
+        return NotImplemented
+
+    def __rmod__(self,x):
+        """
+        Redefines the reverse ``%`` operator to consider the case of the following operation: constant % jet.
+
+        Parameters:
+            x: the scalar or array of numbers to compute the modulus with.
+
+        Returns:
+            Jet: the result of the modulus operation.
+
+        Raises:
+            Warning: logging warning is triggered when modulus by a jet with a zero first coefficient is attempted.
+            ZeroDivisionError: If modulus by zero is attempted.
+        """
+        x=_constant(x)
+        if x is None:
+            return NotImplemented
+        if np.any(self.coefficients[0]==0):
+            logger.warning("Modulus by zero is not defined")
+            raise ZeroDivisionError
+        a=np.zeros_like(_shift(self.coefficients,x))
+        a[0]=x
+        return Jet._new(_mod(a,self.coefficients))
+
+    def __pow__(self,power):
+        """
+        Redefines the ``**`` operator to adapt it to jets.
+
+        Integer powers of jets with a zero first coefficient are computed by repeated squaring, and the other powers with the recurrence
+        of the Taylor coefficients of x**p.
+
+        Parameters:
+            power: the scalar, or jet whose coefficients after the first are nul, to which we want to raise the current instance.
+
+        Returns:
+            Jet: the current instance raised to the power of the input.
+
+        Raises:
+            Warning: logging warning is triggered when the power is a jet, or if the first coefficient is zero and the power is not a positive integer.
+            TypeError: if the power is a jet with non nul coefficients after the first.
+            ZeroDivisionError: If division by zero is attempted.
+        """
+        if isinstance(power,Jet):
+            #if power is a jet with non nul higher coefficients
+            if np.any(power.coefficients[1:]!=0):
+                logger.warning("The power cant be a jet")
+                raise TypeError
+            power=power.coefficients[0]
+        elif _constant(power) is None:
+            return NotImplemented
+        if np.ndim(power)==0 and power==0:
+            c=np.zeros_like(self.coefficients)
+            c[0]=1
+            return Jet._new(c)
+        a=self.coefficients
+        if np.any(a[0]==0):
+            #at zero the recurrence divides by zero, but nonnegative integer powers are products
+            if np.ndim(power)==0 and float(power).is_integer() and power>0:
+                return Jet._new(_int_pow(a,int(power)))
+            logger.warning("Power of "+str(power)+" not defined when the first coefficient of the jet is zero")
+            raise ZeroDivisionError
+        return Jet._new(_pow(a,power))
+
+    def __rpow__(self,x):
+        """
+        Redefines the reverse ``**`` operator to consider the case of the following operation: scalar ** jet.
+
+        Raises:
+            Warning: logging warning is triggered to alert the user that the power cannot be a jet.
+            TypeError: if the power is a jet.
+        """
+        logger.warning("The power cannot be a jet")
+        raise TypeError
+
+    def __neg__(self):
+        """
+        Redefines the ``-`` operator to adapt it to jets.
+
+        Returns:
+            Jet: the negation of the current instance.
+        """
+        return Jet._new(-self.coefficients)
+
+    def __abs__(self):
+        """
+        Redefines the abs function to adapt it to jets, with the same logic as Dual.__abs__.
+
+        Returns:
+            Jet: the absolute value of each coefficient of the current instance.
+        """
+        return Jet._new(np.abs(self.coefficients))
+
+    def __eq__(self,x):
+        """
+        Redefines the ``==`` operator to adapt it to jets.
+
+        Parameters:
+            x: the jet, scalar or array of numbers to compare the current instance with.
+
+        Returns:
+            Bool or array of bools: True where all the coefficients are equal, False elsewhere.
+        """
+        #if x is a jet
+        if isinstance(x,Jet):
+            if x.order!=self.order:
+                return False
+            return _as_bool(np.all(self.coefficients==x.coefficients,axis=0))
+        x=_constant(x)
+        #if x is a constant
+        if x is not None:
+            return _as_bool((self.coefficients[0]==x)&np.all(self.coefficients[1:]==0,axis=0))
+        return NotImplemented
+
+    def __ne__(self,x):
+        """
+        Redefines the ``!=`` operator to adapt it to jets.
+
+        Parameters:
+            x: the jet, scalar or array of numbers to compare the current instance with.
+
+        Returns:
+            Bool or array of bools: True where the current instance and input are not equal, False elsewhere.
+        """
+        equal=self.__eq__(x)
+        if equal is NotImplemented:
+            return NotImplemented
+        return ~equal if isinstance(equal,np.ndarray) else not equal
+
+    def _compare_real(self,x,symbol):
+        """
+        Returns the first coefficient of the input, warning the user when higher coefficients are not nul as Dual does.
+
+        Parameters:
+            x: the jet, scalar or array of numbers to compare the current instance with.
+            symbol: the comparison operator, used in the warning message.
+
+        Returns:
+            Number or array: the first coefficient of the input, or None if the input is not supported.
+        """
+        if isinstance(x,Jet):
+            xr,non_nul=x.coefficients[0],np.any(x.coefficients[1:])
+        else:
+            xr,non_nul=_constant(x),False
+            if xr is None:
+                return None
+        if non_nul or np.any(self.coefficients[1:]):
+            logger.warning(symbol+" comparision not defined for jets with non nul coefficients after the first. Return type corresponds to the comparision between the first coefficients.")
+        return xr
+
+    def __gt__(self,x):
+        """
+        Redefines the ``>`` operator for jets.
+
+        Returns:
+            Bool or array of bools: Comparasion based on the first coefficients of the jets.
+
+        Raises:
+            Warning: alerts the user that the ``>`` operator not defined for jets if their higher coefficients are not nul.
+        """
+        xr=self._compare_real(x,">")
+        if xr is None:
+            return NotImplemented
+        return self.coefficients[0]>xr
+
+    def __ge__(self,x):
+        """
+        Redefines the ``>=`` operator for jets.
+
+        Returns:
+            Bool or array of bools: Comparasion based on the first coefficients of the jets.
+
+        Raises:
+            Warning: alerts the user that the ``>=`` operator not defined for jets if their higher coefficients are not nul.
+        """
+        xr=self._compare_real(x,">=")
+        if xr is None:
+            return NotImplemented
+        return self.coefficients[0]>=xr
+
+    def __lt__(self,x):
+        """
+        Redefines the ``<`` operator for jets.
+
+        Returns:
+            Bool or array of bools: Comparasion based on the first coefficients of the jets.
+
+        Raises:
+            Warning: alerts the user that the ``<`` operator not defined for jets if their higher coefficients are not nul.
+        """
+        xr=self._compare_real(x,"<")
+        if xr is None:
+            return NotImplemented
+        return self.coefficients[0]<xr
+
+    def __le__(self,x):
+        """
+        Redefines the ``<=`` operator for jets.
+
+        Returns:
+            Bool or array of bools: Comparasion based on the first coefficients of the jets.
+
+        Raises:
+            Warning: alerts the user that the ``<=`` operator not defined for jets if their higher coefficients are not nul.
+        """
+        xr=self._compare_real(x,"<=")
+        if xr is None:
+            return NotImplemented
+        return self.coefficients[0]<=xr
+
+    __hash__=None
+
+    def _sin_cos(self):
+        """
+        Computes the coefficients of the sine and the cosine of the jet together, as each recurrence uses the other.
+
+        Returns:
+            Tuple: the coefficients of the sine and of the cosine.
+        """
+        a=self.coefficients
+        s=np.empty_like(a)
+        c=np.empty_like(a)
+        s[0]=np.sin(a[0])
+        c[0]=np.cos(a[0])
+        for k in range(1,len(a)):
+            #k*a_k for the terms of the recurrence
+            da=_weights(k,a.ndim)*a[1:k+1]
+            s[k]=np.sum(da*c[k-1::-1],axis=0)/k
+            c[k]=-np.sum(da*s[k-1::-1],axis=0)/k
+        return s,c
+
+    def sin(self):
+        """
+        Computes the sine function of the jet.
+
+        Returns:
+            Jet: the Taylor coefficients of the sine of the function.
+        """
+        return Jet._new(self._sin_cos()[0])
+
+    def cos(self):
+        """
+        Computes the cosine function of the jet.
+
+        Returns:
+            Jet: the Taylor coefficients of the cosine of the function.
+        """
+        return Jet._new(self._sin_cos()[1])
+
+    def tan(self):
+        """
+        Computes the tangent function of the jet, as the quotient of its sine and cosine.
+
+        Returns:
+            Jet: the Taylor coefficients of the tangent of the function.
+
+        Raises:
+            Warning: logging warning is triggered when the cosine of the first coefficient is zero.
+            ZeroDivisionError: Division by zero attempted
+        """
+        s,c=self._sin_cos()
+        if (np.any(np.isclose(c[0],0))):
+            logger.warning("Tan can't be defined for this function")
+            raise ZeroDivisionError
+        return Jet._new(_div(s,c))
+
+    def log(self):
+        """
+        Computes the logarithm function of the jet.
+
+        Returns:
+            Jet: the Taylor coefficients of the log of the function.
+
+        Raises:
+            Warning: logging warning is triggered when the first coefficient of the jet is zero.
+            ZeroDivisionError: Division by zero attempted
+        """
+        a=self.coefficients
+        if (np.any(a[0]==0)):
+            logger.warning("Logarithm of jet not defined when the first coefficient is zero")
+            raise ZeroDivisionError
+        y=np.empty_like(a)
+        y[0]=np.log(a[0])
+        for k in range(1,len(a)):
+            #k*y_k=(k*a_k-sum_{i=1}^{k-1} i*y_i*a_{k-i})/a_0
+            y[k]=(a[k]-np.sum(_weights(k-1,a.ndim)*y[1:k]*a[k-1:0:-1],axis=0)/k)/a[0]
+        return Jet._new(y)
+
+    def exp(self):
+        """
+        Computes the exponential function of the jet.
+
+        Returns:
+            Jet: the Taylor coefficients of the exp of the function.
+        """
+        a=self.coefficients
+        y=np.empty_like(a)
+        y[0]=np.exp(a[0])
+        for k in range(1,len(a)):
+            y[k]=np.sum(_weights(k,a.ndim)*a[1:k+1]*y[k-1::-1],axis=0)/k
+        return Jet._new(y)
+
+    def square(self):
+        """
+        Computes the square of the jet.
+
+        Returns:
+            Jet: the Taylor coefficients of the square of the function.
+        """
+        return Jet._new(_mul(self.coefficients,self.coefficients))
+
+    def floor(self):
+        """
+        Computes the floor of the jet, with the same logic as Dual.floor.
+
+        Returns:
+            Jet: the floor of each coefficient of the jet.
+        """
+        return Jet._new(np.floor(self.coefficients))
+
+    def ceil(self):
+        """
+        Computes the ceil of the jet, with the same logic as Dual.ceil.
+
+        Returns:
+            Jet: the ceil of each coefficient of the jet.
+        """
+        return Jet._new(np.ceil(self.coefficients))
+
+    def inverse(self):
+        """
+        Computes the inverse of the jet.
+
+        Returns:
+            Jet: the Taylor coefficients of the inverse of the function.
+
+        Raises:
+            Warning: logging warning is triggered when the first coefficient of the jet is zero.
+            ZeroDivisionError: Division by zero attempted
+        """
+        a=self.coefficients
+        if (np.any(a[0]==0)):
+            logger.warning("Cannot invert this jet because its first coefficient is nul")
+            raise ZeroDivisionError
+        one=np.zeros_like(a)
+        one[0]=1
+        return Jet._new(_div(one,a))
+
+def _constant(x):
+    """
+    Returns a constant operand of a jet operation as a number or a float64 array, or None if it is not supported.
+    """
+    if isinstance(x,(int,float,np.number)):
+        return x
+    if isinstance(x,np.ndarray) and x.dtype.kind in "biuf":
+        return x.astype(np.float64)
+    return None
+
+def _shift(a,x):
+    """
+    Copies the coefficients a, broadcast against a constant x so that x can be added to the first coefficient.
+    """
+    shape=np.broadcast_shapes(a.shape[1:],np.shape(x))
+    return np.broadcast_to(a,a.shape[:1]+shape).astype(np.float64)
+
+def _weights(k,ndim):
+    """
+    Returns the column 1, ..., k shaped to multiply coefficient arrays with ndim dimensions.
+    """
+    return np.arange(1,k+1,dtype=np.float64).reshape((k,)+(1,)*(ndim-1))
+
+def _mul(a,b):
+    """
+    Computes the Cauchy product c_k=sum_{i=0}^{k} a_i*b_{k-i} of two arrays of coefficients.
+    """
+    c=np.empty(np.broadcast_shapes(a.shape,b.shape))
+    for k in range(len(c)):
+        c[k]=np.sum(a[:k+1]*b[k::-1],axis=0)
+    return c
+
+def _div(a,b):
+    """
+    Computes the coefficients of the quotient q of two arrays of coefficients, from a_k=sum_{i=0}^{k} b_i*q_{k-i}.
+    """
+    q=np.empty(np.broadcast_shapes(a.shape,b.shape))
+    q[0]=a[0]/b[0]
+    for k in range(1,len(q)):
+        q[k]=(a[k]-np.sum(b[1:k+1]*q[k-1::-1],axis=0))/b[0]
+    return q
+
+def _mod(a,b):
+    """
+    Computes the coefficients of a % b with the logic of Dual.__mod__, for two arrays of coefficients.
+    """
+    q=_div(a,b)
+    scale=b[0]**2
+    q[0]=a[0]%b[0]
+    q[1:]=(q[1:]*scale)%scale
+    return q
+
+def _pow(a,p):
+    """
+    Computes the coefficients of a**p with the recurrence k*a_0*y_k=sum_{i=1}^{k} ((p+1)*i-k)*a_i*y_{k-i}, for a_0 different from zero.
+    """
+    y=np.empty(np.broadcast_shapes(a.shape,(1,)+np.shape(p)))
+    y[0]=a[0]**p
+    for k in range(1,len(y)):
+        w=(p+1)*_weights(k,y.ndim)-k
+        y[k]=np.sum(w*a[1:k+1]*y[k-1::-1],axis=0)/(k*a[0])
+    return y
+
+def _int_pow(a,n):
+    """
+    Computes the coefficients of a**n for a positive integer n by repeated squaring.
+    """
+    result=None
+    while n:
+        if n&1:
+            result=a if result is None else _mul(result,a)
+        n>>=1
+        if n:
+            a=_mul(a,a)
+    return result.copy()
+
+def _as_bool(mask):
+    """
+    Converts the result of a comparison of single jets into a bool, leaving the results of batches of jets as arrays.
+    """
+    return bool(mask) if np.ndim(mask)==0 else mask
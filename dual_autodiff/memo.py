@@ -0,0 +1,124 @@
+# dual_autodiff/memo.py
+
+#Importing dependencies
+import functools
+import hashlib
+import threading
+from collections import OrderedDict, namedtuple
+
+import numpy as np
+
+from .dual import Dual
+from .dual_array import DualArray
+
+#Statistics of the cache of a memoized function, as functools.lru_cache reports them
+CacheInfo=namedtuple("CacheInfo",["hits","misses","maxsize","currsize"])
+
+def memoize(function=None,maxsize=128):
+    """
+    Decorator caching the results of a pure function of dual numbers, with a bounded least recently used eviction.
+
+    The key of a call is built from the values of its arguments at the time of the call: a Dual is keyed on its
+    (real, dual) parts, and a DualArray or a NumPy array on a fingerprint of its shape and of the bytes of its parts.
+    Modifying a dual number in place after a call therefore does not change the cached entry. As with functools.lru_cache,
+    the cached result is returned itself, and must not be modified in place by the caller. The cache can be used from several
+    threads: it is updated under a lock, and the function itself is called without the lock, so two threads calling it with
+    the same new arguments may both evaluate it.
+
+    The decorated function has the following methods:
+        cache_info(): returns a CacheInfo of the number of hits and misses, the maximum size and the current size of the cache.
+        cache_clear(): removes all the entries and resets the statistics.
+        invalidate(*args, **kwargs): removes the entry of one call, returning True if it was cached.
+
+    Parameters:
+        function: the function to memoize, when the decorator is used without arguments.
+        maxsize: the largest number of cached results, or None for an unbounded cache.
+
+    Returns:
+        Function: the memoized function, or the decorator if function is not given.
+
+    Raises:
+        TypeError: when the memoized function is called with an argument that is neither hashable nor an array.
+    """
+    if function is None:
+        return functools.partial(memoize,maxsize=maxsize)
+    cache=OrderedDict()
+    stats=[0,0]
+    lock=threading.Lock()
+
+    @functools.wraps(function)
+    def wrapper(*args,**kwargs):
+        key=_key(args,kwargs)
+        with lock:
+            if key in cache:
+                cache.move_to_end(key)
+                stats[0]+=1
+                return cache[key]
+            stats[1]+=1
+        result=function(*args,**kwargs)
+        with lock:
+            cache[key]=result
+            if maxsize is not None and len(cache)>maxsize:
+                cache.popitem(last=False)
+        return result
+
+    def cache_info():
+        with lock:
+            return CacheInfo(stats[0],stats[1],maxsize,len(cache))
+
+    def cache_clear():
+        with lock:
+            cache.clear()
+            stats[0]=stats[1]=0
+
+    def invalidate(*args,**kwargs):
+        key=_key(args,kwargs)
+        with lock:
+            if key in cache:
+                del cache[key]
+                return True
+            return False
+
+    wrapper.cache_info=cache_info
+    wrapper.cache_clear=cache_clear
+    wrapper.invalidate=invalidate
+    return wrapper
+
+#Marker separating the positional arguments from the keyword arguments in a key
+_KWARGS=object()
+
+def _key(args,kwargs):
+    """
+    Builds the hashable key of a call from its positional and keyword arguments.
+    """
+    key=tuple(_fingerprint(a) for a in args)
+    if kwargs:
+        key+=(_KWARGS,)+tuple((name,_fingerprint(value)) for name,value in sorted(kwargs.items()))
+    return key
+
+def _fingerprint(x):
+    """
+    Returns a hashable snapshot of the value of an argument.
+
+    Parameters:
+        x: a dual number, an array of dual numbers, a NumPy array or any hashable object.
+
+    Returns:
+        Tuple or object: the tagged parts of a dual number, the tagged digest of an array, or the argument itself.
+    """
+    if isinstance(x,Dual):
+        return ("Dual",x.real,x.dual)
+    if isinstance(x,DualArray):
+        return ("DualArray",x.shape,_digest(x.real,x.dual,x.failed))
+    if isinstance(x,np.ndarray):
+        return ("ndarray",x.shape,x.dtype.str,_digest(x))
+    return x
+
+def _digest(*arrays):
+    """
+    Returns a 128-bit digest of the bytes of arrays, read in place when they are contiguous.
+    """
+    digest=hashlib.blake2b(digest_size=16)
+    for a in arrays:
+        digest.update(np.ascontiguousarray(a))
+    return digest.digest()
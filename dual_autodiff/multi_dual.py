@@ -0,0 +1,623 @@
+# dual_autodiff/multi_dual.py
+
+#Importing dependencies
+import numpy as np
+import logging
+
+#Logger of the module
+logger=logging.getLogger(__name__)
+
+class MultiDual:
+    """
+    A class that defines dual numbers whose dual part is a vector, and performs the operations of the Dual class on them.
+
+    Each component of the dual part carries the derivative along one input direction, so seeding n inputs with the
+    rows of the identity matrix gives the full gradient of a function of n inputs in one forward pass.
+
+    Attributes:
+        real: real part of the number.
+        dual: 1-D float64 array holding the dual part of the number.
+    """
+    def __init__(self,real,dual):
+        """
+        Initializes the multi-component dual number using its real and dual parts.
+
+        Parameters:
+            real: real part of the number.
+            dual: array-like of the components of the dual part.
+
+        Raises:
+            Warning: logging warning is triggered when an invalid type is provided.
+            TypeError: if `real` is not a number or `dual` is not a 1-D array of numbers.
+        """
+        dual=np.asarray(dual)
+        if (not isinstance(real,(int,float,np.number)) or dual.dtype.kind not in "biuf" or dual.ndim!=1):
+            logger.warning("Real part has to be a number and Dual part a 1-D array of numbers.")
+            raise TypeError
+        self.real=float(real)
+        self.dual=np.array(dual,dtype=np.float64)
+
+    @classmethod
+    def _new(cls,real,dual):
+        """
+        Builds a multi-component dual number from a float and a float64 array without validating or copying them.
+
+        Parameters:
+            real: real part of the number.
+            dual: array of the dual part of the number.
+
+        Returns:
+            MultiDual: the new multi-component dual number.
+        """
+        obj=object.__new__(cls)
+        obj.real=real
+        obj.dual=dual
+        return obj
+
+    @classmethod
+    def variables(cls,values):
+        """
+        Creates the independent variables of a function of n inputs, seeded with the rows of the identity matrix.
+
+        Parameters:
+            values: the n values at which the inputs are evaluated.
+
+        Returns:
+            List: n multi-component dual numbers, the i-th one having a dual part equal to the i-th unit vector.
+        """
+        values=[float(v) for v in values]
+        seeds=np.eye(len(values))
+        return [cls._new(v,seeds[i]) for i,v in enumerate(values)]
+
+    @property
+    def gradient(self):
+        """
+        Array: the dual part of the number, which is the gradient when the inputs were created with variables().
+        """
+        return self.dual
+
+    def __str__(self):
+        """
+        Redefines the readable string form of the class to get the desired output when we use print on the number.
+
+        Returns:
+            String: in the form "MultiDual(real=number.real, dual=number.dual)".
+        """
+        string="MultiDual(real="+ str(self.real) +", dual="+ str(self.dual)+ ")."
+        return string
+
+    def __array_ufunc__(self,ufunc,method,*inputs,**kwargs):
+        """
+        Implements the NumPy ufunc protocol, so that NumPy functions such as ``np.sin(x)`` or ``np.exp(x)`` can be applied to multi-component dual numbers.
+
+        Parameters:
+            ufunc: the NumPy ufunc that is called.
+            method: the ufunc method that is called, only "__call__" is supported.
+            inputs: the inputs of the ufunc.
+            kwargs: the keyword arguments of the ufunc, which are not supported.
+
+        Returns:
+            MultiDual: the result of the ufunc, or NotImplemented if the ufunc is not supported.
+        """
+        from .dual_array import _apply_ufunc
+        if method!="__call__" or kwargs:
+            return NotImplemented
+        return _apply_ufunc(ufunc,inputs)
+
+    def __add__(self,x):
+        """
+        Redefines the ``+`` operator to adapt it to multi-component dual numbers.
+
+        Parameters:
+            x: the multi-component dual number or scalar to add to the current instance.
+
+        Returns:
+            MultiDual: the result of the addition of the current instance and the parameter.
+        """
+        #if x is a multi-component dual number
+        if isinstance(x,MultiDual):
+            return MultiDual._new(self.real+x.real,self.dual+x.dual)
+        #if x is a scalar
+        elif isinstance(x,_SCALARS):
+            return MultiDual._new(self.real+x,self.dual.copy())
+        return NotImplemented
+
+    def __radd__(self,x):
+        """
+        Redefines the reverse ``+`` operator to consider the case of the following operation: scalar + multi-component dual number.
+
+        Parameters:
+            x: the scalar to add to the current instance.
+
+        Returns:
+            MultiDual: the result of the addition of the scalar and the current instance.
+        """
+        return self + x
+
+    def __sub__(self,x):
+        """
+        Redefines the ``-`` operator to adapt it to multi-component dual numbers.
+
+        Parameters:
+            x: the multi-component dual number or scalar to subtract from the current instance.
+
+        Returns:
+            MultiDual: the result of the subtraction of the parameter from the current instance.
+        """
+        #if x is a multi-component dual number
+        if isinstance(x,MultiDual):
+            return MultiDual._new(self.real-x.real,self.dual-x.dual)
+        #if x is a scalar
+        elif isinstance(x,_SCALARS):
+            return MultiDual._new(self.real-x,self.dual.copy())
+        return NotImplemented
+
+    def __rsub__(self,x):
+        """
+        Redefines the reverse ``-`` operator to consider the case of the following operation: scalar - multi-component dual number.
+
+        Parameters:
+            x: the scalar from which the current instance will be subtracted.
+
+        Returns:
+            MultiDual: the result of the subtraction of the current instance from the scalar.
+        """
+        if not isinstance(x,_SCALARS):
+            return NotImplemented
+        return MultiDual._new(x-self.real,-self.dual)
+
+    def __mul__(self,x):
+        """
+        Redefines the ``*`` operator to adapt it to multi-component dual numbers.
+
+        Parameters:
+            x: the multi-component dual number or scalar to multiply the current instance with.
+
+        Returns:
+            MultiDual: the result of the multiplication of the current instance and the parameter.
+        """
+        #if x is a multi-component dual number
+        if isinstance(x,MultiDual):
+            return MultiDual._new(self.real*x.real,self.real*x.dual+x.real*self.dual)
+        #if x is a scalar
+        elif isinstance(x,_SCALARS):
+            return MultiDual._new(self.real*x,self.dual*x)
+        return NotImplemented
+
+    def __rmul__(self,x):
+        """
+        Redefines the reverse ``*`` operator to consider the case of the following operation: scalar * multi-component dual number.
+
+        Parameters:
+            x: the scalar to multiply the current instance with.
+
+        Returns:
+            MultiDual: the result of the multiplication of the scalar and the current instance.
+        """
+        return self * x
+
+    def __truediv__(self,x):
+        """
+        Redefines the ``/`` operator to adapt it to multi-component dual numbers.
+
+        Parameters:
+            x: the multi-component dual number or scalar to divide the current instance with.
+
+        Returns:
+            MultiDual: the result of dividing the current instance by the parameter.
+
+        Raises:
+            Warning: logging warning is triggered when division by zero in the real part of a dual number is attempted.
+            ZeroDivisionError: If division by zero is attempted.
+        """
+        #if x is a multi-component dual number
+        if isinstance(x,MultiDual):
+            if (x.real==0):
+                logger.warning("Division is not defined when the real part of the dual number (denominator) is zero")
+                raise ZeroDivisionError
+            return MultiDual._new(self.real/x.real,(self.dual*x.real-self.real*x.dual)/(x.real**2))
+        #if x is a scalar
+        elif isinstance(x,_SCALARS):
+            if (x==0):
+                raise ZeroDivisionError
+            return MultiDual._new(self.real/x,self.dual/x)
+        return NotImplemented
+
+    def __rtruediv__(self,x):
+        """
+        Redefines the reverse ``/`` operator to consider the case of the following operation: scalar / multi-component dual number.
+
+        Parameters:
+            x: the scalar that is the numerator of the division.
+
+        Returns:
+            MultiDual: the result of dividing the scalar by the current instance.
+
+        Raises:
+            Warning: logging warning is triggered when division by zero in the real part of a dual number is attempted.
+            ZeroDivisionError: If division by zero is attempted.
+        """
+        if not isinstance(x,_SCALARS):
+            return NotImplemented
+        if (self.real==0):
+            logger.warning("Division is not defined when the real part of the dual number (denominator) is zero")
+            raise ZeroDivisionError
+        return MultiDual._new(x/self.real,-(self.dual*x)/(self.real**2))
+
+    def __floordiv__(self,x):
+        """
+        Redefines the ``//`` operator to adapt it to multi-component dual numbers, with the same logic as Dual.__floordiv__.
+
+        Parameters:
+            x: the multi-component dual number or scalar to divide the current instance with.
+
+        Returns:
+            MultiDual: the result of the floor division of the current instance by the parameter.
+
+        Raises:
+            Warning: logging warning is triggered when division by zero in the real part of a dual number is attempted.
+            ZeroDivisionError: If division by zero is attempted.
+        """
+        #if x is a multi-component dual number
+        if isinstance(x,MultiDual):
+            if (x.real==0):
+                logger.warning("Floor division of dual numbers is not defined when the real part of the denominator is zero")
+                raise ZeroDivisionError
+            return MultiDual._new(self.real//x.real,(self.dual*x.real-self.real*x.dual)//(x.real**2))
+        #if x is a scalar
+        elif isinstance(x,_SCALARS):
+            if (x==0):
+                raise ZeroDivisionError
+            return MultiDual._new(self.real//x,self.dual//x)
+        return NotImplemented
+
+    def __rfloordiv__(self,x):
+        """
+        Redefines the reverse ``//`` operator to consider the case of the following operation: scalar // multi-component dual number.
+
+        Parameters:
+            x: the scalar that is the numerator of the division.
+
+        Returns:
+            MultiDual: the result of the floor division of the scalar by the current instance.
+
+        Raises:
+            Warning: logging warning is triggered when division by zero in the real part of a dual number is attempted.
+            ZeroDivisionError: If division by zero is attempted.
+        """
+        if not isinstance(x,_SCALARS):
+            return NotImplemented
+        if (self.real==0):
+            logger.warning("Division is not defined when the real part of the dual number (denominator) is zero")
+            raise ZeroDivisionError
+        return MultiDual._new(x//self.real,-(self.dual*x)//(self.real**2))
+
+    def __mod__(self,x):
+        """
+        Redefines the ``%`` operator to adapt it to multi-component dual numbers, with the same logic as Dual.__mod__.
+
+        Parameters:
+            x: the multi-component dual number or scalar to compute the modulus with.
+
+        Returns:
+            MultiDual: the result of the modulus operation.
+
+        Raises:
+            Warning: logging warning is triggered when modulus by zero in the real part of a dual number is attempted.
+            ZeroDivisionError: If modulus by zero is attempted.
+        """
+        #if x is a multi-component dual number
+        if isinstance(x,MultiDual):
+            if (x.real==0):
+                logger.warning("Modulus by zero is not defined")
+                raise ZeroDivisionError
+            return MultiDual._new(self.real%x.real,(self.dual*x.real-self.real*x.dual)%(x.real**2))
+        #if x is a scalar
+        elif isinstance(x,_SCALARS):
+            if (x==0):
+                raise ZeroDivisionError
+            return MultiDual._new(self.real%x,self.dual%x)
+        return NotImplemented
+
+    def __rmod__(self,x):
+        """
+        Redefines the reverse ``%`` operator to consider the case of the following operation: scalar % multi-component dual number.
+
+        Parameters:
+            x: the scalar to compute the modulus with.
+
+        Returns:
+            MultiDual: the result of the modulus operation.
+
+        Raises:
+            Warning: logging warning is triggered when modulus by zero in the real part of a dual number is attempted.
+            ZeroDivisionError: If modulus by zero is attempted.
+        """
+        if not isinstance(x,_SCALARS):
+            return NotImplemented
+        if (self.real==0):
+            logger.warning("Modulus by zero is not defined")
+            raise ZeroDivisionError
+        return MultiDual._new(x%self.real,-(self.dual*x)%(self.real**2))
+
+    def __pow__(self,power):
+        """
+        Redefines the ``**`` operator to adapt it to multi-component dual numbers.
+
+        Parameters:
+            power: the scalar, or multi-component dual number with a nul dual part, to which we want to raise the current instance.
+
+        Returns:
+            MultiDual: the current instance raised to the power of the input.
+
+        Raises:
+            Warning: logging warning is triggered when the power is a dual number or if the power is -1 and the real part of the dual number is zero.
+            TypeError: if the power is a dual number with a non nul dual part.
+            ZeroDivisionError: If division by zero is attempted.
+        """
+        if isinstance(power,MultiDual):
+            #if power is a dual number with a non nul dual part
+            if np.any(power.dual!=0):
+                logger.warning("The power cant be a dual number")
+                raise TypeError
+            power=power.real
+        elif not isinstance(power,_SCALARS):
+            return NotImplemented
+        if self.real==0 and power==-1:
+            logger.warning("Power of -1 not defined when real part of dual number is zero")
+            raise ZeroDivisionError
+        if power==0:
+            return MultiDual._new(1.0,np.zeros_like(self.dual))
+        return MultiDual._new(self.real**power,(power*self.real**(power-1))*self.dual)
+
+    def __rpow__(self,x):
+        """
+        Redefines the reverse ``**`` operator to consider the case of the following operation: scalar ** multi-component dual number.
+
+        Raises:
+            Warning: logging warning is triggered to alert the user that the power cannot be a dual number.
+            TypeError: if the power is a dual number.
+        """
+        logger.warning("The power cannot be a dual number")
+        raise TypeError
+
+    def __neg__(self):
+        """
+        Redefines the ``-`` operator to adapt it to multi-component dual numbers.
+
+        Returns:
+            MultiDual: the negation of the current instance.
+        """
+        return MultiDual._new(-self.real,-self.dual)
+
+    def __abs__(self):
+        """
+        Redefines the abs function to adapt it to multi-component dual numbers, with the same logic as Dual.__abs__.
+
+        Returns:
+            MultiDual: the absolute value of the current instance.
+        """
+        return MultiDual._new(abs(self.real),np.abs(self.dual))
+
+    def __eq__(self,x):
+        """
+        Redefines the ``==`` operator to adapt it to multi-component dual numbers.
+
+        Parameters:
+            x: the multi-component dual number or scalar to compare the current instance with.
+
+        Returns:
+            Bool:   True if the current instance and input are equal
+                    False if the current instance and input are not equal
+        """
+        #if x is a multi-component dual number
+        if isinstance(x,MultiDual):
+            return (self.real==x.real) and bool(np.all(self.dual==x.dual))
+        #if x is a scalar
+        elif isinstance(x,_SCALARS):
+            return (self.real==x) and not np.any(self.dual)
+        return NotImplemented
+
+    def __ne__(self,x):
+        """
+        Redefines the ``!=`` operator to adapt it to multi-component dual numbers.
+
+        Parameters:
+            x: the multi-component dual number or scalar to compare the current instance with.
+
+        Returns:
+            Bool:   True if the current instance and input are not equal
+                    False if the current instance and input are equal
+        """
+        equal=self.__eq__(x)
+        if equal is NotImplemented:
+            return NotImplemented
+        return not equal
+
+    def _compare_real(self,x,symbol):
+        """
+        Returns the real part of the input, warning the user when a dual part is not nul as Dual does.
+
+        Parameters:
+            x: the multi-component dual number or scalar to compare the current instance with.
+            symbol: the comparison operator, used in the warning message.
+
+        Returns:
+            Number: the real part of the input, or None if the input is not supported.
+        """
+        if isinstance(x,MultiDual):
+            xr,non_nul=x.real,np.any(x.dual)
+        elif isinstance(x,_SCALARS):
+            xr,non_nul=x,False
+        else:
+            return None
+        if non_nul or np.any(self.dual):
+            logger.warning(symbol+" comparision not defined for dual numbers with non nul dual parts. Return type corresponds to the comparision between the real parts.")
+        return xr
+
+    def __gt__(self,x):
+        """
+        Redefines the ``>`` operator for multi-component dual numbers.
+
+        Returns:
+            Bool: Comparasion based on the real parts of the numbers.
+
+        Raises:
+            Warning: alerts the user that the ``>`` operator not defined for dual numbers if their dual parts are not nul.
+        """
+        xr=self._compare_real(x,">")
+        if xr is None:
+            return NotImplemented
+        return self.real>xr
+
+    def __ge__(self,x):
+        """
+        Redefines the ``>=`` operator for multi-component dual numbers.
+
+        Returns:
+            Bool: Comparasion based on the real parts of the numbers.
+
+        Raises:
+            Warning: alerts the user that the ``>=`` operator not defined for dual numbers if their dual parts are not nul.
+        """
+        xr=self._compare_real(x,">=")
+        if xr is None:
+            return NotImplemented
+        return self.real>=xr
+
+    def __lt__(self,x):
+        """
+        Redefines the ``<`` operator for multi-component dual numbers.
+
+        Returns:
+            Bool: Comparasion based on the real parts of the numbers.
+
+        Raises:
+            Warning: alerts the user that the ``<`` operator not defined for dual numbers if their dual parts are not nul.
+        """
+        xr=self._compare_real(x,"<")
+        if xr is None:
+            return NotImplemented
+        return self.real<xr
+
+    def __le__(self,x):
+        """
+        Redefines the ``<=`` operator for multi-component dual numbers.
+
+        Returns:
+            Bool: Comparasion based on the real parts of the numbers.
+
+        Raises:
+            Warning: alerts the user that the ``<=`` operator not defined for dual numbers if their dual parts are not nul.
+        """
+        xr=self._compare_real(x,"<=")
+        if xr is None:
+            return NotImplemented
+        return self.real<=xr
+
+    def sin(self):
+        """
+        Computes the sine function of the multi-component dual number.
+
+        Returns:
+            MultiDual: the sine of the real part, and the derivative of the sine multiplied with each component of the dual part.
+        """
+        return MultiDual._new(np.sin(self.real),self.dual*np.cos(self.real))
+
+    def cos(self):
+        """
+        Computes the cosine function of the multi-component dual number.
+
+        Returns:
+            MultiDual: the cosine of the real part, and the derivative of the cosine multiplied with each component of the dual part.
+        """
+        return MultiDual._new(np.cos(self.real),self.dual*-np.sin(self.real))
+
+    def tan(self):
+        """
+        Computes the tangent function of the multi-component dual number.
+
+        Returns:
+            MultiDual: the tangent of the real part, and the derivative of the tangent multiplied with each component of the dual part.
+
+        Raises:
+            Warning: logging warning is triggered when the cosine of the real part is zero.
+            ZeroDivisionError: Division by zero attempted
+        """
+        cos=np.cos(self.real)
+        if (np.isclose(cos,0)):
+            logger.warning("Tan can't be defined for this function")
+            raise ZeroDivisionError
+        return MultiDual._new(np.tan(self.real),self.dual/(cos**2))
+
+    def log(self):
+        """
+        Computes the logarithm function of the multi-component dual number.
+
+        Returns:
+            MultiDual: the log of the real part, and the derivative of the log multiplied with each component of the dual part.
+
+        Raises:
+            Warning: logging warning is triggered when the real part of the dual number is zero.
+            ZeroDivisionError: Division by zero attempted
+        """
+        if (self.real==0):
+            logger.warning("Logarithm of dual number not defined when real part is zero")
+            raise ZeroDivisionError
+        return MultiDual._new(np.log(self.real),self.dual/self.real)
+
+    def exp(self):
+        """
+        Computes the exponential function of the multi-component dual number.
+
+        Returns:
+            MultiDual: the exp of the real part, and the derivative of the exp multiplied with each component of the dual part.
+        """
+        real=np.exp(self.real)
+        return MultiDual._new(real,real*self.dual)
+
+    def square(self):
+        """
+        Computes the square of the multi-component dual number.
+
+        Returns:
+            MultiDual: the square of the real part, and the derivative of the square multiplied with each component of the dual part.
+        """
+        return MultiDual._new(self.real*self.real,(2*self.real)*self.dual)
+
+    def floor(self):
+        """
+        Computes the floor of the multi-component dual number, with the same logic as Dual.floor.
+
+        Returns:
+            MultiDual: the floor of the real part and the floor of each component of the dual part.
+        """
+        return MultiDual._new(np.floor(self.real),np.floor(self.dual))
+
+    def ceil(self):
+        """
+        Computes the ceil of the multi-component dual number, with the same logic as Dual.ceil.
+
+        Returns:
+            MultiDual: the ceil of the real part and the ceil of each component of the dual part.
+        """
+        return MultiDual._new(np.ceil(self.real),np.ceil(self.dual))
+
+    def inverse(self):
+        """
+        Computes the inverse of the multi-component dual number.
+
+        Returns:
+            MultiDual: the inverse of the real part, and the derivative of the inverse multiplied with each component of the dual part.
+
+        Raises:
+            Warning: logging warning is triggered when the real part of the dual number is zero.
+            ZeroDivisionError: Division by zero attempted
+        """
+        if (self.real==0):
+            logger.warning("Cannot invert this dual number because its real part is nul")
+            raise ZeroDivisionError
+        return MultiDual._new(1/self.real,-self.dual/(self.real**2))
+
+#Types of the scalars that multi-component dual numbers can be combined with
+_SCALARS=(int,float,np.number)
@@ -0,0 +1,167 @@
+# dual_autodiff/parallel.py
+
+#Importing dependencies
+import contextvars
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+
+from .dual import Dual, _new_dual
+from .dual_array import DualArray
+from .compiler import CompiledFunction
+from .errors import error_policy, get_error_policy, error_counts, reset_error_counts, _add_error_counts
+
+#Logger of the module
+logger=logging.getLogger(__name__)
+
+#Number of chunks given to each worker by default, so that a slow chunk does not leave the other workers idle
+_CHUNKS_PER_WORKER=4
+
+#Smallest default number of points of a chunk evaluated by a thread: the NumPy loops of such a chunk take much longer
+#than the Python code between them, which holds the GIL, so that the threads mostly run in parallel
+_MIN_THREAD_CHUNK=16384
+
+def parallel_derivative(f,points,workers=None,chunk_size=None,seed=1.0,mp_context=None):
+    """
+    Evaluates a function of one dual number and its derivative at many independent points, in a pool of worker processes.
+
+    The points are split into contiguous chunks, which are sent to the workers as float64 arrays. Each worker evaluates
+    f(Dual(x, seed)) at the points of its chunks, and the values and derivatives are reassembled in the order of the points.
+    Worker processes import the function by reference, so f has to be defined at the top level of a module.
+    The workers apply the error policy of the caller, and the domain errors they count under the "count" policy are added
+    to error_counts() of the current process.
+
+    Parameters:
+        f: the function to differentiate, called with one Dual and returning a dual number or a constant.
+        points: the points, as a 1-D array-like of numbers.
+        workers: the number of worker processes, os.cpu_count() by default. With one worker, the points are evaluated in the current process.
+        chunk_size: the number of points of one task, by default so that each worker gets about 4 tasks.
+        seed: the dual part of the input, which scales the derivative.
+        mp_context: the multiprocessing context used to start the workers, e.g. multiprocessing.get_context("spawn"), the default context by default.
+
+    Returns:
+        Tuple: (values, derivatives) float64 arrays with one element per point.
+
+    Raises:
+        Warning: logging warning is triggered when the number of workers or the chunk size is not positive.
+        ValueError: if the number of workers or the chunk size is not positive.
+    """
+    points=np.ascontiguousarray(points,dtype=np.float64).ravel()
+    if workers is None:
+        workers=os.cpu_count() or 1
+    if workers<1 or (chunk_size is not None and chunk_size<1):
+        logger.warning("The number of workers and the chunk size have to be positive.")
+        raise ValueError
+    if workers==1 or len(points)==0:
+        return _evaluate(f,points,seed)
+    if chunk_size is None:
+        chunk_size=-(-len(points)//(workers*_CHUNKS_PER_WORKER))
+    chunks=[points[start:start+chunk_size] for start in range(0,len(points),chunk_size)]
+    n=len(chunks)
+    with ProcessPoolExecutor(max_workers=min(workers,n),mp_context=mp_context) as pool:
+        results=list(pool.map(_evaluate_in_worker,[f]*n,chunks,[seed]*n,[get_error_policy()]*n))
+    for r in results:
+        _add_error_counts(r[2])
+    return np.concatenate([r[0] for r in results]),np.concatenate([r[1] for r in results])
+
+def _evaluate_in_worker(f,points,seed,policy):
+    """
+    Evaluates a chunk in a worker process under the error policy of the caller.
+
+    Returns:
+        Tuple: (values, derivatives) float64 arrays of the chunk, and the dict of the domain errors counted in the chunk.
+    """
+    reset_error_counts()
+    with error_policy(policy):
+        values,derivatives=_evaluate(f,points,seed)
+    return values,derivatives,error_counts()
+
+def _evaluate(f,points,seed):
+    """
+    Evaluates f and its derivative at each point of a chunk, in a worker process or in the current process.
+
+    Returns:
+        Tuple: (values, derivatives) float64 arrays of the chunk.
+    """
+    values=np.empty(len(points))
+    derivatives=np.empty(len(points))
+    for i,x in enumerate(points.tolist()):
+        y=f(_new_dual(x,seed))
+        if isinstance(y,Dual):
+            values[i]=y.real
+            derivatives[i]=y.dual
+        else:
+            values[i]=y
+            derivatives[i]=0.0
+    return values,derivatives
+
+def threaded_derivative(f,points,threads=None,chunk_size=None,seed=1.0):
+    """
+    Evaluates a function of dual numbers and its derivative at many points in a pool of threads, one DualArray chunk at a time.
+
+    Each thread evaluates f on a DualArray holding a contiguous chunk of the points, so the work is done in the loops of
+    the NumPy ufuncs, which release the GIL. The Python code running f holds the GIL, but with large chunks it is short
+    compared with the loops, and the throughput grows with the number of threads. Each thread writes the values and
+    derivatives of its chunk into its own slice of the results. The chunks are evaluated under the error policy of the
+    caller, and the domain errors counted under the "count" error policy are added under a lock.
+
+    Parameters:
+        f: the function to differentiate, called with a DualArray and using the operations of DualArray,
+           or a function compiled with compile(), called with the DualArray of a chunk.
+        points: the points, as a 1-D array-like of numbers.
+        threads: the number of threads, os.cpu_count() by default. With one thread, f is evaluated on all the points at once in the current thread.
+        chunk_size: the number of points of one chunk, by default the number of points per thread and at least 16384.
+        seed: the dual part of the input, which scales the derivative.
+
+    Returns:
+        Tuple: (values, derivatives) float64 arrays with one element per point.
+
+    Raises:
+        Warning: logging warning is triggered when the number of threads or the chunk size is not positive.
+        ValueError: if the number of threads or the chunk size is not positive.
+    """
+    points=np.ascontiguousarray(points,dtype=np.float64).ravel()
+    if threads is None:
+        threads=os.cpu_count() or 1
+    if threads<1 or (chunk_size is not None and chunk_size<1):
+        logger.warning("The number of threads and the chunk size have to be positive.")
+        raise ValueError
+    n=len(points)
+    if chunk_size is None:
+        chunk_size=max(_MIN_THREAD_CHUNK,-(-n//threads))
+    values=np.empty(n)
+    derivatives=np.empty(n)
+    starts=range(0,n,chunk_size)
+
+    def evaluate(start):
+        stop=min(n,start+chunk_size)
+        _evaluate_chunk(f,points[start:stop],seed,values[start:stop],derivatives[start:stop])
+
+    if threads==1 or len(starts)<=1:
+        for start in starts:
+            evaluate(start)
+    else:
+        #each chunk runs in a copy of the context of the caller, which holds its error policy
+        with ThreadPoolExecutor(max_workers=min(threads,len(starts))) as pool:
+            futures=[pool.submit(contextvars.copy_context().run,evaluate,start) for start in starts]
+            for future in futures:
+                future.result()
+    return values,derivatives
+
+def _evaluate_chunk(f,points,seed,values,derivatives):
+    """
+    Evaluates f and its derivative on a DualArray of a chunk of points, writing them into the slices of the results.
+    """
+    x=DualArray._new(points,np.full(len(points),float(seed)))
+    if isinstance(f,CompiledFunction):
+        values[:],derivatives[:]=f(x)
+        return
+    y=f(x)
+    if isinstance(y,(DualArray,Dual)):
+        values[:]=y.real
+        derivatives[:]=y.dual
+    else:
+        values[:]=y
+        derivatives[:]=0.0
@@ -0,0 +1,420 @@
+# dual_autodiff/reverse.py
+
+#Importing dependencies
+import math
+import logging
+from array import array
+
+import numpy as np
+
+from .dual import _sin, _cos, _tan, _exp, _pow
+
+#Logger of the module
+logger=logging.getLogger(__name__)
+
+class Tape:
+    """
+    A class that records the elementary operations of a computation, to compute its gradient with reverse-mode automatic differentiation.
+
+    Each recorded operation has at most two parents, and the tape stores in compact arrays the value of each node,
+    the indices of its parents and the local derivatives of the node with respect to them.
+    The gradient of one output with respect to all the inputs is then computed with a single backward sweep over the tape,
+    instead of one forward pass per input as with the Dual class.
+
+    Attributes:
+        values: array of the values of the recorded nodes.
+        inputs: list of the variables created with variables().
+    """
+    def __init__(self):
+        """
+        Initializes an empty tape.
+        """
+        self.values=array("d")
+        self._left=array("q")
+        self._right=array("q")
+        self._dleft=array("d")
+        self._dright=array("d")
+        self.inputs=[]
+
+    def __len__(self):
+        """
+        Returns:
+            Int: the number of nodes recorded on the tape.
+        """
+        return len(self.values)
+
+    def _record(self,value,left,dleft,right=-1,dright=0.0):
+        """
+        Records a node on the tape.
+
+        Parameters:
+            value: value of the node.
+            left: index of the first parent, -1 if there is none.
+            dleft: derivative of the node with respect to the first parent.
+            right: index of the second parent, -1 if there is none.
+            dright: derivative of the node with respect to the second parent.
+
+        Returns:
+            Var: the variable of the new node.
+        """
+        index=len(self.values)
+        self.values.append(value)
+        self._left.append(left)
+        self._dleft.append(dleft)
+        self._right.append(right)
+        self._dright.append(dright)
+        return Var(self,index,value)
+
+    def variable(self,value):
+        """
+        Creates an input variable of the computation.
+
+        Parameters:
+            value: the value of the input.
+
+        Returns:
+            Var: the variable recorded on the tape.
+        """
+        x=self._record(float(value),-1,0.0)
+        self.inputs.append(x)
+        return x
+
+    def variables(self,values):
+        """
+        Creates several input variables of the computation.
+
+        Parameters:
+            values: the values of the inputs.
+
+        Returns:
+            List: the variables recorded on the tape.
+        """
+        return [self.variable(v) for v in values]
+
+    def gradient(self,output,inputs=None):
+        """
+        Computes the gradient of an output with a backward sweep over the tape.
+
+        Parameters:
+            output: the variable to differentiate.
+            inputs: the variables to differentiate with respect to, all the inputs of the tape by default.
+
+        Returns:
+            Array: the derivatives of the output with respect to each input.
+
+        Raises:
+            ValueError: if the output was not recorded on this tape.
+        """
+        if inputs is None:
+            inputs=self.inputs
+        #a constant output does not depend on the inputs
+        if not isinstance(output,Var):
+            return np.zeros(len(inputs))
+        if output.tape is not self:
+            raise ValueError("The output was not recorded on this tape")
+        adjoint=[0.0]*(output.index+1)
+        adjoint[output.index]=1.0
+        left,right,dleft,dright=self._left,self._right,self._dleft,self._dright
+        for i in range(output.index,-1,-1):
+            a=adjoint[i]
+            if a==0.0:
+                continue
+            p=left[i]
+            if p>=0:
+                adjoint[p]+=a*dleft[i]
+                p=right[i]
+                if p>=0:
+                    adjoint[p]+=a*dright[i]
+        return np.array([adjoint[x.index] if x.index<=output.index else 0.0 for x in inputs])
+
+class Var:
+    """
+    A class that defines a variable recorded on a Tape, and records the operations performed on it.
+
+    Attributes:
+        tape: the tape on which the variable is recorded.
+        index: the index of the variable on the tape.
+        value: the value of the variable.
+    """
+    __slots__=("tape","index","value")
+
+    def __init__(self,tape,index,value):
+        """
+        Initializes the variable. Variables are created by Tape.variable() and by the operations on other variables.
+
+        Parameters:
+            tape: the tape on which the variable is recorded.
+            index: the index of the variable on the tape.
+            value: the value of the variable.
+        """
+        self.tape=tape
+        self.index=index
+        self.value=value
+
+    def __str__(self):
+        """
+        Returns:
+            String: in the form "Var(value=variable.value)".
+        """
+        return "Var(value="+ str(self.value) +")."
+
+    def _check(self,x):
+        """
+        Makes sure that two variables are recorded on the same tape.
+
+        Raises:
+            ValueError: if the variables are recorded on different tapes.
+        """
+        if x.tape is not self.tape:
+            raise ValueError("Variables recorded on different tapes cannot be combined")
+
+    def __add__(self,x):
+        """
+        Records the addition of the current variable and a variable or scalar.
+        """
+        #if x is a variable
+        if isinstance(x,Var):
+            self._check(x)
+            return self.tape._record(self.value+x.value,self.index,1.0,x.index,1.0)
+        #if x is a scalar
+        else:
+            return self.tape._record(self.value+x,self.index,1.0)
+
+    def __radd__(self,x):
+        """
+        Records the addition of a scalar and the current variable.
+        """
+        return self + x
+
+    def __sub__(self,x):
+        """
+        Records the subtraction of a variable or scalar from the current variable.
+        """
+        #if x is a variable
+        if isinstance(x,Var):
+            self._check(x)
+            return self.tape._record(self.value-x.value,self.index,1.0,x.index,-1.0)
+        #if x is a scalar
+        else:
+            return self.tape._record(self.value-x,self.index,1.0)
+
+    def __rsub__(self,x):
+        """
+        Records the subtraction of the current variable from a scalar.
+        """
+        return self.tape._record(x-self.value,self.index,-1.0)
+
+    def __neg__(self):
+        """
+        Records the negation of the current variable.
+        """
+        return self.tape._record(-self.value,self.index,-1.0)
+
+    def __mul__(self,x):
+        """
+        Records the multiplication of the current variable and a variable or scalar.
+        """
+        #if x is a variable
+        if isinstance(x,Var):
+            self._check(x)
+            return self.tape._record(self.value*x.value,self.index,x.value,x.index,self.value)
+        #if x is a scalar
+        else:
+            return self.tape._record(self.value*x,self.index,x)
+
+    def __rmul__(self,x):
+        """
+        Records the multiplication of a scalar and the current variable.
+        """
+        return self * x
+
+    def __truediv__(self,x):
+        """
+        Records the division of the current variable by a variable or scalar.
+
+        Raises:
+            Warning: logging warning is triggered when division by zero is attempted.
+            ZeroDivisionError: If division by zero is attempted.
+        """
+        #if x is a variable
+        if isinstance(x,Var):
+            self._check(x)
+            if (x.value==0):
+                logger.warning("Division is not defined when the denominator is zero")
+                raise ZeroDivisionError
+            real=self.value/x.value
+            return self.tape._record(real,self.index,1/x.value,x.index,-real/x.value)
+        #if x is a scalar
+        else:
+            if (x==0):
+                raise ZeroDivisionError
+            return self.tape._record(self.value/x,self.index,1/x)
+
+    def __rtruediv__(self,x):
+        """
+        Records the division of a scalar by the current variable.
+
+        Raises:
+            Warning: logging warning is triggered when division by zero is attempted.
+            ZeroDivisionError: If division by zero is attempted.
+        """
+        if (self.value==0):
+            logger.warning("Division is not defined when the denominator is zero")
+            raise ZeroDivisionError
+        real=x/self.value
+        return self.tape._record(real,self.index,-real/self.value)
+
+    def __pow__(self,power):
+        """
+        Records the current variable raised to a scalar power, with the values of the Dual class.
+
+        The value is raised to the power once: x^(n-1) is computed for an integer power n, and x^(p-1) is recovered from
+        x^p by a division otherwise. A negative value raised to a non integer power gives NaN, as with the Dual class.
+
+        Raises:
+            Warning: logging warning is triggered when the power is a variable, or if the value of the variable is zero and the power is negative or between 0 and 1.
+            TypeError: if the power is a variable.
+            ZeroDivisionError: If division by zero is attempted.
+        """
+        if isinstance(power,Var):
+            logger.warning("The power cannot be a variable")
+            raise TypeError
+        if power==0:
+            return self.tape._record(1.0,self.index,0.0)
+        #an integer power computes x^(n-1) once for the value and the derivative
+        if type(power) is int and (self.value!=0 or power>0):
+            previous=self.value**(power-1)
+            return self.tape._record(previous*self.value,self.index,power*previous)
+        if self.value==0:
+            if power<0:
+                logger.warning("Negative power not defined when the value of the variable is zero")
+                raise ZeroDivisionError
+            #the derivative p x^(p-1) is infinite at x=0 for 0<p<1
+            if power<1:
+                logger.warning("Power lower than one not differentiable when the value of the variable is zero")
+                raise ZeroDivisionError
+            return self.tape._record(0.0,self.index,1.0 if power==1 else 0.0)
+        real=_pow(self.value,power)
+        return self.tape._record(real,self.index,power*(real/self.value))
+
+    def __eq__(self,x):
+        """
+        Compares the value of the current variable with a variable or scalar.
+        """
+        return self.value==(x.value if isinstance(x,Var) else x)
+
+    def __ne__(self,x):
+        """
+        Compares the value of the current variable with a variable or scalar.
+        """
+        return self.value!=(x.value if isinstance(x,Var) else x)
+
+    def __gt__(self,x):
+        """
+        Compares the value of the current variable with a variable or scalar.
+        """
+        return self.value>(x.value if isinstance(x,Var) else x)
+
+    def __ge__(self,x):
+        """
+        Compares the value of the current variable with a variable or scalar.
+        """
+        return self.value>=(x.value if isinstance(x,Var) else x)
+
+    def __lt__(self,x):
+        """
+        Compares the value of the current variable with a variable or scalar.
+        """
+        return self.value<(x.value if isinstance(x,Var) else x)
+
+    def __le__(self,x):
+        """
+        Compares the value of the current variable with a variable or scalar.
+        """
+        return self.value<=(x.value if isinstance(x,Var) else x)
+
+    __hash__=object.__hash__
+
+    def sin(self):
+        """
+        Records the sine function of the current variable.
+        """
+        return self.tape._record(_sin(self.value),self.index,_cos(self.value))
+
+    def cos(self):
+        """
+        Records the cosine function of the current variable.
+        """
+        return self.tape._record(_cos(self.value),self.index,-_sin(self.value))
+
+    def tan(self):
+        """
+        Records the tangent function of the current variable.
+
+        Raises:
+            Warning: logging warning is triggered when the cosine of the value is zero.
+            ZeroDivisionError: Division by zero attempted
+        """
+        cos=_cos(self.value)
+        if (abs(cos)<=1e-8):
+            logger.warning("Tan can't be defined for this function")
+            raise ZeroDivisionError
+        return self.tape._record(_tan(self.value),self.index,1/(cos*cos))
+
+    def log(self):
+        """
+        Records the logarithm function of the current variable.
+
+        Raises:
+            Warning: logging warning is triggered when the value of the variable is zero.
+            ZeroDivisionError: Division by zero attempted
+        """
+        if (self.value==0):
+            logger.warning("Logarithm not defined when the value of the variable is zero")
+            raise ZeroDivisionError
+        real=math.log(self.value) if self.value>0 else math.nan
+        return self.tape._record(real,self.index,1/self.value)
+
+    def exp(self):
+        """
+        Records the exponential function of the current variable.
+        """
+        real=_exp(self.value)
+        return self.tape._record(real,self.index,real)
+
+    def square(self):
+        """
+        Records the square of the current variable.
+        """
+        return self.tape._record(self.value*self.value,self.index,2*self.value)
+
+    def inverse(self):
+        """
+        Records the inverse of the current variable.
+
+        Raises:
+            Warning: logging warning is triggered when the value of the variable is zero.
+            ZeroDivisionError: Division by zero attempted
+        """
+        if (self.value==0):
+            logger.warning("Cannot invert this variable because its value is nul")
+            raise ZeroDivisionError
+        real=1/self.value
+        return self.tape._record(real,self.index,-real*real)
+
+def gradient(f,x):
+    """
+    Computes the value and the gradient of a scalar function with one forward and one backward sweep.
+
+    Parameters:
+        f: the function to differentiate, called with one Var per input and returning one Var.
+        x: the values of the inputs.
+
+    Returns:
+        Tuple: (value, gradient) with the value of f and the array of its derivatives with respect to each input.
+    """
+    tape=Tape()
+    inputs=tape.variables(x)
+    output=f(*inputs)
+    value=output.value if isinstance(output,Var) else float(output)
+    return value,tape.gradient(output,inputs)
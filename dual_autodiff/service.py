@@ -0,0 +1,151 @@
+# dual_autodiff/service.py
+
+#Importing dependencies
+import asyncio
+import logging
+
+import numpy as np
+
+from .dual_array import DualArray
+from .errors import error_policy, get_error_policy
+from .streaming import _evaluate
+
+#Logger of the module
+logger=logging.getLogger(__name__)
+
+class DerivativeService:
+    """
+    A class that serves derivatives of one function at single points to asyncio tasks, micro-batching the requests.
+
+    The requests made while a batch is open are evaluated together with one DualArray evaluation of the function. A batch
+    is evaluated when it holds max_batch requests, or max_delay seconds after its first request, whichever comes first, so
+    the latency added to a request is bounded by max_delay plus the time of one batch evaluation.
+
+    Each request is evaluated under the error policy of the task that made it, the requests of a batch made under
+    different policies being evaluated as one group per policy. When the evaluation of a group raises an exception, e.g.
+    a domain error under the "raise" error policy, its points are evaluated one by one, so that only the requests whose
+    point raises get the exception.
+
+    The service is used from the event loop of its requests and is not thread-safe. It can be used as an async context
+    manager, which flushes the open batch on exit.
+
+    Attributes:
+        f: the function to differentiate, called with a DualArray and using the operations of DualArray, or a function compiled with compile().
+        max_batch: the largest number of requests of a batch.
+        max_delay: the longest time in seconds between the first request of a batch and its evaluation.
+        seed: the dual part of the points, which scales the derivative.
+        batches: the number of batches evaluated.
+        requests: the number of requests evaluated.
+    """
+    def __init__(self,f,max_batch=1024,max_delay=0.001,seed=1.0):
+        """
+        Initializes the service of a function.
+
+        Parameters:
+            f: the function to differentiate.
+            max_batch: the largest number of requests of a batch, 1024 by default.
+            max_delay: the longest time in seconds a request waits for its batch to fill, 1 ms by default.
+            seed: the dual part of the points, which scales the derivative.
+
+        Raises:
+            Warning: logging warning is triggered when max_batch is not positive or max_delay is negative.
+            ValueError: if max_batch is not positive or max_delay is negative.
+        """
+        if max_batch<1 or max_delay<0:
+            logger.warning("The batch size has to be positive and the delay cannot be negative.")
+            raise ValueError
+        self.f=f
+        self.max_batch=max_batch
+        self.max_delay=max_delay
+        self.seed=seed
+        self.batches=0
+        self.requests=0
+        self._points=[]
+        self._futures=[]
+        self._policies=[]
+        self._timer=None
+
+    async def derivative(self,x):
+        """
+        Requests the value and the derivative of the function at one point.
+
+        Parameters:
+            x: the point, a number.
+
+        Returns:
+            Tuple: (value, derivative) floats of the function at Dual(x, seed).
+
+        Raises:
+            Exception: the exception raised by the function at this point, e.g. ZeroDivisionError under the "raise" error policy.
+        """
+        loop=asyncio.get_running_loop()
+        future=loop.create_future()
+        self._points.append(float(x))
+        self._futures.append(future)
+        self._policies.append(get_error_policy())
+        if len(self._points)>=self.max_batch:
+            self.flush()
+        elif self._timer is None:
+            self._timer=loop.call_later(self.max_delay,self.flush)
+        return await future
+
+    def flush(self):
+        """
+        Evaluates the open batch now and resolves the futures of its requests.
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer=None
+        points,futures,policies=self._points,self._futures,self._policies
+        if not points:
+            return
+        self._points,self._futures,self._policies=[],[],[]
+        self.batches+=1
+        self.requests+=len(points)
+        #the flush runs in the context of the task or timer that triggered it, so the policies of the requests are set here
+        groups={}
+        for x,future,policy in zip(points,futures,policies):
+            group=groups.setdefault(policy,([],[]))
+            group[0].append(x)
+            group[1].append(future)
+        for policy,(points,futures) in groups.items():
+            with error_policy(policy):
+                self._resolve(points,futures)
+
+    def _resolve(self,points,futures):
+        """
+        Evaluates a group of requests made under the same error policy and resolves their futures.
+        """
+        try:
+            values,derivatives=self._evaluate(points)
+        except Exception:
+            for x,future in zip(points,futures):
+                try:
+                    value,derivative=self._evaluate([x])
+                except Exception as error:
+                    if not future.done():
+                        future.set_exception(error)
+                else:
+                    if not future.done():
+                        future.set_result((float(value[0]),float(derivative[0])))
+            return
+        for future,value,derivative in zip(futures,values.tolist(),derivatives.tolist()):
+            #A request cancelled while waiting has a done future
+            if not future.done():
+                future.set_result((value,derivative))
+
+    def _evaluate(self,points):
+        """
+        Evaluates the function and its derivative at the points of a batch.
+
+        Returns:
+            Tuple: (values, derivatives) float64 arrays of the batch.
+        """
+        real=np.array(points,dtype=np.float64)
+        return _evaluate(self.f,DualArray._new(real,np.full(len(points),float(self.seed))))
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self,*exc_info):
+        self.flush()
@@ -0,0 +1,324 @@
+# dual_autodiff/sparse.py
+
+#Importing dependencies
+import logging
+import operator
+from collections import namedtuple
+
+import numpy as np
+
+from .dual import Dual
+from .dual_array import DualArray
+
+#Logger of the module
+logger=logging.getLogger(__name__)
+
+class CSRMatrix(namedtuple("CSRMatrix",["data","indices","indptr","shape"])):
+    """
+    A sparse matrix in compressed sparse row format, whose fields can be passed directly to ``scipy.sparse.csr_matrix``.
+
+    Attributes:
+        data: array of the nonzero entries, row by row.
+        indices: array of the column index of each entry.
+        indptr: array of the position in data of the first entry of each row, followed by the number of entries.
+        shape: tuple (m, n) of the shape of the matrix.
+    """
+    __slots__=()
+
+    @property
+    def nnz(self):
+        """
+        Int: the number of stored entries.
+        """
+        return len(self.data)
+
+    def nonzero(self):
+        """
+        Returns:
+            Tuple: the arrays of the row and column indices of the stored entries.
+        """
+        rows=np.repeat(np.arange(self.shape[0]),np.diff(self.indptr))
+        return rows,self.indices
+
+    def toarray(self):
+        """
+        Returns:
+            Array: the dense matrix.
+        """
+        dense=np.zeros(self.shape)
+        rows,cols=self.nonzero()
+        dense[rows,cols]=self.data
+        return dense
+
+    def to_scipy(self):
+        """
+        Converts the matrix into a SciPy sparse matrix, scipy being an optional dependency of the package.
+
+        Returns:
+            scipy.sparse.csr_matrix: the same matrix.
+
+        Raises:
+            ImportError: if scipy is not installed.
+        """
+        from scipy.sparse import csr_matrix
+        return csr_matrix((self.data,self.indices,self.indptr),shape=self.shape)
+
+def sparse_jacobian(f,x,sparsity=None):
+    """
+    Computes the Jacobian of a function of a vector with one forward pass per color of its columns.
+
+    Columns of the Jacobian that have no nonzero entry in a common row are structurally orthogonal, so they are given
+    the same color and seeded together: the dual part of each output then holds the entry of the only column of that color
+    in its row. The number of passes goes from the number of inputs to the number of colors, e.g. 3 for a tridiagonal Jacobian.
+
+    Parameters:
+        f: the function to differentiate, called with a DualArray of the n inputs and returning an array of the m outputs.
+        x: the values of the inputs.
+        sparsity: the sparsity pattern of the Jacobian as a dense array or any sparse matrix with a nonzero() method,
+            detected with sparsity_pattern() by default.
+
+    Returns:
+        CSRMatrix: the Jacobian matrix of shape (m, n).
+    """
+    x=np.atleast_1d(np.asarray(x,dtype=np.float64))
+    if sparsity is None:
+        sparsity=sparsity_pattern(f,x)
+    rows,cols,shape=_nonzero(sparsity)
+    colors=color_columns(sparsity)
+    #one column of the compressed Jacobian per color
+    compressed=np.zeros((shape[0],colors.max()+1 if len(colors) else 0))
+    for c in range(compressed.shape[1]):
+        y=f(DualArray._new(x.copy(),(colors==c).astype(np.float64)))
+        if isinstance(y,(DualArray,Dual)):
+            compressed[:,c]=np.broadcast_to(y.dual,(shape[0],))
+    return _csr(compressed[rows,colors[cols]],rows,cols,shape)
+
+def sparsity_pattern(f,x):
+    """
+    Detects the sparsity pattern of the Jacobian of a function of a vector by running it once on sets of input indices.
+
+    Each element of the array passed to f holds the set of the inputs it depends on, and every operation returns the union
+    of the sets of its operands. The pattern is structural: entries that vanish at x through cancellations are kept.
+    The NumPy functions supported are np.sum, np.mean, np.concatenate and np.dot, whose terms multiplied by a zero
+    constant are left out, e.g. np.dot(A, x) has the pattern of the constant matrix A.
+
+    Parameters:
+        f: the function, called with an array of the n inputs and returning an array of the m outputs.
+        x: the values of the inputs, which only give the number of inputs.
+
+    Returns:
+        CSRMatrix: the pattern of shape (m, n), with ones at the entries that may be nonzero.
+    """
+    n=np.size(x)
+    sets=np.empty(n,dtype=object)
+    for j in range(n):
+        sets[j]=frozenset((j,))
+    y=f(_Pattern(sets))
+    sets=np.atleast_1d(y.sets) if isinstance(y,_Pattern) else np.full(np.size(y),_EMPTY,dtype=object)
+    rows=np.repeat(np.arange(len(sets)),[len(s) for s in sets])
+    cols=np.fromiter((j for s in sets for j in sorted(s)),dtype=np.intp,count=len(rows))
+    return _csr(np.ones(len(rows)),rows,cols,(len(sets),n))
+
+def color_columns(sparsity):
+    """
+    Colors the columns of a sparsity pattern greedily, so that two columns with a nonzero entry in the same row have different colors.
+
+    Parameters:
+        sparsity: the sparsity pattern as a dense array or any sparse matrix with a nonzero() method.
+
+    Returns:
+        Array: the color of each column, from 0 to the number of colors minus one.
+    """
+    rows,cols,(m,n)=_nonzero(sparsity)
+    #the rows of each column and the columns of each row
+    order=np.argsort(cols,kind="stable")
+    col_rows=rows[order]
+    col_ptr=np.searchsorted(cols[order],np.arange(n+1))
+    order=np.argsort(rows,kind="stable")
+    row_cols=cols[order]
+    row_ptr=np.searchsorted(rows[order],np.arange(m+1))
+    colors=np.full(n,-1,dtype=np.intp)
+    #forbidden[c]==j when color c is taken by a column sharing a row with column j
+    forbidden=np.full(n+1,-1,dtype=np.intp)
+    for j in range(n):
+        for i in col_rows[col_ptr[j]:col_ptr[j+1]]:
+            neighbours=colors[row_cols[row_ptr[i]:row_ptr[i+1]]]
+            forbidden[neighbours[neighbours>=0]]=j
+        c=0
+        while forbidden[c]==j:
+            c+=1
+        colors[j]=c
+    return colors
+
+def _nonzero(sparsity):
+    """
+    Returns the row indices, column indices and shape of the entries of a sparsity pattern.
+    """
+    if not hasattr(sparsity,"nonzero") or not hasattr(sparsity,"shape"):
+        sparsity=np.asarray(sparsity)
+    rows,cols=sparsity.nonzero()
+    return np.asarray(rows,dtype=np.intp),np.asarray(cols,dtype=np.intp),tuple(sparsity.shape)
+
+def _csr(data,rows,cols,shape):
+    """
+    Builds a CSRMatrix from entries given in any order by their values, rows and columns.
+    """
+    order=np.lexsort((cols,rows))
+    indptr=np.concatenate([[0],np.cumsum(np.bincount(rows,minlength=shape[0]))])
+    return CSRMatrix(np.asarray(data,dtype=np.float64)[order],cols[order],indptr,shape)
+
+#The set of the inputs a constant depends on
+_EMPTY=frozenset()
+
+#Elementwise union of two arrays of sets
+_union=np.frompyfunc(operator.or_,2,1)
+
+class _Pattern:
+    """
+    A class that records, for each element of an array, the set of the inputs of the function it depends on.
+
+    Attributes:
+        sets: object array of frozensets of input indices.
+    """
+    def __init__(self,sets):
+        """
+        Initializes the array of sets.
+
+        Parameters:
+            sets: object array of frozensets of input indices.
+        """
+        self.sets=sets
+
+    @property
+    def shape(self):
+        """
+        Tuple: the shape of the array.
+        """
+        return self.sets.shape
+
+    @property
+    def ndim(self):
+        """
+        Int: the number of dimensions of the array.
+        """
+        return self.sets.ndim
+
+    @property
+    def size(self):
+        """
+        Int: the number of elements of the array.
+        """
+        return self.sets.size
+
+    def __len__(self):
+        """
+        Returns:
+            Int: the length of the first dimension of the array.
+        """
+        return len(self.sets)
+
+    def __getitem__(self,index):
+        """
+        Indexes the array of sets, keeping single elements as zero-dimensional arrays.
+        """
+        sets=self.sets[index]
+        if not isinstance(sets,np.ndarray):
+            element=np.empty((),dtype=object)
+            element[()]=sets
+            sets=element
+        return _Pattern(sets)
+
+    def __array_ufunc__(self,ufunc,method,*inputs,**kwargs):
+        """
+        Implements the NumPy ufunc protocol: the result of any ufunc depends on the inputs of all its operands.
+        """
+        if method!="__call__" or kwargs:
+            return NotImplemented
+        result=_Pattern(_sets(inputs[0]))
+        for x in inputs[1:]:
+            result=result._combine(x)
+        return result
+
+    def __array_function__(self,func,types,args,kwargs):
+        """
+        Implements the NumPy function protocol for the functions supported by DualArray that change the shape of an array.
+
+        Raises:
+            Warning: logging warning is triggered when the function is not supported.
+            TypeError: if the function is not supported.
+        """
+        if func is np.concatenate:
+            return _Pattern(np.concatenate([_sets(a) for a in args[0]],*args[1:],**kwargs))
+        if func in (np.sum,np.mean):
+            axis=kwargs.get("axis",args[1] if len(args)>1 else None)
+            keepdims=kwargs.get("keepdims",False)
+            return _Pattern(np.asarray(_union.reduce(_sets(args[0]),axis=axis,keepdims=keepdims,initial=_EMPTY),dtype=object))
+        if func in (np.shape,np.ndim,np.size):
+            return func(_sets(args[0]),*args[1:],**kwargs)
+        if func is np.dot:
+            return _Pattern(np.asarray(_dot(*args,**kwargs),dtype=object))
+        logger.warning("The sparsity pattern cannot be detected for functions using numpy."+func.__name__+", pass the sparsity argument instead")
+        raise TypeError
+
+    def _combine(self,x):
+        """
+        Returns the elementwise union of the sets of the current instance and of an operand.
+        """
+        return _Pattern(np.asarray(_union(self.sets,_sets(x)),dtype=object))
+
+    def _compare(self,x):
+        """
+        Comparisons cannot be recorded, as they would select a branch of the function.
+
+        Raises:
+            Warning: logging warning is triggered to alert the user that the function cannot branch on its inputs.
+            TypeError: always.
+        """
+        logger.warning("The sparsity pattern cannot be detected for functions comparing their inputs, pass the sparsity argument instead")
+        raise TypeError
+
+    __add__=__radd__=__sub__=__rsub__=__mul__=__rmul__=_combine
+    __truediv__=__rtruediv__=__floordiv__=__rfloordiv__=__mod__=__rmod__=_combine
+    __pow__=__rpow__=arctan2=hypot=_combine
+    __eq__=__ne__=__gt__=__ge__=__lt__=__le__=_compare
+    __hash__=None
+
+    def _same(self):
+        """
+        Returns the sets of the current instance, as the functions of one argument depend on the same inputs.
+        """
+        return _Pattern(self.sets)
+
+    __neg__=__pos__=__abs__=_same
+    sin=cos=tan=log=exp=square=floor=ceil=inverse=_same
+    sqrt=cbrt=sinh=cosh=tanh=arcsin=arccos=arctan=log1p=expm1=log2=log10=erf=sigmoid=softplus=_same
+
+def _dot(a,b):
+    """
+    Returns the sets of the elements of np.dot(a, b). An element depends on the inputs of the terms of its sum, except
+    for the terms multiplied by a zero constant, which are zero whatever the inputs.
+    """
+    left,right=_sets(a),_sets(b)
+    if left.ndim==0 or right.ndim==0:
+        return _union(left,right)
+    #the terms a[..., k] * b[..., k, j] are broadcast with the summed axis k last
+    extra=(1,)*(right.ndim-1)
+    left=left.reshape(left.shape[:-1]+extra+left.shape[-1:])
+    if right.ndim>1:
+        right=np.moveaxis(right,-2,-1)
+    terms=np.asarray(_union(left,right),dtype=object)
+    if not isinstance(a,_Pattern):
+        a=np.asarray(a)
+        terms=np.where(a.reshape(a.shape[:-1]+extra+a.shape[-1:])!=0,terms,_EMPTY)
+    if not isinstance(b,_Pattern):
+        b=np.asarray(b)
+        terms=np.where((b if b.ndim==1 else np.moveaxis(b,-2,-1))!=0,terms,_EMPTY)
+    return _union.reduce(terms,axis=-1,initial=_EMPTY)
+
+def _sets(x):
+    """
+    Returns the array of sets of an operand, constants depending on no input.
+    """
+    if isinstance(x,_Pattern):
+        return x.sets
+    return np.full(np.shape(x),_EMPTY,dtype=object)
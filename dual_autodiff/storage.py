@@ -0,0 +1,291 @@
+# dual_autodiff/storage.py
+
+#Importing dependencies
+import logging
+import struct
+import zlib
+
+import numpy as np
+
+from .dual import Dual
+from .dual_array import DualArray
+
+#Logger of the module
+logger=logging.getLogger(__name__)
+
+#Layout of a file:
+#    header: magic, version, flags and a reserved field, 16 bytes
+#    chunks: the real parts of the chunk followed by its dual parts, as float64 planes in little-endian order, each compressed with zlib if the file is compressed
+#    index: one record per chunk, with the offset of the chunk, its number of dual numbers and the sizes in bytes of its two planes
+#    trailer: the offset of the index, the number of chunks and the end magic, 24 bytes
+#All the sections of an uncompressed file start at multiples of 8 bytes, so its planes can be memory-mapped as float64 arrays.
+_MAGIC=b"DUALAD"
+_END_MAGIC=b"DUALEND\x00"
+_VERSION=1
+_COMPRESSED=1
+_HEADER=struct.Struct("<6sHII")
+_TRAILER=struct.Struct("<QQ8s")
+_INDEX_DTYPE=np.dtype([("offset","<u8"),("count","<u8"),("real_size","<u8"),("dual_size","<u8")])
+_PLANE_DTYPE=np.dtype("<f8")
+
+class DualWriter:
+    """
+    A class that writes a dataset of dual numbers to a binary file one chunk at a time, with bounded memory.
+
+    Each call to write() appends one chunk to the file. The index of the chunks is written when the writer is closed,
+    so a file is only readable after close(), which is called on exit when the writer is used as a context manager.
+
+    Attributes:
+        path: the path of the file.
+        compress: whether the planes of the chunks are compressed with zlib.
+        count: the number of dual numbers written.
+    """
+    def __init__(self,path,compress=False,level=6):
+        """
+        Creates the file and writes its header.
+
+        Parameters:
+            path: the path of the file, overwritten if it exists.
+            compress: True to compress the planes of the chunks with zlib, which disables memory-mapped loading.
+            level: the zlib compression level, from 1 (fastest) to 9 (smallest).
+        """
+        self.path=path
+        self.compress=compress
+        self.level=level
+        self.count=0
+        self._index=[]
+        self._file=open(path,"wb")
+        self._file.write(_HEADER.pack(_MAGIC,_VERSION,_COMPRESSED if compress else 0,0))
+
+    def write(self,x):
+        """
+        Appends a chunk of dual numbers to the file, flattened in C order.
+
+        Parameters:
+            x: a DualArray, an array of the structured dtype DUAL_DTYPE, a Dual or an iterable of Dual instances.
+
+        Raises:
+            Warning: logging warning is triggered when the writer is closed.
+            ValueError: if the writer is closed.
+        """
+        if self._file is None:
+            logger.warning("Cannot write into a closed DualWriter.")
+            raise ValueError
+        x=_as_dual_array(x)
+        offset=self._file.tell()
+        sizes=[self._write_plane(x.real),self._write_plane(x.dual)]
+        self._index.append((offset,x.size,sizes[0],sizes[1]))
+        self.count+=x.size
+
+    def _write_plane(self,plane):
+        """
+        Writes one plane of a chunk and returns its size in bytes.
+        """
+        plane=np.ascontiguousarray(plane,dtype=_PLANE_DTYPE).ravel()
+        data=zlib.compress(plane,self.level) if self.compress else plane
+        self._file.write(data)
+        return len(data) if self.compress else plane.nbytes
+
+    def close(self):
+        """
+        Writes the index and the trailer, and closes the file. Closing a closed writer does nothing.
+        """
+        if self._file is None:
+            return
+        #The index is aligned on 8 bytes after compressed planes
+        padding=-self._file.tell()%8
+        self._file.write(b"\0"*padding)
+        index_offset=self._file.tell()
+        self._file.write(np.array(self._index,dtype=_INDEX_DTYPE).tobytes())
+        self._file.write(_TRAILER.pack(index_offset,len(self._index),_END_MAGIC))
+        self._file.close()
+        self._file=None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self,*exc_info):
+        self.close()
+
+class DualReader:
+    """
+    A class that reads a dataset of dual numbers written by DualWriter or save_duals, one chunk at a time or whole.
+
+    Only the header, the index and the trailer are read when the reader is opened. Iterating over the reader yields
+    the chunks as DualArray instances, so a dataset larger than the memory can be streamed, e.g. into stream_derivative.
+
+    Attributes:
+        path: the path of the file.
+        compressed: whether the planes of the chunks are compressed with zlib.
+        mmap_mode: None to read the chunks into memory, or the mode of np.memmap ("r", "r+" or "c") to view the planes of the file.
+        counts: the number of dual numbers of each chunk.
+    """
+    def __init__(self,path,mmap_mode=None):
+        """
+        Opens a file and reads its index.
+
+        Parameters:
+            path: the path of the file.
+            mmap_mode: None, or "r", "r+" or "c" to map the file in memory and return views of its planes, as np.load.
+
+        Raises:
+            Warning: logging warning is triggered when the file is not a dataset of dual numbers, or when a compressed file is memory-mapped.
+            ValueError: if the file is not a complete dataset of dual numbers of a supported version, or if a compressed file is memory-mapped.
+        """
+        self.path=path
+        self.mmap_mode=mmap_mode
+        self._file=open(path,"rb")
+        try:
+            magic,version,flags,_=_HEADER.unpack(self._file.read(_HEADER.size))
+            self._file.seek(-_TRAILER.size,2)
+            index_offset,n_chunks,end_magic=_TRAILER.unpack(self._file.read(_TRAILER.size))
+        except (struct.error,OSError):
+            magic=None
+        if magic!=_MAGIC or end_magic!=_END_MAGIC or version!=_VERSION:
+            self._file.close()
+            logger.warning("The file is not a complete dataset of dual numbers written by this version of dual_autodiff.")
+            raise ValueError
+        self.compressed=bool(flags&_COMPRESSED)
+        if self.compressed and mmap_mode is not None:
+            self._file.close()
+            logger.warning("Compressed datasets cannot be memory-mapped.")
+            raise ValueError
+        self._file.seek(index_offset)
+        self._index=np.frombuffer(self._file.read(n_chunks*_INDEX_DTYPE.itemsize),dtype=_INDEX_DTYPE)
+        self.counts=self._index["count"].astype(np.int64)
+        self._map=None
+        if mmap_mode is not None:
+            self._map=np.memmap(path,dtype=np.uint8,mode=mmap_mode)
+
+    def __len__(self):
+        """
+        Returns:
+            Int: the number of dual numbers of the dataset.
+        """
+        return int(self.counts.sum())
+
+    def read_chunk(self,i):
+        """
+        Reads one chunk of the dataset.
+
+        Parameters:
+            i: the index of the chunk.
+
+        Returns:
+            DualArray: the 1-D array of the dual numbers of the chunk, viewing the file when it is memory-mapped.
+        """
+        offset,count,real_size,dual_size=(int(v) for v in self._index[i])
+        if self._map is not None:
+            planes=self._map[offset:offset+16*count].view(_PLANE_DTYPE)
+            return DualArray._new(planes[:count],planes[count:])
+        self._file.seek(offset)
+        if self.compressed:
+            real=_decompress(self._file.read(real_size),count)
+            dual=_decompress(self._file.read(dual_size),count)
+        else:
+            real=np.fromfile(self._file,dtype=_PLANE_DTYPE,count=count)
+            dual=np.fromfile(self._file,dtype=_PLANE_DTYPE,count=count)
+        return DualArray._new(real.astype(np.float64,copy=False),dual.astype(np.float64,copy=False))
+
+    def __iter__(self):
+        """
+        Yields the chunks of the dataset in order, as DualArray instances.
+        """
+        for i in range(len(self._index)):
+            yield self.read_chunk(i)
+
+    def read(self):
+        """
+        Reads the whole dataset.
+
+        Returns:
+            DualArray: the 1-D array of all the dual numbers. A memory-mapped dataset of one chunk is returned as a view of the file.
+        """
+        if len(self._index)==1:
+            return self.read_chunk(0)
+        real=np.empty(len(self))
+        dual=np.empty(len(self))
+        start=0
+        for chunk in self:
+            real[start:start+chunk.size]=chunk.real
+            dual[start:start+chunk.size]=chunk.dual
+            start+=chunk.size
+        return DualArray._new(real,dual)
+
+    def close(self):
+        """
+        Closes the file. Arrays viewing a memory-mapped file remain valid.
+        """
+        self._file.close()
+        self._map=None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self,*exc_info):
+        self.close()
+
+def save_duals(path,x,chunk_size=None,compress=False,level=6):
+    """
+    Saves a dataset of dual numbers to a binary file, as contiguous float64 planes of real and dual parts.
+
+    Parameters:
+        path: the path of the file, overwritten if it exists.
+        x: a DualArray, an array of the structured dtype DUAL_DTYPE, a Dual or an iterable of Dual instances, flattened in C order.
+        chunk_size: the number of dual numbers of one chunk, by default a single chunk.
+        compress: True to compress the chunks with zlib.
+        level: the zlib compression level, from 1 (fastest) to 9 (smallest).
+
+    Raises:
+        Warning: logging warning is triggered when the chunk size is not positive.
+        ValueError: if the chunk size is not positive.
+    """
+    if chunk_size is not None and chunk_size<1:
+        logger.warning("The chunk size has to be positive.")
+        raise ValueError
+    x=_as_dual_array(x)
+    real,dual=x.real.ravel(),x.dual.ravel()
+    with DualWriter(path,compress,level) as writer:
+        if chunk_size is None or x.size==0:
+            writer.write(DualArray._new(real,dual))
+            return
+        for start in range(0,x.size,chunk_size):
+            writer.write(DualArray._new(real[start:start+chunk_size],dual[start:start+chunk_size]))
+
+def load_duals(path,mmap_mode=None):
+    """
+    Loads a dataset of dual numbers saved with save_duals or DualWriter.
+
+    Parameters:
+        path: the path of the file.
+        mmap_mode: None to read the file into memory, or "r", "r+" or "c" to map it in memory, as np.load. A memory-mapped
+                   dataset of one chunk is returned as views of the planes of the file, which are only read when used.
+
+    Returns:
+        DualArray: the 1-D array of the dual numbers of the dataset.
+
+    Raises:
+        ValueError: if the file is not a complete dataset of dual numbers, or if a compressed file is memory-mapped.
+    """
+    with DualReader(path,mmap_mode) as reader:
+        return reader.read()
+
+def _as_dual_array(x):
+    """
+    Converts the data given to a writer into a DualArray.
+    """
+    if isinstance(x,DualArray):
+        return x
+    if isinstance(x,np.ndarray) and x.dtype.names is not None:
+        return DualArray.from_structured(x)
+    if isinstance(x,Dual):
+        x=[x]
+    return DualArray.from_duals(x)
+
+def _decompress(data,count):
+    """
+    Decompresses a plane of float64 values into a writable array.
+    """
+    plane=np.empty(count,dtype=_PLANE_DTYPE)
+    plane.view(np.uint8)[:]=np.frombuffer(zlib.decompress(data),dtype=np.uint8)
+    return plane
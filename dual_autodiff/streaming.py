@@ -0,0 +1,173 @@
+# dual_autodiff/streaming.py
+
+#Importing dependencies
+import itertools
+import logging
+
+import numpy as np
+
+from .dual import Dual
+from .dual_array import DualArray
+from .compiler import CompiledFunction
+
+#Logger of the module
+logger=logging.getLogger(__name__)
+
+class StreamStatistics:
+    """
+    A class that accumulates running reductions of the derivatives of a stream, one chunk at a time.
+
+    Points where the derivative is NaN, e.g. the points outside of the domain of an operation under the "nan"
+    and "count" error policies, are counted in `failed` and left out of the other reductions.
+
+    Attributes:
+        count: the number of points seen.
+        failed: the number of points whose derivative is NaN.
+        derivative_sum: the sum of the derivatives.
+        max_abs_derivative: the largest absolute value of the derivatives, 0 before any valid point.
+    """
+    def __init__(self):
+        self.count=0
+        self.failed=0
+        self.derivative_sum=0.0
+        self.max_abs_derivative=0.0
+
+    def update(self,derivatives):
+        """
+        Adds the derivatives of one chunk to the reductions.
+
+        Parameters:
+            derivatives: array of the derivatives of the chunk.
+        """
+        derivatives=np.asarray(derivatives,dtype=np.float64)
+        nan=np.isnan(derivatives)
+        failed=int(np.count_nonzero(nan))
+        if failed:
+            derivatives=derivatives[~nan]
+        self.count+=nan.size
+        self.failed+=failed
+        if derivatives.size:
+            self.derivative_sum+=float(np.sum(derivatives))
+            self.max_abs_derivative=max(self.max_abs_derivative,float(np.max(np.abs(derivatives))))
+
+    def __repr__(self):
+        return "StreamStatistics(count=%d, failed=%d, derivative_sum=%r, max_abs_derivative=%r)" % (
+            self.count,self.failed,self.derivative_sum,self.max_abs_derivative)
+
+def stream_derivative(f,chunks,seed=1.0,chunk_size=None,statistics=None):
+    """
+    Lazily evaluates a function of dual numbers and its derivative over a stream of input chunks.
+
+    The chunks are read one at a time, evaluated with the operations of DualArray, and their results are yielded
+    before the next chunk is read, so only one chunk and its intermediate arrays are held in memory at any time.
+
+    A chunk can be:
+        - an array-like of numbers x, evaluated at Dual(x, seed),
+        - an iterable of Dual instances, possibly mixed with numbers,
+        - a DualArray, whose dual parts are used as they are.
+
+    Parameters:
+        f: the function to differentiate, called with a DualArray and using the operations of DualArray,
+           or a function compiled with compile().
+        chunks: iterable of input chunks, or a flat iterable of points when chunk_size is given.
+        seed: the dual part of the points given as numbers, which scales the derivative.
+        chunk_size: if given, chunks is read as a flat iterable of numbers or Dual instances, and is grouped into chunks of this size.
+        statistics: a StreamStatistics updated with the derivatives of each chunk before it is yielded.
+
+    Returns:
+        Generator: (values, derivatives) float64 arrays of each chunk, in the order of the chunks.
+
+    Raises:
+        Warning: logging warning is triggered when the chunk size is not positive.
+        ValueError: if the chunk size is not positive.
+    """
+    if chunk_size is not None:
+        if chunk_size<1:
+            logger.warning("The chunk size has to be positive.")
+            raise ValueError
+        chunks=_batches(chunks,chunk_size)
+    return _stream(f,chunks,seed,statistics)
+
+def reduce_derivative(f,chunks,seed=1.0,chunk_size=None):
+    """
+    Evaluates the derivative of a function over a stream of input chunks, keeping only running reductions of the derivatives.
+
+    Parameters:
+        f: the function to differentiate, as in stream_derivative.
+        chunks: iterable of input chunks, or a flat iterable of points when chunk_size is given.
+        seed: the dual part of the points given as numbers, which scales the derivative.
+        chunk_size: if given, chunks is read as a flat iterable of points grouped into chunks of this size.
+
+    Returns:
+        StreamStatistics: the number of points, the number of failed points, the sum and the largest absolute value of the derivatives.
+
+    Raises:
+        Warning: logging warning is triggered when the chunk size is not positive.
+        ValueError: if the chunk size is not positive.
+    """
+    statistics=StreamStatistics()
+    for values,derivatives in stream_derivative(f,chunks,seed,chunk_size,statistics):
+        pass
+    return statistics
+
+def _stream(f,chunks,seed,statistics):
+    """
+    Generator evaluating f on each chunk, see stream_derivative.
+    """
+    for chunk in chunks:
+        values,derivatives=_evaluate(f,_as_dual_array(chunk,seed))
+        if statistics is not None:
+            statistics.update(derivatives)
+        yield values,derivatives
+
+def _batches(points,size):
+    """
+    Groups a flat iterable of points into lists of at most size points.
+    """
+    points=iter(points)
+    while True:
+        batch=list(itertools.islice(points,size))
+        if not batch:
+            return
+        yield batch
+
+def _as_dual_array(chunk,seed):
+    """
+    Converts an input chunk into a DualArray, with the seed as the dual part of the points given as numbers.
+    """
+    if isinstance(chunk,DualArray):
+        return chunk
+    if isinstance(chunk,Dual):
+        chunk=[chunk]
+    if not isinstance(chunk,np.ndarray):
+        chunk=list(chunk)
+        if any(isinstance(x,Dual) for x in chunk):
+            return DualArray.from_duals(x if isinstance(x,Dual) else Dual(float(x),seed) for x in chunk)
+    real=np.array(chunk,dtype=np.float64)
+    return DualArray._new(real,np.full(real.shape,float(seed)))
+
+def _evaluate(f,x):
+    """
+    Evaluates f and its derivative on a DualArray.
+
+    Returns:
+        Tuple: (values, derivatives) float64 arrays of the shape of x.
+    """
+    if isinstance(f,CompiledFunction):
+        values,derivatives=f(x)
+    else:
+        y=f(x)
+        if isinstance(y,(DualArray,Dual)):
+            values,derivatives=y.real,y.dual
+        else:
+            values,derivatives=y,0.0
+    return _full(values,x.shape),_full(derivatives,x.shape)
+
+def _full(a,shape):
+    """
+    Returns a float64 array of the given shape, broadcasting and copying a when it has another shape.
+    """
+    a=np.asarray(a,dtype=np.float64)
+    if a.shape!=shape:
+        a=np.broadcast_to(a,shape).copy()
+    return a
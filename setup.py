@@ -0,0 +1,48 @@
+# setup.py
+"""
+Builds the optional compiled backend of dual_autodiff.
+
+When Cython is available, dual_autodiff/dual.py is compiled, with the declarations of
+dual_autodiff/dual.pxd, into an extension module that Python imports in place of the
+pure Python module. The compiled module is built from the same source, so the Dual API
+and its errors are identical in both backends. Without Cython or a C compiler, or when
+the DUAL_AUTODIFF_PURE_PYTHON environment variable is set, the package is installed as
+pure Python. The remaining metadata is in pyproject.toml.
+"""
+
+#Importing dependencies
+import os
+import warnings
+
+from setuptools import setup
+from setuptools.command.build_ext import build_ext
+
+def compiled_extensions():
+    """
+    Returns the extension modules of the compiled backend, or an empty list if it cannot or should not be built.
+    """
+    if os.environ.get("DUAL_AUTODIFF_PURE_PYTHON"):
+        return []
+    try:
+        from Cython.Build import cythonize
+    except ImportError:
+        return []
+    return cythonize(["dual_autodiff/dual.py"],language_level=3,quiet=True)
+
+class optional_build_ext(build_ext):
+    """
+    Builds the extension modules, falling back to the pure Python package instead of failing when the compilation fails.
+    """
+    def run(self):
+        try:
+            super().run()
+        except Exception as error:
+            warnings.warn("The compiled backend of dual_autodiff could not be built, using pure Python: "+str(error))
+
+    def build_extension(self,ext):
+        try:
+            super().build_extension(ext)
+        except Exception as error:
+            warnings.warn("The compiled backend of dual_autodiff could not be built, using pure Python: "+str(error))
+
+setup(ext_modules=compiled_extensions(),cmdclass={"build_ext":optional_build_ext})
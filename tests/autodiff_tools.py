@@ -499,11 +499,30 @@ def test_power():
     #Make sure that a dual number raised to the power of -1 raises a ZeroDivisionError
     with pytest.raises(ZeroDivisionError):
         x2=x1**-1
-    #Make sure that a dual number raised to the power of another dual number raises a TypeError
-    with pytest.raises(TypeError):
-        z1=x**y
+    #Make sure that a dual number raised to the power of another dual number follows d(u^v) = v u^(v-1) du + u^v ln(u) dv
+    z1=x**y
+    assert np.isclose(z1.real,6**7)
+    assert np.isclose(z1.dual,7*6**6*8+6**7*np.log(6)*8)
+    #Make sure that a dual number with a real part=0 raised to the power of a dual number with a non nul dual part raises a ZeroDivisionError.
+    with pytest.raises(ZeroDivisionError):
+        z2=x1**y
     
 
+def test_power_zero_base():
+    """
+    A test that makes sure that a dual number with a real part=0 raised to a power between 0 and 1 follows the error policy, its derivative being infinite.
+
+    """
+    from dual_autodiff.errors import error_policy
+    with pytest.raises(ZeroDivisionError):
+        z=Dual(0.0,1.0)**0.5
+    with error_policy("nan"):
+        z=Dual(0.0,1.0)**0.5
+    assert np.isnan(z.real) and np.isnan(z.dual)
+    #Make sure that the derivative is zero for powers greater than one, and that a nul dual part gives no error
+    assert Dual(0.0,1.0)**2.5==Dual(0.0,0.0)
+    assert Dual(0.0,0.0)**0.5==Dual(0.0,0.0)
+
 def test_power_scalar():
     """
     A test that makes sure that the operator ``**`` behaves accordingly and handles invalid cases.
@@ -531,13 +550,17 @@ def test_ipower():
     x1=Dual(0,1)
     x**=3
     z1=Dual(9,8)
+    z2=z1
     z1**=0
     assert x.real==216
     assert x.dual==864
     assert z1==1
-    #Make sure that a dual number raised to the power of another dual number raises a TypeError
-    with pytest.raises(TypeError):
-        z**=y
+    #Make sure that a zero power modifies the dual number in place
+    assert z1 is z2 and z1.dual==0
+    #Make sure that a dual number can be raised to the power of another dual number in place
+    z**=y
+    assert np.isclose(z.real,6**6)
+    assert np.isclose(z.dual,6*6**5*8+6**6*np.log(6)*8)
      #Make sure that a dual number with a real part=0 raised to the power of -1 raises a ZeroDivisionError.
     with pytest.raises(ZeroDivisionError):
         x1**=-1
@@ -555,13 +578,16 @@ def test_ipower_scalar():
 
 def test_rpower():
     """
-    A test that makes sure that the reverse operator ``**`` correctly returns a non number
+    A test that makes sure that the reverse operator ``**`` differentiates a scalar raised to the power of a dual number.
 
     """
-    x=Dual(9,0)
-    #Make sure that a dual number raised to the power of another dual number raises a TypeError
-    with pytest.raises(TypeError):
-        z=5**x
+    x=Dual(2,3)
+    z=5**x
+    assert np.isclose(z.real,25)
+    assert np.isclose(z.dual,25*np.log(5)*3)
+    #Make sure that zero raised to the power of a dual number with a non nul dual part raises a ZeroDivisionError
+    with pytest.raises(ZeroDivisionError):
+        z=0**x
 
 
 def test_inverse():
@@ -634,4 +660,155 @@ def test_tan():
     assert np.isclose(y.dual, 1 / (np.cos(np.pi / 4) ** 2))
     #Make sure that the inverse of a dual number with real part = pi/2 raises a ZeroDivisionError
     with pytest.raises(ZeroDivisionError):
-        y1=x1.tan()
\ No newline at end of file
+        y1=x1.tan()
+
+def test_elementary_functions():
+    """
+    A test that makes sure that the real parts of the elementary functions match NumPy, and that their dual parts match a finite difference.
+
+    """
+    import math
+    functions={
+        "sqrt": np.sqrt,"cbrt": np.cbrt,"sinh": np.sinh,"cosh": np.cosh,"tanh": np.tanh,
+        "arcsin": np.arcsin,"arccos": np.arccos,"arctan": np.arctan,"log1p": np.log1p,"expm1": np.expm1,
+        "log2": np.log2,"log10": np.log10,"erf": math.erf,
+        "sigmoid": lambda x: 1/(1+np.exp(-x)),"softplus": lambda x: np.log(1+np.exp(x)),
+    }
+    h=1e-6
+    for name,f in functions.items():
+        for point in [-0.3,0.6]:
+            if name in ("sqrt","log2","log10") and point<0:
+                continue
+            y=getattr(Dual(point,2.0),name)()
+            assert np.isclose(y.real,f(point))
+            assert np.isclose(y.dual,2*(f(point+h)-f(point-h))/(2*h),rtol=1e-5)
+    #Make sure that the sigmoid and softplus do not overflow for large inputs
+    assert Dual(-1000.0,1.0).sigmoid().real==0
+    assert Dual(1000.0,1.0).softplus().real==1000
+    assert Dual(1000.0,1.0).softplus().dual==1
+
+def test_elementary_functions_invalid():
+    """
+    A test that makes sure that the elementary functions raise a ZeroDivisionError where their derivative is not defined.
+
+    """
+    for name,point in [("sqrt",0),("cbrt",0),("arcsin",1),("arccos",-1),("log1p",-1),("log2",0),("log10",0)]:
+        with pytest.raises(ZeroDivisionError):
+            y=getattr(Dual(point,1),name)()
+    with pytest.raises(ZeroDivisionError):
+        y=Dual(0,1).arctan2(0)
+    with pytest.raises(ZeroDivisionError):
+        y=Dual(0,1).hypot(Dual(0,1))
+
+def test_arctan2_hypot():
+    """
+    A test that makes sure that arctan2() and hypot() follow the rules of differentiation, as methods and as NumPy ufuncs.
+
+    """
+    y=Dual(1.0,2.0)
+    x=Dual(3.0,-1.0)
+    z=y.arctan2(x)
+    assert np.isclose(z.real,np.arctan2(1.0,3.0))
+    assert np.isclose(z.dual,(3.0*2.0-1.0*-1.0)/10)
+    assert np.arctan2(y,x)==z
+    assert np.isclose(np.arctan2(2.0,x).dual,2.0/13)
+    assert np.isclose(np.arctan2(y,3.0).dual,0.6)
+    z=np.hypot(x,y)
+    assert np.isclose(z.real,np.sqrt(10))
+    assert np.isclose(z.dual,(3.0*-1.0+1.0*2.0)/np.sqrt(10))
+    assert np.isclose(np.hypot(3.0,y).dual,2.0/np.sqrt(10))
+
+def test_numpy_ufunc():
+    """
+    A test that makes sure that NumPy functions applied to a dual number give the same result as the methods of the Dual class.
+
+    """
+    x=Dual(0.5,1.0)
+    assert np.sin(x)==x.sin()
+    assert np.exp(x)==x.exp()
+    assert np.log(x)==x.log()
+    assert np.isclose(np.sqrt(Dual(4.0,1.0)).dual,0.25)
+    #Make sure that NumPy scalars combined with dual numbers give dual numbers
+    assert np.float64(2)*x==Dual(1.0,2.0)
+
+def test_hash():
+    """
+    A test that makes sure that equal dual numbers have equal hashes, so that dual numbers can be keys of a dict.
+
+    """
+    assert hash(Dual(2.0,0.0))==hash(2)
+    assert hash(Dual(2.0,3.0))==hash(Dual(2,3))
+    assert len({Dual(1.0,1.0),Dual(1.0,1.0),Dual(1.0,2.0)})==2
+    assert {Dual(1.0,0.0): "a"}[1]=="a"
+
+def test_slots():
+    """
+    A test that makes sure that dual numbers, including the results of operations, have no per-instance dictionary.
+
+    """
+    x=Dual(1.5,1.0)
+    z=x*x+1
+    assert isinstance(z,Dual)
+    assert not hasattr(z,"__dict__")
+    #Make sure that attributes other than the real and dual parts cannot be set
+    with pytest.raises(AttributeError):
+        x.other=0
+
+def test_backend():
+    """
+    A test that makes sure that the package reports the backend of the Dual class that was imported.
+
+    """
+    import dual_autodiff
+    assert dual_autodiff.BACKEND in ("compiled","python")
+    assert dual_autodiff.Dual is Dual
+    assert (dual_autodiff.BACKEND=="compiled")==dual_autodiff.COMPILED
+
+def test_error_policy():
+    """
+    A test that makes sure that domain errors follow the error policy, and that the previous policy is restored after the context manager.
+
+    """
+    from dual_autodiff.errors import error_policy, get_error_policy, set_error_policy, error_counts, reset_error_counts
+    x=Dual(0.0,1.0)
+    y=Dual(2.0,1.0)
+    with error_policy("nan"):
+        assert np.isnan((y/x).real) and np.isnan((y/x).dual)
+        assert np.isnan(x.log().real)
+        assert np.isnan((2/x).dual)
+        assert get_error_policy()=="nan"
+    assert get_error_policy()=="raise"
+    with pytest.raises(ZeroDivisionError):
+        z=y/x
+    reset_error_counts()
+    with error_policy("count"):
+        z=y/x
+        z=y/0
+        z=x.log()+y/x
+    counts=error_counts()
+    assert sum(counts.values())==4
+    assert counts["Logarithm of dual number not defined when real part is zero"]==1
+    reset_error_counts()
+    assert error_counts()=={}
+    with pytest.raises(ValueError):
+        set_error_policy("ignore")
+
+def test_logging():
+    """
+    A test that makes sure that warnings are emitted by the logger of the module, without configuring the root logger.
+
+    """
+    import logging
+    from dual_autodiff import dual
+    assert dual.logger.name=="dual_autodiff.dual"
+    assert dual.logger.level==logging.NOTSET
+    records=[]
+    handler=logging.Handler()
+    handler.emit=records.append
+    logging.getLogger("dual_autodiff").addHandler(handler)
+    try:
+        with pytest.raises(ZeroDivisionError):
+            Dual(0.0,1.0).log()
+    finally:
+        logging.getLogger("dual_autodiff").removeHandler(handler)
+    assert records[0].name=="dual_autodiff.dual"
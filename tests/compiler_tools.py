@@ -0,0 +1,164 @@
+# tests/compiler_tools.py
+
+#Importing the libraries
+import pytest
+from dual_autodiff.dual_array import DualArray
+from dual_autodiff.compiler import compile
+import numpy as np
+
+def f1(x):
+    """
+    The function of the tutorial notebook.
+    """
+    return (x.cos()).sin()+x.log()
+
+def f2(x,y):
+    """
+    A function of two inputs using the operators and functions of the Dual class.
+    """
+    return (x*y).exp()/y+x**3-2//y+x.tan()%0.5-y.inverse()+(x-y).square()*abs(x)+y.floor()
+
+def test_matches_dual_array():
+    """
+    A test that makes sure that the compiled function gives the same value and derivative as DualArray.
+
+    """
+    x=np.linspace(0.5,5,50)
+    value,derivative=compile(f1)(x)
+    expected=f1(DualArray(x,1))
+    assert np.allclose(value,expected.real)
+    assert np.allclose(derivative,expected.dual)
+    assert np.allclose(derivative,-np.sin(x)*np.cos(np.cos(x))+1/x)
+
+def test_two_inputs():
+    """
+    A test that makes sure that the dual parts of DualArray arguments are used as the seeds of the derivative.
+
+    """
+    x=DualArray(np.linspace(0.1,1.2,20),1)
+    y=DualArray(np.linspace(1.5,3,20),0)
+    value,derivative=compile(f2)(x,y)
+    expected=f2(x,y)
+    assert np.allclose(value,expected.real)
+    assert np.allclose(derivative,expected.dual)
+
+def test_common_subexpressions():
+    """
+    A test that makes sure that cos(x) is computed once for both sin(cos(x)) and its derivative.
+
+    """
+    source=compile(f1).source()
+    assert source.count("np.cos(r0)")==1
+    assert source.count("np.sin(")==2
+
+def test_numpy_functions():
+    """
+    A test that makes sure that traced functions can use NumPy ufuncs and NumPy array constants.
+
+    """
+    x=np.array([0.5,1.0,2.0])
+    value,derivative=compile(lambda x: np.exp(x)*np.array([1.0,2.0,3.0])+np.sin(x))(x)
+    assert np.allclose(derivative,np.exp(x)*[1,2,3]+np.cos(x))
+
+def test_constant_function():
+    """
+    A test that makes sure that the derivative of a constant function is zero.
+
+    """
+    value,derivative=compile(lambda x: 3.0)(np.ones(3))
+    assert value==3.0
+    assert np.all(derivative==0)
+
+def test_invalid():
+    """
+    A test that makes sure that the compiled function raises the errors of the Dual class.
+
+    """
+    g=compile(f1)
+    #Make sure that the logarithm of a point with zero real part raises a ZeroDivisionError
+    with pytest.raises(ZeroDivisionError):
+        g(np.array([1.0,0.0]))
+    with pytest.raises(ZeroDivisionError):
+        compile(lambda x: x/0)(np.ones(2))
+    #Make sure that a dual power and comparisons raise a TypeError
+    with pytest.raises(TypeError):
+        compile(lambda x: x**x)(np.ones(2))
+    with pytest.raises(TypeError):
+        compile(lambda x: x if x>0 else -x)(np.ones(2))
+
+def test_nan_policy():
+    """
+    A test that makes sure that under the "nan" error policy the compiled function gives NaN at the invalid points only.
+
+    """
+    from dual_autodiff.errors import error_policy
+    with error_policy("nan"):
+        value,derivative=compile(f1)(np.array([1.0,0.0,2.0]))
+    assert np.all(np.isnan(value)==[False,True,False])
+    assert np.all(np.isnan(derivative)==[False,True,False])
+    assert np.isclose(value[2],np.sin(np.cos(2.0))+np.log(2.0))
+
+def test_zero_domain_errors():
+    """
+    A test that makes sure that the compiled function and DualArray handle negative powers of zero and divisions by a zero constant in the same way.
+
+    """
+    from dual_autodiff.errors import error_policy, error_counts, reset_error_counts
+    points=np.array([0.0,2.0])
+    g=compile(lambda x: x**-2)
+    with pytest.raises(ZeroDivisionError):
+        g(points)
+    with error_policy("nan"):
+        value,derivative=g(points)
+        expected=DualArray(points,1.0)**-2
+    assert np.array_equal(value,expected.real,equal_nan=True)
+    assert np.array_equal(derivative,expected.dual,equal_nan=True)
+    assert np.isnan(value[0]) and np.isclose(derivative[1],-0.25)
+    #The derivative of a power between 0 and 1 is not defined at zero
+    g=compile(lambda x: x**0.5)
+    with pytest.raises(ZeroDivisionError):
+        g(points)
+    reset_error_counts()
+    with error_policy("count"):
+        value,derivative=g(points)
+        expected=DualArray(points,1.0)**0.5
+    assert np.array_equal(value,expected.real,equal_nan=True)
+    assert np.array_equal(derivative,expected.dual,equal_nan=True)
+    assert np.isnan(derivative[0]) and np.isclose(derivative[1],0.5/np.sqrt(2.0))
+    assert sum(error_counts().values())==2
+    value,derivative=compile(lambda x: x**1.5)(points)
+    assert np.allclose(derivative,[0.0,1.5*np.sqrt(2.0)])
+    h=compile(lambda x: x/0.0)
+    with pytest.raises(ZeroDivisionError):
+        h(points)
+    reset_error_counts()
+    with error_policy("count"):
+        value,derivative=h(points)
+        expected=DualArray(points,1.0)/0.0
+    assert np.isnan(value).all() and np.isnan(derivative).all()
+    assert np.isnan(expected.real).all()
+    assert sum(error_counts().values())==2
+    reset_error_counts()
+
+def test_elementary_functions():
+    """
+    A test that makes sure that the compiled elementary functions give the values, derivatives and domain errors of DualArray.
+
+    """
+    from dual_autodiff.errors import error_policy
+    #functions defined on the real line are checked on both sides of zero, where cbrt and arctan2 are not differentiable
+    functions=[(lambda x: x.sqrt(),0.1),(lambda x: x.log2()-np.log10(x),0.1),(lambda x: x.cbrt(),-0.9),(lambda x: x.sinh()*x.cosh(),-0.9),
+               (lambda x: np.tanh(x),-0.9),(lambda x: x.arcsin()+x.arccos(),-0.9),(lambda x: x.arctan(),-0.9),(lambda x: x.log1p(),-0.9),
+               (lambda x: x.expm1(),-0.9),(lambda x: x.erf(),-0.9),(lambda x: x.sigmoid(),-0.9),(lambda x: x.softplus(),-0.9),
+               (lambda x: x.arctan2(x.square()),-0.9),(lambda x: np.arctan2(2.0,x),-0.9),(lambda x: x.hypot(3.0),-0.9)]
+    for f,start in functions:
+        points=np.linspace(start,0.9,7)
+        with error_policy("nan"):
+            value,derivative=compile(f)(points)
+            expected=f(DualArray(points,1.0))
+        assert np.allclose(value,expected.real,equal_nan=True)
+        assert np.allclose(derivative,expected.dual,equal_nan=True)
+    #The points outside of the domains raise as with DualArray
+    for f,x in ((lambda x: x.sqrt(),0.0),(lambda x: x.arcsin(),1.0),(lambda x: x.log1p(),-1.0),(lambda x: x.arctan2(x),0.0),(lambda x: x.hypot(0.0),0.0)):
+        with pytest.raises(ZeroDivisionError):
+            compile(f)(np.array([0.5,x]))
@@ -0,0 +1,97 @@
+# tests/drivers_tools.py
+
+#Importing the libraries
+import pytest
+from dual_autodiff.dual import Dual
+from dual_autodiff.drivers import jacobian, jvp, hessian, hvp
+import numpy as np
+
+def f(x,y,z):
+    """
+    A function of three inputs with three outputs.
+    """
+    return [x*y.sin()+z,(x*z).exp()/y,x.square()]
+
+def g(x,y,z):
+    """
+    A scalar function of three inputs.
+    """
+    return x*y.sin()+(x*z).exp()/y+z**3
+
+point=[0.5,1.2,0.3]
+
+def expected_gradient(x,y,z):
+    """
+    The analytical gradient of g.
+    """
+    e=np.exp(x*z)
+    return np.array([np.sin(y)+z*e/y,x*np.cos(y)-e/y**2,x*e/y+3*z**2])
+
+def test_jacobian_modes():
+    """
+    A test that makes sure that the forward and reverse modes give the same Jacobian, with and without chunks.
+
+    """
+    J=jacobian(f,point,mode="forward")
+    assert J.shape==(3,3)
+    assert np.allclose(J[2],[1.0,0,0])
+    assert np.allclose(J,jacobian(f,point,mode="reverse"))
+    assert np.allclose(J,jacobian(f,point,mode="forward",chunk_size=2))
+    assert np.allclose(J,jacobian(f,point,mode="forward",memory_budget=16*3))
+    #the gradient of a scalar function
+    assert np.allclose(jacobian(g,point),expected_gradient(*point))
+    assert np.allclose(jacobian(g,point,mode="forward",chunk_size=1),expected_gradient(*point))
+    #outputs that do not depend on the inputs give rows of zeros
+    assert np.allclose(jacobian(lambda a,b: [a*b,3.0],[1.0,2.0],mode="forward"),[[2,1],[0,0]])
+    with pytest.raises(ValueError):
+        J=jacobian(f,point,mode="sideways")
+
+def test_jacobian_auto_fallback():
+    """
+    A test that makes sure that the automatic mode uses the forward mode for functions with operations that the reverse mode does not support.
+
+    """
+    for h in (lambda x,y: (x*y).sqrt(),lambda x,y: np.sqrt(x*y),lambda x,y: (x*y).tanh(),lambda x,y: abs(x-y),lambda x,y: x**y):
+        assert np.allclose(jacobian(h,[1.5,2.0]),jacobian(h,[1.5,2.0],mode="forward"))
+    assert np.allclose(jacobian(lambda x,y: (x*y).sqrt(),[1.5,2.0]),[np.sqrt(2.0/1.5)/2,np.sqrt(1.5/2.0)/2])
+
+def test_jvp():
+    """
+    A test that makes sure that the Jacobian-vector product matches the product of the Jacobian and the vector.
+
+    """
+    v=np.array([0.3,-1.0,2.0])
+    value,tangent=jvp(f,point,v)
+    assert np.allclose(tangent,jacobian(f,point)@v)
+    assert np.isclose(value[2],0.25)
+    value,tangent=jvp(g,point,v)
+    assert np.isclose(tangent,expected_gradient(*point)@v)
+
+def test_hessian():
+    """
+    A test that makes sure that the Hessian matches central differences of the gradient, and does not depend on the chunk size.
+
+    """
+    H=hessian(g,point)
+    eps=1e-6
+    expected=np.array([(expected_gradient(*(np.array(point)+eps*e))-expected_gradient(*(np.array(point)-eps*e)))/(2*eps) for e in np.eye(3)])
+    assert np.allclose(H,H.T)
+    assert np.allclose(H,expected,atol=1e-6)
+    assert np.allclose(hessian(g,point,chunk_size=2),H)
+    assert np.allclose(hessian(g,point,memory_budget=1),H)
+    #a jet of order 2 takes 24 bytes per input and direction, so this budget holds 2 of the 6 directions
+    calls=[]
+    def counted(*x):
+        calls.append(1)
+        return g(*x)
+    assert np.allclose(hessian(counted,point,memory_budget=24*3*2),H)
+    assert len(calls)==3
+
+def test_hvp():
+    """
+    A test that makes sure that the Hessian-vector product matches the product of the Hessian and the vector.
+
+    """
+    v=np.array([0.3,-1.0,2.0])
+    assert np.allclose(hvp(g,point,v),hessian(g,point)@v)
+    assert np.allclose(hvp(g,point,v,chunk_size=3),hessian(g,point)@v)
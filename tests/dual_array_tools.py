@@ -0,0 +1,436 @@
+# tests/dual_array_tools.py
+
+#Importing the libraries
+from multiprocessing import shared_memory
+import pytest
+from dual_autodiff.dual import Dual
+from dual_autodiff.dual_array import DualArray
+import numpy as np
+
+def assert_matches(result,expected):
+    """
+    Checks that each element of an array of dual numbers matches the corresponding Dual result.
+    """
+    for r,d,e in zip(result.real.ravel(),result.dual.ravel(),expected):
+        assert np.isclose(r,e.real)
+        assert np.isclose(d,e.dual)
+
+def test_init():
+    """
+    A test that makes sure that the DualArray class initialises contiguous float64 parts, broadcasts them, and handles invalid inputs.
+
+    """
+    x=DualArray([1,2,3],1)
+    assert x.real.dtype==np.float64
+    assert x.dual.dtype==np.float64
+    assert x.real.flags.c_contiguous
+    assert x.shape==(3,)
+    assert np.all(x.dual==1)
+    #Make sure that initialisation with non number parts raises a TypeError.
+    with pytest.raises(TypeError):
+        y=DualArray(["Real"],0)
+
+def test_from_to_duals():
+    """
+    A test that makes sure that conversions between DualArray and lists of Dual keep the real and dual parts.
+
+    """
+    duals=[Dual(1,2),Dual(3.5,-1)]
+    x=DualArray.from_duals(duals)
+    assert np.all(x.real==[1,3.5])
+    assert np.all(x.dual==[2,-1])
+    assert x.to_duals()==duals
+
+def test_getitem():
+    """
+    A test that makes sure that indexing returns a Dual for single elements and a DualArray for slices.
+
+    """
+    x=DualArray([1,2,3],[4,5,6])
+    assert x[1]==Dual(2,5)
+    assert isinstance(x[1:],DualArray)
+    assert np.all(x[1:].dual==[5,6])
+
+def test_arithmetic_matches_dual():
+    """
+    A test that makes sure that the arithmetic operators give the same elementwise results as the Dual class.
+
+    """
+    a=[Dual(4,3),Dual(-2.5,1),Dual(7,-2)]
+    b=[Dual(2,3),Dual(1.5,0.5),Dual(-3,4)]
+    x=DualArray.from_duals(a)
+    y=DualArray.from_duals(b)
+    assert_matches(x+y,[p+q for p,q in zip(a,b)])
+    assert_matches(x-y,[p-q for p,q in zip(a,b)])
+    assert_matches(x*y,[p*q for p,q in zip(a,b)])
+    assert_matches(x/y,[p/q for p,q in zip(a,b)])
+    assert_matches(x//y,[p//q for p,q in zip(a,b)])
+    assert_matches(x%y,[p%q for p,q in zip(a,b)])
+    assert_matches(x**3,[p**3 for p in a])
+
+def test_arithmetic_scalar():
+    """
+    A test that makes sure that operations between arrays of dual numbers and scalars match the Dual class, in both orders.
+
+    """
+    a=[Dual(4,3),Dual(-2.5,1),Dual(7,-2)]
+    x=DualArray.from_duals(a)
+    assert_matches(x+2,[p+2 for p in a])
+    assert_matches(2-x,[2-p for p in a])
+    assert_matches(3*x,[3*p for p in a])
+    assert_matches(2/x,[2/p for p in a])
+    assert_matches(2//x,[2//p for p in a])
+    assert_matches(2%x,[2%p for p in a])
+    assert_matches(x*Dual(2,1),[p*Dual(2,1) for p in a])
+
+def test_broadcasting():
+    """
+    A test that makes sure that operations broadcast the shapes of their operands.
+
+    """
+    x=DualArray(np.arange(3.0),1)
+    z=x+np.ones((2,1))
+    assert z.shape==(2,3)
+    assert z.dual.shape==(2,3)
+    assert np.all(z.dual==1)
+    w=np.ones((2,1))*x
+    assert isinstance(w,DualArray)
+    assert w.shape==(2,3)
+
+def test_div_zero():
+    """
+    A test that makes sure that division by an array containing a zero real part raises a ZeroDivisionError.
+
+    """
+    x=DualArray([1,2],[1,1])
+    y=DualArray([1,0],[1,1])
+    with pytest.raises(ZeroDivisionError):
+        z=x/y
+    with pytest.raises(ZeroDivisionError):
+        z=1/y
+    with pytest.raises(ZeroDivisionError):
+        z=x%0
+
+def test_power():
+    """
+    A test that makes sure that the operator ``**`` behaves like the Dual class and handles invalid cases.
+
+    """
+    x=DualArray([6,0],[8,5])
+    z=x**0
+    assert np.all(z.real==1)
+    assert np.all(z.dual==0)
+    with pytest.raises(ZeroDivisionError):
+        z=x**-1
+    with pytest.raises(ZeroDivisionError):
+        z=x**DualArray([1,1],[1,1])
+    #Make sure that integer, real and dual powers match the Dual class
+    a=[Dual(1.5,2.0),Dual(-0.5,1.0),Dual(3.0,-1.0)]
+    y=DualArray.from_duals(a)
+    for power in [1,2,5,-3,Dual(2.0,0.0)]:
+        assert_matches(y**power,[p**power for p in a])
+    assert_matches(abs(y)**0.5,[abs(p)**0.5 for p in a])
+    assert_matches(abs(y)**Dual(1.5,0.5),[abs(p)**Dual(1.5,0.5) for p in a])
+    assert_matches(2**y,[2**p for p in a])
+    assert_matches(np.power(Dual(2.0,1.0),y),[Dual(2.0,1.0)**p for p in a])
+
+def test_power_zero_base():
+    """
+    A test that makes sure that a real part=0 raised to a power between 0 and 1 follows the error policy, as in the Dual class.
+
+    """
+    from dual_autodiff.errors import error_policy
+    x=DualArray([0.0,4.0],1.0)
+    with pytest.raises(ZeroDivisionError):
+        z=x**0.5
+    with error_policy("nan"):
+        z=x**0.5
+    assert np.isnan(z.dual[0]) and z.dual[1]==0.25
+    assert np.all(z.failed==[True,False])
+    z=x**2.5
+    assert z.dual[0]==0.0 and not z.failed.any()
+    assert (DualArray([0.0],0.0)**0.5).dual[0]==0.0
+
+def test_comparisons():
+    """
+    A test that makes sure that comparisons are elementwise and based on the real parts.
+
+    """
+    x=DualArray([1,2,3],[0,0,1])
+    assert np.all((x==DualArray([1,2,3],[0,0,1]))==[True,True,True])
+    assert np.all((x==2)==[False,True,False])
+    assert np.all((x!=3)==[True,True,True])
+    assert np.all((x>1)==[False,True,True])
+    assert np.all((x<=2)==[True,True,False])
+
+def test_functions_match_dual():
+    """
+    A test that makes sure that the elementary functions give the same elementwise results as the Dual class.
+
+    """
+    a=[Dual(0.5,1.0),Dual(1.2,-2.0),Dual(2.5,0.3)]
+    x=DualArray.from_duals(a)
+    for name in ["sin","cos","tan","log","exp","square","floor","ceil","inverse","sqrt","cbrt","sinh","cosh","tanh",
+                 "arctan","log1p","expm1","log2","log10","erf","sigmoid","softplus"]:
+        assert_matches(getattr(x,name)(),[getattr(p,name)() for p in a])
+    b=DualArray.from_duals([Dual(0.5,1.0),Dual(-0.2,-2.0),Dual(0.9,0.3)])
+    for name in ["arcsin","arccos","sigmoid","softplus"]:
+        assert_matches(getattr(b,name)(),[getattr(p,name)() for p in b.to_duals()])
+    assert_matches(np.arctan2(x,b),[p.arctan2(q) for p,q in zip(a,b.to_duals())])
+    assert_matches(np.arctan2(2.0,x),[np.arctan2(2.0,p) for p in a])
+    assert_matches(np.hypot(x,Dual(1.0,1.0)),[p.hypot(Dual(1.0,1.0)) for p in a])
+    assert_matches(abs(-x),[abs(-p) for p in a])
+
+def test_functions_invalid():
+    """
+    A test that makes sure that the elementary functions raise a ZeroDivisionError on invalid points, as the Dual class does.
+
+    """
+    x=DualArray([1,0],[1,1])
+    with pytest.raises(ZeroDivisionError):
+        y=x.log()
+    with pytest.raises(ZeroDivisionError):
+        y=x.inverse()
+    with pytest.raises(ZeroDivisionError):
+        y=DualArray([np.pi/2],[1]).tan()
+    with pytest.raises(ZeroDivisionError):
+        y=np.sqrt(x)
+    with pytest.raises(ZeroDivisionError):
+        y=np.arctan2(x,0)
+
+def test_nan_policy():
+    """
+    A test that makes sure that under the "nan" and "count" error policies only the invalid points are NaN, and that they are marked in the failed mask of the results.
+
+    """
+    from dual_autodiff.errors import error_policy, error_counts, reset_error_counts
+    x=DualArray([1,0,2,0],[1,1,1,1])
+    assert not np.any(x.failed)
+    with error_policy("nan"):
+        y=1/x
+        assert np.all(y.failed==[False,True,False,True])
+        assert np.all(np.isnan(y.real)==y.failed) and np.all(np.isnan(y.dual)==y.failed)
+        assert np.allclose(y.real[[0,2]],[1,0.5])
+        #Make sure that the mask follows the operations, indexing and reductions
+        z=(y*2+x).sin()
+        assert np.all(z.failed==y.failed)
+        assert np.all(z[1:].failed==[True,False,True])
+        assert np.all(np.concatenate([z,x]).failed==[False,True,False,True,False,False,False,False])
+        w=DualArray([[1,0],[2,3]],1).inverse()
+        assert np.all(np.sum(w,axis=1).failed==[True,False])
+        assert np.all(np.dot(np.eye(2),w).failed==[[False,True],[False,True]])
+        assert np.all(x.log().failed==[False,True,False,True])
+        assert np.all((x**-1).failed==[False,True,False,True])
+        assert np.all(DualArray([np.pi/2,0],[1,1]).tan().failed==[True,False])
+    #Make sure that the default policy still raises and that the count policy counts the invalid points
+    with pytest.raises(ZeroDivisionError):
+        y=1/x
+    reset_error_counts()
+    with error_policy("count"):
+        y=x.log()
+    assert error_counts()=={"Logarithm of dual number not defined when real part is zero": 2}
+    reset_error_counts()
+
+def test_numpy_ufuncs():
+    """
+    A test that makes sure that NumPy ufuncs applied to an array of dual numbers compute the derivative.
+
+    """
+    x=DualArray([0.5,1.5,4.0],1)
+    y=np.sin(x)*np.exp(x)+np.log(x)-np.sqrt(x)
+    assert isinstance(y,DualArray)
+    expected=np.cos(x.real)*np.exp(x.real)+np.sin(x.real)*np.exp(x.real)+1/x.real-0.5/np.sqrt(x.real)
+    assert np.allclose(y.dual,expected)
+    z=np.array([1.0,2.0,3.0])-x
+    assert isinstance(z,DualArray)
+    assert np.all(z.dual==-1)
+
+def test_numpy_functions():
+    """
+    A test that makes sure that np.sum, np.mean, np.dot and np.concatenate support arrays of dual numbers.
+
+    """
+    x=DualArray([1.0,2.0,3.0],[1.0,0.0,2.0])
+    assert np.sum(x)==Dual(6.0,3.0)
+    assert np.mean(x)==Dual(2.0,1.0)
+    assert np.dot(x,x)==Dual(14.0,2*(1.0+6.0))
+    assert np.dot(np.ones(3),x)==Dual(6.0,3.0)
+    z=np.concatenate([x,np.array([4.0])])
+    assert np.all(z.real==[1,2,3,4])
+    assert np.all(z.dual==[1,0,2,0])
+    #Make sure that unsupported NumPy functions raise a TypeError
+    with pytest.raises(TypeError):
+        np.cumsum(x)
+
+def test_dual_with_numpy_array():
+    """
+    A test that makes sure that operations between a Dual and a NumPy array give an array of dual numbers.
+
+    """
+    x=Dual(2.0,1.0)
+    a=np.array([1.0,3.0])
+    for z in [x*a,a*x]:
+        assert isinstance(z,DualArray)
+        assert np.all(z.real==[2,6])
+        assert np.all(z.dual==[1,3])
+    assert isinstance(x+DualArray(a,0),DualArray)
+
+def test_from_buffer():
+    """
+    A test that makes sure that arrays built on buffers view them without copying, in the planar and interleaved layouts, and write into them in place.
+
+    """
+    buffer=bytearray(np.arange(8.0).tobytes())
+    planar=DualArray.from_buffer(buffer)
+    assert np.all(planar.real==[0,1,2,3]) and np.all(planar.dual==[4,5,6,7])
+    interleaved=DualArray.from_buffer(buffer,shape=(2,2),layout="interleaved")
+    assert np.all(interleaved.real==[[0,2],[4,6]]) and np.all(interleaved.dual==[[1,3],[5,7]])
+    #Writing into the array writes into the buffer
+    planar[1:3]=planar[1:3]*Dual(2.0,1.0)
+    assert np.all(np.frombuffer(buffer)==[0,2,4,3,4,11,14,7])
+    assert interleaved.real[0,1]==4.0
+    planar[0]=5
+    assert planar[0]==Dual(5.0,0.0)
+    one=DualArray.from_buffer(buffer,shape=1,offset=16)
+    assert one.shape==(1,) and one[0]==Dual(4.0,3.0)
+    with pytest.raises(ValueError):
+        DualArray.from_buffer(bytes(24))
+    with pytest.raises(ValueError):
+        DualArray.from_buffer(bytes(16),shape=(2,))
+    with pytest.raises(ValueError):
+        DualArray.from_buffer(buffer,layout="rows")
+    with pytest.raises(ValueError):
+        DualArray.from_buffer(bytes(16))[0]=1.0
+    with pytest.raises(TypeError):
+        planar[0]="a"
+
+def test_setitem_failed():
+    """
+    A test that makes sure that writing into an array sets the failed mask of the written points without changing the arrays sharing its mask.
+
+    """
+    from dual_autodiff.errors import error_policy
+    x=DualArray([0.0,1.0,2.0],1.0)
+    with error_policy("nan"):
+        y=x.log()
+    z=-y
+    z[0]=1.0
+    assert not z.failed.any() and y.failed[0]
+    z[1:]=y[:2]
+    assert np.all(z.failed==[False,True,False])
+
+def test_memmap_and_shared_memory(tmp_path):
+    """
+    A test that makes sure that arrays built on memory-mapped files and shared memory write their results in place.
+
+    """
+    path=str(tmp_path/"data.bin")
+    x=DualArray.memmap(path,shape=(3,),layout="interleaved",mode="w+")
+    x[...]=DualArray([1.0,2.0,3.0],1.0)
+    del x
+    y=DualArray.memmap(path,layout="interleaved",mode="r")
+    assert np.all(y.real==[1,2,3]) and np.all(y.dual==1.0)
+    assert np.all(np.fromfile(path)==[1,1,2,1,3,1])
+    shm=shared_memory.SharedMemory(create=True,size=48)
+    try:
+        z=DualArray.from_buffer(shm.buf,shape=(3,))
+        z[...]=DualArray([1.0,2.0,3.0],[4.0,5.0,6.0]).square()
+        assert np.all(np.ndarray((6,),dtype=np.float64,buffer=shm.buf)==[1,4,9,8,20,36])
+        del z
+    finally:
+        shm.close()
+        shm.unlink()
+
+def test_structured(tmp_path):
+    """
+    A test that makes sure that arrays of dual numbers are converted to and from the structured dtype, which can be sorted and saved without pickle.
+
+    """
+    from dual_autodiff.dual_array import DUAL_DTYPE
+    duals=[Dual(2.0,1.0),Dual(1.0,3.0),Dual(2.0,-1.0)]
+    records=DualArray.from_duals(duals).to_structured()
+    assert records.dtype==DUAL_DTYPE and records.nbytes==48
+    records.sort()
+    x=DualArray.from_structured(records)
+    assert x.to_duals()==[Dual(1.0,3.0),Dual(2.0,-1.0),Dual(2.0,1.0)]
+    #The parts are views of the fields
+    x[0]=Dual(5.0,5.0)
+    assert records[0]["real"]==5.0
+    path=str(tmp_path/"duals.npy")
+    np.save(path,records[1:])
+    loaded=DualArray.from_structured(np.load(path,allow_pickle=False))
+    assert np.all(loaded.real==[2.0,2.0]) and np.all(loaded.dual==[-1.0,1.0])
+    #Other structured arrays are read by field name
+    other=np.zeros(2,dtype=[("dual","f4"),("real","f4")])
+    other["real"]=[1.0,2.0]
+    other["dual"]=[10.0,20.0]
+    x=DualArray.from_structured(other)
+    assert np.all(x.real==[1.0,2.0]) and np.all(x.dual==[10.0,20.0])
+    assert x.real.dtype==np.float64
+    extra=np.zeros(2,dtype=[("id","i8"),("real","f8"),("dual","f8")])
+    extra["real"]=[3.0,4.0]
+    extra["dual"]=[-1.0,-2.0]
+    x=DualArray.from_structured(extra)
+    assert np.all(x.real==[3.0,4.0]) and np.all(x.dual==[-1.0,-2.0])
+    with pytest.raises(TypeError):
+        DualArray.from_structured(np.zeros(2))
+
+def test_out():
+    """
+    A test that makes sure that the elementary functions write the same results into an output array, including the current instance.
+
+    """
+    x=DualArray([0.5,-0.7,0.3],[1.0,-2.0,0.5])
+    out=DualArray(np.zeros(3),np.zeros(3))
+    for name in ["sin","cos","tan","log","exp","square","floor","ceil","inverse","sqrt","cbrt","sinh","cosh","tanh",
+                 "arcsin","arccos","arctan","log1p","expm1","log2","log10","erf","sigmoid","softplus"]:
+        a=abs(x) if name in ("log","sqrt","log2","log10") else x
+        expected=getattr(a,name)()
+        assert getattr(a,name)(out=out) is out
+        assert np.allclose(out.real,expected.real) and np.allclose(out.dual,expected.dual)
+        y=DualArray(a.real,a.dual)
+        getattr(y,name)(out=y)
+        assert np.allclose(y.real,expected.real) and np.allclose(y.dual,expected.dual)
+    y=DualArray([[1.0],[2.0]],1.0)
+    out=DualArray(np.zeros((2,3)),0.0)
+    assert np.allclose(y.arctan2(x,out=out).dual,y.arctan2(x).dual)
+    assert np.allclose(y.hypot(x,out=out).dual,y.hypot(x).dual)
+    with pytest.raises(ValueError):
+        x.sin(out=y)
+    with pytest.raises(TypeError):
+        x.sin(out=np.zeros(3))
+
+def test_inplace_operators():
+    """
+    A test that makes sure that the in-place operators modify the arrays of the current instance and match the operators, also when the operand is the current instance.
+
+    """
+    from dual_autodiff.errors import error_policy
+    a=DualArray([1.0,2.0,4.0],[1.0,-1.0,0.5])
+    b=DualArray([2.0,0.5,-1.0],[0.0,3.0,1.0])
+    for operator,operands in (("add",(b,Dual(1.0,2.0),3.0,np.arange(3.0))),("sub",(b,2.0)),("mul",(b,Dual(2.0,1.0),-2.0)),
+                             ("truediv",(b,Dual(2.0,1.0),np.arange(1.0,4.0))),("pow",(2,Dual(2.0,0.5)))):
+        for operand in operands:
+            x=DualArray(a.real,a.dual)
+            real=x.real
+            y=getattr(x,"__i"+operator+"__")(operand)
+            expected=getattr(a,"__"+operator+"__")(operand)
+            assert y is x and x.real is real
+            assert np.allclose(x.real,expected.real) and np.allclose(x.dual,expected.dual)
+    x=DualArray(a.real,a.dual)
+    x*=x
+    assert np.allclose(x.real,(a*a).real) and np.allclose(x.dual,(a*a).dual)
+    x/=x
+    assert np.allclose(x.real,1.0) and np.allclose(x.dual,0.0)
+    #The constructor copies its arguments, which in-place operators do not modify
+    real=np.ones(3)
+    x=DualArray(real,0.0)
+    x+=1
+    assert np.all(real==1.0)
+    with pytest.raises(ValueError):
+        x+=np.ones((2,3))
+    with pytest.raises(ZeroDivisionError):
+        x/=np.zeros(3)
+    with error_policy("nan"):
+        x/=np.array([1.0,0.0,1.0])
+    assert np.all(x.failed==[False,True,False]) and np.isnan(x.real[1])
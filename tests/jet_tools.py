@@ -0,0 +1,124 @@
+# tests/jet_tools.py
+
+#Importing the libraries
+import pytest
+from dual_autodiff.dual import Dual
+from dual_autodiff.jet import Jet
+import numpy as np
+
+def test_init():
+    """
+    A test that makes sure that the Jet class initialises correctly, and handles invalid inputs.
+
+    """
+    x=Jet.variable(1.5,3)
+    assert x.order==3
+    assert x.real==1.5
+    assert np.all(x.coefficients==[1.5,1,0,0])
+    assert Jet([1,2]).coefficients.dtype==np.float64
+    #Make sure that initialisation with invalid coefficients or orders raises an error.
+    with pytest.raises(TypeError):
+        y=Jet(1.0)
+    with pytest.raises(TypeError):
+        y=Jet(["a","b"])
+    with pytest.raises(ValueError):
+        y=Jet.variable(1.0,0)
+
+def test_derivatives():
+    """
+    A test that makes sure that the derivatives of a composed function match the analytical derivatives.
+
+    """
+    x=Jet.variable(0.7,4)
+    s,c=np.sin(0.7),np.cos(0.7)
+    expected=np.exp(s)*np.array([1,c,c*c-s,c**3-3*s*c-c])
+    assert np.allclose(x.sin().exp().derivatives()[:4],expected)
+    assert np.isclose(x.sin().exp().derivative(2),expected[2])
+    #derivatives of x**2.5
+    assert np.allclose((x**2.5).derivatives(),[0.7**2.5,2.5*0.7**1.5,3.75*0.7**0.5,1.875*0.7**-0.5,-0.9375*0.7**-1.5])
+
+def test_identities():
+    """
+    A test that makes sure that the recurrences of the different functions agree with each other up to a high order.
+
+    """
+    x=Jet.variable(0.7,6)
+    one=np.r_[1.0,np.zeros(6)]
+    assert np.allclose(x.exp().log().coefficients,x.coefficients)
+    assert np.allclose(((x*x*x)**(1/3)).coefficients,x.coefficients)
+    assert np.allclose((x.tan()*x.cos()).coefficients,x.sin().coefficients)
+    assert np.allclose((x.sin().square()+x.cos().square()).coefficients,one)
+    assert np.allclose((x.inverse()*x).coefficients,one)
+    assert np.allclose(((x+1)**7).coefficients,((x+1)*(x+1)**6).coefficients)
+    assert np.allclose((x**-3).coefficients,(x*x*x).inverse().coefficients)
+
+def test_matches_dual():
+    """
+    A test that makes sure that a jet of order 1 gives the same value and derivative as the Dual class.
+
+    """
+    f=lambda u: ((u*u.exp()+u.tan()-u.inverse()).cos()//1.5+(3-u)%0.4+2/u-u**3).sin()+abs(-u).log()/(u+1)+u.floor()+u.ceil()
+    jet=f(Jet.variable(1.3,1))
+    dual=f(Dual(1.3,1.0))
+    assert np.isclose(jet.coefficients[0],dual.real)
+    assert np.isclose(jet.coefficients[1],dual.dual)
+    g=lambda u,v: u//v+u%v+2//u+3%u
+    jet=g(Jet.variable(1.3,1),Jet([0.7,0.5]))
+    dual=g(Dual(1.3,1.0),Dual(0.7,0.5))
+    assert np.allclose(jet.coefficients,[dual.real,dual.dual])
+
+def test_batch():
+    """
+    A test that makes sure that a jet of an array of points gives the derivatives at every point, and works with NumPy functions.
+
+    """
+    points=np.linspace(0.1,2,10)
+    x=Jet.variable(points,3)
+    f=np.sin(x)*np.array(2.0)+np.exp(x)
+    assert f.shape==(10,)
+    assert np.allclose(f.derivative(3),-2*np.cos(points)+np.exp(points))
+    assert np.allclose(f[3].coefficients,f.coefficients[:,3])
+
+def test_power_at_zero():
+    """
+    A test that makes sure that positive integer powers are exact when the first coefficient is zero.
+
+    """
+    x=Jet.variable(0.0,4)
+    assert np.allclose((x**3).derivatives(),[0,0,0,6,0])
+    assert np.allclose((x**0).coefficients,[1,0,0,0,0])
+    with pytest.raises(ZeroDivisionError):
+        y=x**0.5
+    with pytest.raises(ZeroDivisionError):
+        y=x**-1
+
+def test_comparisons():
+    """
+    A test that makes sure that jets are compared on their coefficients.
+
+    """
+    x=Jet.variable(0.5,2)
+    assert x==x
+    assert x!=0.5
+    assert Jet([2.0,0,0])==2
+    assert x<1
+    assert np.all(Jet.variable(np.ones(3),2)>=np.zeros(3))
+
+def test_invalid():
+    """
+    A test that makes sure that invalid operations raise the same errors as the Dual class.
+
+    """
+    x,y=Jet.variable(0.0,3),Jet.variable(2.0,3)
+    with pytest.raises(ZeroDivisionError):
+        z=y/x
+    with pytest.raises(ZeroDivisionError):
+        z=x.log()
+    with pytest.raises(ZeroDivisionError):
+        z=x.inverse()
+    with pytest.raises(ZeroDivisionError):
+        z=Jet.variable(np.pi/2,2).tan()
+    with pytest.raises(TypeError):
+        z=y**y
+    with pytest.raises(TypeError):
+        z=2**y
@@ -0,0 +1,74 @@
+# tests/memo_tools.py
+
+#Importing the libraries
+import pytest
+from dual_autodiff.dual import Dual
+from dual_autodiff.dual_array import DualArray
+from dual_autodiff.memo import memoize
+import numpy as np
+
+def test_cache_hits():
+    """
+    A test that makes sure that a memoized function is evaluated once per distinct dual number, and that the statistics count the hits and misses.
+
+    """
+    calls=[]
+    @memoize
+    def f(x):
+        calls.append(x)
+        return x.sin()*x
+    y=f(Dual(0.5,1.0))
+    assert f(Dual(0.5,1.0)) is y
+    f(Dual(0.5,2.0))
+    assert len(calls)==2
+    info=f.cache_info()
+    assert (info.hits,info.misses,info.currsize)==(1,2,2)
+    f.cache_clear()
+    assert f.cache_info()==(0,0,128,0)
+
+def test_arrays():
+    """
+    A test that makes sure that arrays of dual numbers and NumPy arrays are keyed on their values.
+
+    """
+    calls=[]
+    @memoize(maxsize=None)
+    def f(x,scale=1.0):
+        calls.append(x)
+        return x*scale
+    f(DualArray([1.0,2.0],1.0))
+    f(DualArray([1.0,2.0],1.0))
+    f(DualArray([1.0,2.0],0.0))
+    f(np.arange(3.0))
+    f(np.arange(3.0),scale=2.0)
+    f(np.arange(3.0),scale=2.0)
+    assert len(calls)==4
+
+def test_eviction_and_invalidation():
+    """
+    A test that makes sure that the least recently used entry is evicted, and that an entry can be invalidated.
+
+    """
+    @memoize(maxsize=2)
+    def f(x):
+        return x.exp()
+    a,b,c=Dual(1.0,1.0),Dual(2.0,1.0),Dual(3.0,1.0)
+    f(a)
+    f(b)
+    f(a)
+    f(c)
+    assert f.cache_info().currsize==2
+    f(a)
+    assert f.cache_info().hits==2
+    #b was the least recently used entry when c was added
+    f(b)
+    assert f.cache_info().misses==4
+    assert f.invalidate(b)
+    assert not f.invalidate(b)
+    #Make sure that a dual number modified in place gets a new entry
+    a+=1
+    f(a)
+    assert f.cache_info().misses==5
+    #Make sure that unhashable arguments raise a TypeError
+    with pytest.raises(TypeError):
+        f([1,2])
@@ -0,0 +1,78 @@
+# tests/multi_dual_tools.py
+
+#Importing the libraries
+import pytest
+from dual_autodiff.dual import Dual
+from dual_autodiff.multi_dual import MultiDual
+import numpy as np
+
+def test_init():
+    """
+    A test that makes sure that the MultiDual class initialises correctly, and handles invalid inputs.
+
+    """
+    x=MultiDual(1.5,[1,0])
+    assert x.real==1.5
+    assert x.dual.dtype==np.float64
+    assert np.all(x.dual==[1,0])
+    #Make sure that initialisation with non number parts raises a TypeError.
+    with pytest.raises(TypeError):
+        y=MultiDual("Real",[0])
+    with pytest.raises(TypeError):
+        y=MultiDual(1,[[0]])
+
+def test_variables():
+    """
+    A test that makes sure that variables() seeds the inputs with the rows of the identity matrix.
+
+    """
+    x,y,z=MultiDual.variables([1,2,3])
+    assert y.real==2
+    assert np.all(y.dual==[0,1,0])
+
+def test_gradient():
+    """
+    A test that makes sure that one forward pass gives the full gradient of a function of several inputs.
+
+    """
+    x,y,z=MultiDual.variables([0.5,2.0,3.0])
+    f=x.sin()*y+z.log()/x-y**2+2
+    expected=[np.cos(0.5)*2-np.log(3)/0.25,np.sin(0.5)-4,1/(3*0.5)]
+    assert np.isclose(f.real,np.sin(0.5)*2+np.log(3)/0.5-4+2)
+    assert np.allclose(f.gradient,expected)
+
+def test_matches_dual():
+    """
+    A test that makes sure that each component of the dual part matches the result of the Dual class seeded along the same direction.
+
+    """
+    a,b=MultiDual.variables([1.3,0.7])
+    f=lambda u,v: ((u*v).exp()+u.tan()-v.inverse()).cos()//1.5+u%v
+    result=f(a,b)
+    assert np.isclose(result.dual[0],f(Dual(1.3,1.0),Dual(0.7,0.0)).dual)
+    assert np.isclose(result.dual[1],f(Dual(1.3,0.0),Dual(0.7,1.0)).dual)
+
+def test_numpy_ufunc():
+    """
+    A test that makes sure that NumPy functions can be applied to multi-component dual numbers.
+
+    """
+    x,y=MultiDual.variables([1.0,2.0])
+    f=np.exp(x)*np.float64(3)-np.sin(y)
+    assert isinstance(f,MultiDual)
+    assert np.allclose(f.dual,[3*np.exp(1.0),-np.cos(2.0)])
+
+def test_invalid():
+    """
+    A test that makes sure that invalid operations raise the same errors as the Dual class.
+
+    """
+    x,y=MultiDual.variables([0.0,2.0])
+    with pytest.raises(ZeroDivisionError):
+        z=y/x
+    with pytest.raises(ZeroDivisionError):
+        z=x.log()
+    with pytest.raises(TypeError):
+        z=y**x
+    with pytest.raises(TypeError):
+        z=2**x
@@ -0,0 +1,141 @@
+# tests/parallel_tools.py
+
+#Importing the libraries
+import pickle
+import pytest
+from dual_autodiff.dual import Dual
+from dual_autodiff.dual_array import DualArray
+from dual_autodiff.parallel import parallel_derivative, threaded_derivative
+from dual_autodiff.compiler import compile
+from dual_autodiff.errors import error_policy, error_counts, reset_error_counts
+import numpy as np
+
+def f1(x):
+    """
+    The function of the tutorial notebook.
+    """
+    return (x.cos()).sin()+x.log()
+
+def constant(x):
+    """
+    A function that does not depend on its input.
+    """
+    return 2.0
+
+def test_pickle():
+    """
+    A test that makes sure that dual numbers are pickled with their two parts.
+
+    """
+    x=Dual(1.5,-2.0)
+    y=pickle.loads(pickle.dumps(x))
+    assert type(y) is Dual
+    assert y.real==1.5 and y.dual==-2.0
+
+def test_matches_serial():
+    """
+    A test that makes sure that the values and derivatives computed by the workers are those of Dual, in the order of the points.
+
+    """
+    points=np.linspace(0.5,5.0,101)
+    values,derivatives=parallel_derivative(f1,points,workers=2,chunk_size=10)
+    expected=[f1(Dual(float(p),1.0)) for p in points]
+    assert np.allclose(values,[e.real for e in expected])
+    assert np.allclose(derivatives,[e.dual for e in expected])
+    serial=parallel_derivative(f1,points,workers=1,seed=2.0)
+    assert np.allclose(serial[1],2*derivatives)
+
+def test_constant_and_invalid():
+    """
+    A test that makes sure that constant outputs have a zero derivative, and that invalid numbers of workers raise a ValueError.
+
+    """
+    values,derivatives=parallel_derivative(constant,[1.0,2.0,3.0],workers=2)
+    assert np.all(values==2.0) and np.all(derivatives==0.0)
+    with pytest.raises(ValueError):
+        parallel_derivative(f1,[1.0],workers=0)
+
+def test_threaded():
+    """
+    A test that makes sure that the threads compute the values and derivatives of DualArray, with DualArray functions and compiled functions.
+
+    """
+    points=np.linspace(0.5,5.0,1001)
+    expected=f1(DualArray(points,1.0))
+    for g in (f1,compile(f1)):
+        values,derivatives=threaded_derivative(g,points,threads=3,chunk_size=100)
+        assert np.allclose(values,expected.real)
+        assert np.allclose(derivatives,expected.dual)
+    values,derivatives=threaded_derivative(f1,points,threads=1,seed=2.0)
+    assert np.allclose(derivatives,2*expected.dual)
+    values,derivatives=threaded_derivative(constant,[1.0,2.0],threads=2,chunk_size=1)
+    assert np.all(values==2.0) and np.all(derivatives==0.0)
+    with pytest.raises(ValueError):
+        threaded_derivative(f1,[1.0],chunk_size=0)
+
+def test_threaded_error_counts():
+    """
+    A test that makes sure that the domain errors of all the threads are counted under the "count" error policy.
+
+    """
+    reset_error_counts()
+    points=np.tile([0.0,1.0],500)
+    with error_policy("count"):
+        values,derivatives=threaded_derivative(lambda x: x.log(),points,threads=4,chunk_size=10)
+    assert sum(error_counts().values())==500
+    assert np.isnan(values[::2]).all() and np.allclose(values[1::2],0.0)
+    reset_error_counts()
+
+def reciprocal(x):
+    """
+    A function with a domain error at zero.
+    """
+    return 1/x
+
+def test_worker_error_policy():
+    """
+    A test that makes sure that worker processes started with spawn apply the error policy of the caller, and that their error counts are added to those of the caller.
+
+    """
+    import multiprocessing
+    context=multiprocessing.get_context("spawn")
+    points=[0.0,1.0,0.0,2.0]
+    reset_error_counts()
+    with error_policy("count"):
+        values,derivatives=parallel_derivative(reciprocal,points,workers=2,chunk_size=1,mp_context=context)
+    assert np.isnan(values[[0,2]]).all() and np.allclose(values[[1,3]],[1.0,0.5])
+    assert sum(error_counts().values())==2
+    reset_error_counts()
+    with pytest.raises(ZeroDivisionError):
+        parallel_derivative(reciprocal,points,workers=2,chunk_size=1,mp_context=context)
+
+def test_thread_error_policy():
+    """
+    A test that makes sure that the error policy of a thread does not change the policy of the other threads, and that the threads of threaded_derivative use the policy of the caller.
+
+    """
+    import threading
+    inside=threading.Event()
+    done=threading.Event()
+    results=[]
+
+    def nan_thread():
+        with error_policy("nan"):
+            inside.set()
+            done.wait(5)
+            results.append(Dual(0.0,1.0).inverse())
+
+    thread=threading.Thread(target=nan_thread)
+    thread.start()
+    try:
+        assert inside.wait(5)
+        #The policy of the other thread is "nan" while this division runs
+        with pytest.raises(ZeroDivisionError):
+            1/Dual(0.0,1.0)
+    finally:
+        done.set()
+        thread.join()
+    assert np.isnan(results[0].real)
+    with error_policy("nan"):
+        values,derivatives=threaded_derivative(lambda x: 1/x,[0.0,1.0,0.0,2.0],threads=2,chunk_size=1)
+    assert np.isnan(values[[0,2]]).all() and np.allclose(derivatives[[1,3]],[-1.0,-0.25])
@@ -0,0 +1,95 @@
+# tests/reverse_tools.py
+
+#Importing the libraries
+import pytest
+from dual_autodiff.dual import Dual
+from dual_autodiff.reverse import Tape, gradient
+import numpy as np
+
+def f(x,y,z):
+    """
+    A function using every primitive recorded by the tape.
+    """
+    return (x*y).sin()+(z/x).cos()-y.log()*x.exp()+(x**3).tan()/z+y.square()-2/z+z.inverse()
+
+def test_gradient_matches_dual():
+    """
+    A test that makes sure that the reverse-mode gradient matches forward-mode differentiation with the Dual class.
+
+    """
+    point=[0.7,1.3,2.1]
+    value,grad=gradient(f,point)
+    for i in range(3):
+        seeds=[Dual(p,1.0 if i==j else 0.0) for j,p in enumerate(point)]
+        result=f(*seeds)
+        assert np.isclose(value,result.real)
+        assert np.isclose(grad[i],result.dual)
+
+def test_shared_subexpressions():
+    """
+    A test that makes sure that adjoints are accumulated when a variable is used several times.
+
+    """
+    tape=Tape()
+    x,y=tape.variables([3.0,4.0])
+    z=x*x+x*y-y
+    assert np.allclose(tape.gradient(z),[2*3+4,3-1])
+    #the derivative with respect to an intermediate variable
+    u=x*y
+    w=u*u
+    assert np.allclose(tape.gradient(w,[u,x]),[2*12,2*12*4])
+
+def test_constant_output():
+    """
+    A test that makes sure that the gradient of an output that does not depend on the inputs is zero.
+
+    """
+    value,grad=gradient(lambda x,y: 5.0,[1.0,2.0])
+    assert value==5.0
+    assert np.all(grad==0)
+
+def test_invalid():
+    """
+    A test that makes sure that invalid operations raise the same errors as the Dual class.
+
+    """
+    tape=Tape()
+    x,y=tape.variables([0.0,2.0])
+    with pytest.raises(ZeroDivisionError):
+        z=y/x
+    with pytest.raises(ZeroDivisionError):
+        z=x.log()
+    with pytest.raises(TypeError):
+        z=y**x
+    #Make sure that variables of different tapes cannot be combined
+    with pytest.raises(ValueError):
+        z=y+Tape().variable(1.0)
+
+def test_power_and_overflow():
+    """
+    A test that makes sure that powers and exponentials give the values and derivatives of the Dual class, including NaN and inf.
+
+    """
+    for value in (-2.0,0.0,1.5):
+        for power in (3,2.5,1,-2):
+            try:
+                with np.errstate(invalid="ignore"):
+                    expected=Dual(value,1.0)**power
+            except ZeroDivisionError:
+                with pytest.raises(ZeroDivisionError):
+                    gradient(lambda x: x**power,[value])
+                continue
+            with np.errstate(invalid="ignore"):
+                result,derivative=gradient(lambda x: x**power,[value])
+            assert np.allclose([result,derivative[0]],[expected.real,expected.dual],equal_nan=True)
+    #A negative value raised to a non integer power is NaN, as with Dual
+    with np.errstate(invalid="ignore"):
+        result,derivative=gradient(lambda x: x**0.5,[-2.0])
+    assert np.isnan(result) and np.isnan(derivative[0])
+    with pytest.raises(ZeroDivisionError):
+        gradient(lambda x: x**0.5,[0.0])
+    #The exponential overflows to inf
+    with np.errstate(over="ignore"):
+        result,derivative=gradient(lambda x: x.exp(),[1000.0])
+        expected=Dual(1000.0,1.0).exp()
+    assert result==expected.real==np.inf and derivative[0]==np.inf
@@ -0,0 +1,82 @@
+# tests/service_tools.py
+
+#Importing the libraries
+import asyncio
+import pytest
+from dual_autodiff.dual import Dual
+from dual_autodiff.errors import error_policy
+from dual_autodiff.service import DerivativeService
+import numpy as np
+
+def f1(x):
+    """
+    The function of the tutorial notebook.
+    """
+    return (x.cos()).sin()+x.log()
+
+def test_batching():
+    """
+    A test that makes sure that concurrent requests are evaluated in batches of at most max_batch points, with the derivatives of Dual.
+
+    """
+    points=np.linspace(0.5,5.0,25).tolist()
+    async def main():
+        service=DerivativeService(f1,max_batch=10,max_delay=0.01)
+        results=await asyncio.gather(*(service.derivative(x) for x in points))
+        return service,results
+    service,results=asyncio.run(main())
+    assert (service.batches,service.requests)==(3,25)
+    for x,(value,derivative) in zip(points,results):
+        expected=f1(Dual(x,1.0))
+        assert np.isclose(value,expected.real) and np.isclose(derivative,expected.dual)
+
+def test_delay_and_context():
+    """
+    A test that makes sure that a batch that does not fill is evaluated after the delay, and that the context manager flushes the open batch.
+
+    """
+    async def main():
+        async with DerivativeService(f1,max_batch=100,max_delay=0.001,seed=2.0) as service:
+            value,derivative=await service.derivative(1.0)
+            task=asyncio.ensure_future(service.derivative(2.0))
+            await asyncio.sleep(0)
+        return service,derivative,await task
+    service,derivative,late=asyncio.run(main())
+    assert np.isclose(derivative,f1(Dual(1.0,2.0)).dual)
+    assert np.isclose(late[1],f1(Dual(2.0,2.0)).dual)
+    assert service.batches==2
+    with pytest.raises(ValueError):
+        DerivativeService(f1,max_batch=0)
+
+def test_errors():
+    """
+    A test that makes sure that only the requests outside of the domain get the exception under the "raise" policy, and NaN under the "nan" policy.
+
+    """
+    async def main():
+        service=DerivativeService(lambda x: x.log())
+        return await asyncio.gather(service.derivative(0.0),service.derivative(2.0),return_exceptions=True)
+    bad,good=asyncio.run(main())
+    assert isinstance(bad,ZeroDivisionError)
+    assert good==(np.log(2.0),0.5)
+    with error_policy("nan"):
+        bad,good=asyncio.run(main())
+    assert np.isnan(bad[0]) and good[1]==0.5
+
+def test_request_error_policies():
+    """
+    A test that makes sure that the requests of one batch are evaluated under the error policy of the task that made them.
+
+    """
+    async def request(service,x,policy):
+        with error_policy(policy):
+            return await service.derivative(x)
+    async def main():
+        service=DerivativeService(lambda x: x.log(),max_delay=0.01)
+        results=await asyncio.gather(request(service,0.0,"raise"),request(service,0.0,"nan"),request(service,1.0,"raise"),return_exceptions=True)
+        return service,results
+    service,(raised,nan,good)=asyncio.run(main())
+    assert service.batches==1
+    assert isinstance(raised,ZeroDivisionError)
+    assert np.isnan(nan[0]) and np.isnan(nan[1])
+    assert good==(0.0,1.0)
@@ -0,0 +1,101 @@
+# tests/sparse_tools.py
+
+#Importing the libraries
+import pytest
+from dual_autodiff.dual_array import DualArray
+from dual_autodiff.sparse import sparse_jacobian, sparsity_pattern, color_columns, CSRMatrix
+import numpy as np
+
+def residual(x):
+    """
+    A residual function with a tridiagonal Jacobian.
+    """
+    inner=x[:-2]-2*x[1:-1]+x[2:]+np.sin(x[1:-1])*x[1:-1]
+    return np.concatenate([x[:1].square()-1.0,inner,x[-1:].exp()])
+
+def dense_jacobian(f,x):
+    """
+    Computes the Jacobian with one forward pass per column, to check the sparse results.
+    """
+    return np.array([f(DualArray(x,e)).dual for e in np.eye(len(x))]).T
+
+def test_pattern():
+    """
+    A test that makes sure that the detected sparsity pattern is the tridiagonal pattern of the residual function.
+
+    """
+    pattern=sparsity_pattern(residual,np.ones(6))
+    expected=np.eye(6,k=-1)+np.eye(6)+np.eye(6,k=1)
+    expected[0,1]=expected[-1,-2]=0
+    assert np.all(pattern.toarray()==expected)
+    #reductions depend on all the inputs they sum
+    pattern=sparsity_pattern(lambda x: np.sum(x[:3])*x,np.ones(4))
+    assert pattern.nnz==13
+    #functions of one argument keep the pattern, and arctan2 and hypot combine the patterns of their arguments
+    pattern=sparsity_pattern(lambda x: x.sqrt(),np.ones(3))
+    assert np.all(pattern.toarray()==np.eye(3))
+    pattern=sparsity_pattern(lambda x: x[:2].tanh().arctan2(x[1:].sigmoid()).hypot(2.0),np.ones(3))
+    assert np.all(pattern.toarray()==[[1,1,0],[0,1,1]])
+
+def test_coloring():
+    """
+    A test that makes sure that columns sharing a row get different colors, and that a tridiagonal pattern needs three colors.
+
+    """
+    pattern=sparsity_pattern(residual,np.ones(50))
+    colors=color_columns(pattern)
+    assert colors.max()+1==3
+    rows,cols=pattern.nonzero()
+    for i in range(50):
+        assert len(set(colors[cols[rows==i]]))==np.sum(rows==i)
+
+def test_sparse_jacobian():
+    """
+    A test that makes sure that the compressed passes give the same Jacobian as one pass per column.
+
+    """
+    x=np.linspace(0.1,1,20)
+    J=sparse_jacobian(residual,x)
+    assert isinstance(J,CSRMatrix)
+    assert J.shape==(20,20)
+    assert np.allclose(J.toarray(),dense_jacobian(residual,x))
+    #the pattern can be given as a dense array
+    pattern=np.abs(dense_jacobian(residual,x))>0
+    assert np.allclose(sparse_jacobian(residual,x,sparsity=pattern).toarray(),J.toarray())
+
+def test_to_scipy():
+    """
+    A test that makes sure that the result can be converted into a SciPy sparse matrix when scipy is installed.
+
+    """
+    scipy_sparse=pytest.importorskip("scipy.sparse")
+    x=np.linspace(0.1,1,10)
+    J=sparse_jacobian(residual,x)
+    assert np.allclose(J.to_scipy().toarray(),J.toarray())
+    assert np.allclose(sparse_jacobian(residual,x,sparsity=J.to_scipy()).toarray(),J.toarray())
+
+def test_invalid():
+    """
+    A test that makes sure that functions branching on their inputs cannot be traced.
+
+    """
+    with pytest.raises(TypeError):
+        sparsity_pattern(lambda x: x if x[0]>0 else -x,np.ones(3))
+    #NumPy functions that are not supported raise a TypeError
+    with pytest.raises(TypeError):
+        sparsity_pattern(lambda x: np.cumsum(x),np.ones(3))
+
+def test_dot():
+    """
+    A test that makes sure that the products with np.dot have the pattern of the constant matrix, and give the same Jacobian as the dense computation.
+
+    """
+    A=np.eye(5,k=-1)+2*np.eye(5)-np.eye(5,k=1)
+    x=np.linspace(0.5,1.5,5)
+    f=lambda x: np.dot(A,x.sin())
+    assert np.all(sparsity_pattern(f,x).toarray()==(A!=0))
+    J=sparse_jacobian(f,x)
+    assert np.allclose(J.toarray(),dense_jacobian(f,x))
+    assert np.all(sparsity_pattern(lambda x: np.dot(x,A),x).toarray()==(A.T!=0))
+    #the dot product of two vectors of inputs depends on all of them
+    assert sparsity_pattern(lambda x: np.dot(x[:2],x[3:])*x[2:3],x).nnz==5
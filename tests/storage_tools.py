@@ -0,0 +1,74 @@
+# tests/storage_tools.py
+
+#Importing the libraries
+import pickle
+import pytest
+from dual_autodiff.dual import Dual
+from dual_autodiff.dual_array import DualArray
+from dual_autodiff.storage import save_duals, load_duals, DualWriter, DualReader
+from dual_autodiff.streaming import reduce_derivative
+import numpy as np
+
+def test_round_trip(tmp_path):
+    """
+    A test that makes sure that datasets are loaded with the values they were saved with, chunked or not, compressed or not, and memory-mapped.
+
+    """
+    x=DualArray(np.linspace(0.5,5.0,1001),np.arange(1001.0))
+    for options in ({},{"chunk_size":100},{"chunk_size":100,"compress":True},{"compress":True,"level":1}):
+        path=str(tmp_path/"data.dual")
+        save_duals(path,x,**options)
+        y=load_duals(path)
+        assert np.array_equal(y.real,x.real) and np.array_equal(y.dual,x.dual)
+    save_duals(path,x)
+    y=load_duals(path,mmap_mode="r")
+    #The planes are read-only views of the file
+    assert not y.real.flags.writeable and not y.real.flags.owndata
+    assert np.array_equal(y.real,x.real) and np.array_equal(y.dual,x.dual)
+    #A dataset of Dual instances, and an empty one
+    save_duals(path,[Dual(1.0,2.0),Dual(3.0,4.0)])
+    assert load_duals(path).to_duals()==[Dual(1.0,2.0),Dual(3.0,4.0)]
+    save_duals(path,[])
+    assert len(load_duals(path).real)==0
+
+def test_streaming(tmp_path):
+    """
+    A test that makes sure that chunks are written and read one at a time, and can be streamed into reduce_derivative.
+
+    """
+    path=str(tmp_path/"data.dual")
+    with DualWriter(path,compress=True) as writer:
+        for start in range(0,30,10):
+            writer.write(DualArray(np.arange(start,start+10.0)+1.0,1.0))
+        assert writer.count==30
+    with pytest.raises(ValueError):
+        writer.write(Dual(1.0,1.0))
+    with DualReader(path) as reader:
+        assert len(reader)==30 and list(reader.counts)==[10,10,10]
+        assert reader.read_chunk(2).real[0]==21.0
+        statistics=reduce_derivative(lambda x: x.log(),reader)
+    assert np.isclose(statistics.derivative_sum,np.sum(1/np.arange(1.0,31.0)))
+    with DualReader(path) as reader:
+        assert np.array_equal(reader.read().real,np.arange(1.0,31.0))
+
+def test_invalid_files(tmp_path):
+    """
+    A test that makes sure that files that are not complete datasets, and memory-mapped compressed datasets, raise a ValueError.
+
+    """
+    path=tmp_path/"data.dual"
+    path.write_bytes(b"not a dataset")
+    with pytest.raises(ValueError):
+        load_duals(str(path))
+    writer=DualWriter(str(path))
+    writer.write(Dual(1.0,1.0))
+    #The index is only written when the writer is closed
+    with pytest.raises(ValueError):
+        load_duals(str(path))
+    writer.close()
+    assert load_duals(str(path))[0]==Dual(1.0,1.0)
+    save_duals(str(path),[Dual(1.0,1.0)],compress=True)
+    with pytest.raises(ValueError):
+        load_duals(str(path),mmap_mode="r")
+    with pytest.raises(ValueError):
+        save_duals(str(path),[Dual(1.0,1.0)],chunk_size=0)
@@ -0,0 +1,72 @@
+# tests/streaming_tools.py
+
+#Importing the libraries
+import pytest
+from dual_autodiff.dual import Dual
+from dual_autodiff.dual_array import DualArray
+from dual_autodiff.compiler import compile
+from dual_autodiff.errors import error_policy
+from dual_autodiff.streaming import stream_derivative, reduce_derivative, StreamStatistics
+import numpy as np
+
+def f1(x):
+    """
+    The function of the tutorial notebook.
+    """
+    return (x.cos()).sin()+x.log()
+
+def test_chunks():
+    """
+    A test that makes sure that each kind of chunk is evaluated lazily, with the values and derivatives of DualArray.
+
+    """
+    read=[]
+    def chunks():
+        for chunk in ([0.5,1.0],np.array([[2.0],[3.0]]),[Dual(4.0,2.0),5.0],DualArray([6.0],0.0)):
+            read.append(chunk)
+            yield chunk
+    stream=stream_derivative(f1,chunks())
+    assert read==[]
+    values,derivatives=next(stream)
+    assert len(read)==1
+    expected=f1(DualArray([0.5,1.0],1.0))
+    assert np.allclose(values,expected.real) and np.allclose(derivatives,expected.dual)
+    values,derivatives=next(stream)
+    assert values.shape==(2,1)
+    values,derivatives=next(stream)
+    assert np.isclose(derivatives[0],f1(Dual(4.0,2.0)).dual) and np.isclose(derivatives[1],f1(Dual(5.0,1.0)).dual)
+    values,derivatives=next(stream)
+    assert derivatives[0]==0.0
+    with pytest.raises(StopIteration):
+        next(stream)
+
+def test_flat_stream_and_reductions():
+    """
+    A test that makes sure that a flat stream of points is grouped into chunks, and that the running reductions match the full derivative.
+
+    """
+    points=np.linspace(0.5,5.0,1001)
+    expected=f1(DualArray(points,1.0)).dual
+    sizes=[len(v) for v,d in stream_derivative(f1,iter(points.tolist()),chunk_size=300)]
+    assert sizes==[300,300,300,101]
+    for g in (f1,compile(f1)):
+        statistics=reduce_derivative(g,iter(points),chunk_size=64)
+        assert statistics.count==1001 and statistics.failed==0
+        assert np.isclose(statistics.derivative_sum,expected.sum())
+        assert np.isclose(statistics.max_abs_derivative,np.abs(expected).max())
+    constant=reduce_derivative(lambda x: 2.0,[[1.0,2.0]])
+    assert constant.count==2 and constant.derivative_sum==0.0
+    with pytest.raises(ValueError):
+        stream_derivative(f1,[1.0],chunk_size=0)
+
+def test_failed_points():
+    """
+    A test that makes sure that the points outside of the domain are counted as failed and left out of the reductions.
+
+    """
+    statistics=StreamStatistics()
+    with error_policy("nan"):
+        results=list(stream_derivative(lambda x: x.log(),[[0.0,1.0],[2.0]],statistics=statistics))
+    assert np.isnan(results[0][1][0])
+    assert (statistics.count,statistics.failed)==(3,1)
+    assert statistics.derivative_sum==1.5 and statistics.max_abs_derivative==1.0